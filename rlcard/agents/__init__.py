@@ -1,11 +1,8 @@
-import subprocess
-import sys
+from importlib.util import find_spec
 from packaging import version
 
-reqs = subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
-installed_packages = [r.decode().split('==')[0] for r in reqs.split()]
-
-if 'tensorflow' in installed_packages:
+# Check whether the frameworks are installed without importing them
+if find_spec('tensorflow') is not None:
     import tensorflow as tf
     if version.parse(tf.__version__) < version.parse('1.14.0') \
             or version.parse(tf.__version__) >= version.parse('2.0.0'):
@@ -13,12 +10,13 @@ if 'tensorflow' in installed_packages:
     from rlcard.agents.deep_cfr_agent import DeepCFR
     from rlcard.agents.dqn_agent import DQNAgent
     from rlcard.agents.nfsp_agent import NFSPAgent
-if 'torch' in installed_packages:
+if find_spec('torch') is not None:
     from rlcard.agents.dqn_agent_pytorch import DQNAgent as DQNAgentPytorch
     from rlcard.agents.nfsp_agent_pytorch import NFSPAgent as NFSPAgentPytorch
 
 from rlcard.agents.cfr_agent import CFRAgent
 from rlcard.agents.cfrplus_agent import CFRPlusAgent
+from rlcard.agents.mccfr_agent import MCCFRAgent
 from rlcard.agents.limit_holdem_human_agent import HumanAgent as LimitholdemHumanAgent
 from rlcard.agents.nolimit_holdem_human_agent import HumanAgent as NolimitholdemHumanAgent
 from rlcard.agents.leduc_holdem_human_agent import HumanAgent as LeducholdemHumanAgent
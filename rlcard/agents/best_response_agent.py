@@ -2,35 +2,54 @@ import numpy as np
 import collections
 
 import os
-import pickle
 
 from rlcard.utils.utils import *
+from rlcard.utils.infoset_table import InfosetTable
+from rlcard.utils.checkpoint import CHECKPOINT_FILE, save_table, load_table
 
 class BRAgent():
     ''' Implement CFR algorithm
     '''
 
-    def __init__(self, env, policy):
+    def __init__(self, env, policy, model_path='./br_model'):
         ''' Initilize Agent
 
         Args:
             env (Env): Env class
+            policy (Agent): The agent to best respond to
+            model_path (string): The directory of the model
         '''
         self.use_raw = False
         self.env = env
+        self.model_path = model_path
         self._num_of_player = env.player_num
         if self._num_of_player > 2:
             raise "Best Response only for Two-player games"
 
         # A policy is a dict state_str -> action probabilities
         self.opponent_policy = policy
-        self.average_policy = collections.defaultdict(np.array)
 
-        # Regret is a dict state_str -> action regrets
-        self.regrets = collections.defaultdict(np.array)
+        # The average policy and the regrets of each state_str are rows of
+        # a table, exposed as dicts state_str -> numpy.array
+        self.table = InfosetTable(self.env.action_num, self.table_fields())
+        self.bind_table()
 
         self.iteration = 0
 
+    def table_fields(self):
+        ''' The fields of the table and the initial values of their rows
+
+        Returns:
+            (dict): No average policy nor regret
+        '''
+        return {'average_policy': 0.0, 'regrets': 0.0}
+
+    def bind_table(self):
+        ''' Expose the fields of the table as dicts state_str -> numpy.array
+        '''
+        self.average_policy = self.table.view('average_policy')
+        self.regrets = self.table.view('regrets')
+
     def traverse_tree(self, probs, player_id):
         ''' Traverse the game tree, get information set
 
@@ -56,9 +75,9 @@ class BRAgent():
             new_probs[current_player] *= action_prob
 
             # Keep traversing the child state
-            self.env.step(action)
+            self.env.step(action, observe=False)
             utility = self.traverse_tree(new_probs, player_id)
-            self.env.step_back()
+            self.env.step_back(observe=False)
 
         # If it is current player, we record the policy and compute regret
         player_prob = probs[current_player]
@@ -98,12 +117,12 @@ class BRAgent():
         curr_state = self.env.get_state(current_player)
         action_probs = self.action_probs(curr_state, self.opponent_policy)
         for act in legal_actions:
-            self.env.step(act)
+            self.env.step(act, observe=False)
             q_val_out = q_value.copy()
             curr_qval = np.array(self.get_q_value(act, q_value))
             q_val_out += curr_qval * action_probs[act]
             #q_value += self.get_q_value(act, q_value)
-            self.env.step_back()
+            self.env.step_back(observe=False)
         return q_val_out
 
     def best_response_action(self, this_player, obs):
@@ -115,9 +134,9 @@ class BRAgent():
             cf_p = each[1]
             q_value = [0.0, 0.0]
             for a in legal_act:
-                self.env.step(a)
+                self.env.step(a, observe=False)
                 q_value = self.get_q_value(a, q_value)
-                self.env.step_back()
+                self.env.step_back(observe=False)
                 tmp_q = cf_p * q_value[this_player]
                 if tmp_q > max_value:
                     max_value = tmp_q
@@ -181,47 +200,28 @@ class BRAgent():
         state = self.env.get_state(player_id)
         return state['obs'].tostring(), state['legal_actions']
 
-    def save(self):
-        ''' Save model
-        '''
-        if not os.path.exists(self.model_path):
-            os.makedirs(self.model_path)
-
-        policy_file = open(os.path.join(self.model_path, 'policy.pkl'),'wb')
-        pickle.dump(self.policy, policy_file)
-        policy_file.close()
-
-        average_policy_file = open(os.path.join(self.model_path, 'average_policy.pkl'),'wb')
-        pickle.dump(self.average_policy, average_policy_file)
-        average_policy_file.close()
+    def save(self, incremental=False):
+        ''' Save model to a single checkpoint file in the model directory
 
-        regrets_file = open(os.path.join(self.model_path, 'regrets.pkl'),'wb')
-        pickle.dump(self.regrets, regrets_file)
-        regrets_file.close()
-
-        iteration_file = open(os.path.join(self.model_path, 'iteration.pkl'),'wb')
-        pickle.dump(self.iteration, iteration_file)
-        iteration_file.close()
+        Args:
+            incremental (boolean): If True, only the information sets that
+              changed since the previous save or load are appended to the
+              checkpoint. See `rlcard.utils.checkpoint`
+        '''
+        save_table(os.path.join(self.model_path, CHECKPOINT_FILE), self.table,
+                   meta={'iteration': self.iteration}, incremental=incremental)
 
-    def load(self):
+    def load(self, mmap_mode=None):
         ''' Load model
+
+        Args:
+            mmap_mode (string): If not None, the table is memory-mapped
+              with this mode, e.g., 'r'
         '''
-        if not os.path.exists(self.model_path):
+        checkpoint_path = os.path.join(self.model_path, CHECKPOINT_FILE)
+        if not os.path.exists(checkpoint_path):
             return
 
-        policy_file = open(os.path.join(self.model_path, 'policy.pkl'),'rb')
-        self.policy = pickle.load(policy_file)
-        policy_file.close()
-
-        average_policy_file = open(os.path.join(self.model_path, 'average_policy.pkl'),'rb')
-        self.average_policy = pickle.load(average_policy_file)
-        average_policy_file.close()
-
-        regrets_file = open(os.path.join(self.model_path, 'regrets.pkl'),'rb')
-        self.regrets = pickle.load(regrets_file)
-        regrets_file.close()
-
-        iteration_file = open(os.path.join(self.model_path, 'iteration.pkl'),'rb')
-        self.iteration = pickle.load(iteration_file)
-        iteration_file.close()
-
+        self.table, meta = load_table(checkpoint_path, self.table_fields(), mmap_mode=mmap_mode)
+        self.bind_table()
+        self.iteration = meta['iteration']
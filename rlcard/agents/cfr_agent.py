@@ -5,6 +5,9 @@ import os
 import pickle
 
 from rlcard.utils.utils import *
+from rlcard.utils.infoset_table import InfosetTable, KEYS_FILE
+from rlcard.utils.regret_matching import regret_matching
+from rlcard.utils.checkpoint import CHECKPOINT_FILE, save_table, load_table
 
 class CFRAgent():
     ''' Implement CFR algorithm
@@ -20,19 +23,43 @@ class CFRAgent():
         self.env = env
         self.model_path = model_path
 
-        # A policy is a dict state_str -> action probabilities
-        self.policy = collections.defaultdict(list)
-        self.average_policy = collections.defaultdict(np.array)
-
-        # Regret is a dict state_str -> action regrets
-        self.regrets = collections.defaultdict(np.array)
+        # The policy, the average policy and the regrets of each state_str
+        # are rows of dense arrays indexed by the ids of the table
+        self.table = InfosetTable(self.env.action_num, self.table_fields())
+        self.bind_table()
 
         self.iteration = 0
 
+    def table_fields(self):
+        ''' The fields of the table and the initial values of their rows
+
+        Returns:
+            (dict): The uniform policy, no regret nor average policy, and
+              no legal action until the state is visited
+        '''
+        return {'policy': 1.0 / self.env.action_num, 'average_policy': 0.0, 'regrets': 0.0, 'legal': False}
+
+    def bind_table(self):
+        ''' Expose the fields of the table as dicts state_str -> numpy.array
+            for compatibility, e.g., `self.regrets[obs]`
+        '''
+        self.policy = self.table.view('policy')
+        self.average_policy = self.table.view('average_policy')
+        self.regrets = self.table.view('regrets')
+
     def train(self):
         ''' Do one iteration of CFR
         '''
         self.iteration += 1
+        self.traverse_players()
+
+        # Update policy
+        self.update_policy()
+
+    def traverse_players(self):
+        ''' Do the traversals of one iteration, which update the regrets and
+            the average policy but not the policy
+        '''
         # Firstly, traverse tree to compute counterfactual regret for each player
         # The regrets are recorded in traversal
         for player_id in range(self.env.player_num):
@@ -40,9 +67,6 @@ class CFRAgent():
             probs = np.ones(self.env.player_num)
             self.traverse_tree(probs, player_id)
 
-        # Update policy
-        self.update_policy()
-
     def traverse_tree(self, probs, player_id):
         ''' Traverse the game tree, update the regrets
 
@@ -61,7 +85,8 @@ class CFRAgent():
         action_utilities = {}
         state_utility = np.zeros(self.env.player_num)
         obs, legal_actions = self.get_state(current_player)
-        action_probs = self.action_probs(obs, legal_actions, self.policy)
+        infoset = self.table.get_id(obs)
+        action_probs = remove_illegal(self.table.arrays['policy'][infoset], legal_actions)
 
         for action in legal_actions:
             action_prob = action_probs[action]
@@ -69,9 +94,9 @@ class CFRAgent():
             new_probs[current_player] *= action_prob
 
             # Keep traversing the child state
-            self.env.step(action)
+            self.env.step(action, observe=False)
             utility = self.traverse_tree(new_probs, player_id)
-            self.env.step_back()
+            self.env.step_back(observe=False)
 
             state_utility += action_prob * utility
             action_utilities[action] = utility
@@ -79,29 +104,38 @@ class CFRAgent():
         if not current_player == player_id:
             return state_utility
 
-        # If it is current player, we record the policy and compute regret
+        # If it is current player, we record the policy and compute regret.
+        # The arrays are looked up after the traversal since it may grow them
         player_prob = probs[current_player]
         counterfactual_prob = (np.prod(probs[:current_player]) *
                                 np.prod(probs[current_player + 1:]))
         player_state_utility = state_utility[current_player]
-
-        if obs not in self.regrets:
-            self.regrets[obs] = np.zeros(self.env.action_num)
-        if obs not in self.average_policy:
-            self.average_policy[obs] = np.zeros(self.env.action_num)
+        regrets = self.table.arrays['regrets'][infoset]
+        average_policy = self.table.arrays['average_policy'][infoset]
+        strategy_weight = self.strategy_weight()
+        self.table.arrays['legal'][infoset, legal_actions] = True
         for action in legal_actions:
             action_prob = action_probs[action]
             regret = counterfactual_prob * (action_utilities[action][current_player]
                     - player_state_utility)
-            self.regrets[obs][action] += regret
-            self.average_policy[obs][action] += self.iteration * player_prob * action_prob
+            regrets[action] += regret
+            average_policy[action] += strategy_weight * player_prob * action_prob
         return state_utility
 
+    def strategy_weight(self):
+        ''' The weight of the policy of the current iteration in the average
+            policy
+
+        Returns:
+            (float): The iteration, i.e., the average is weighted linearly
+        '''
+        return self.iteration
+
     def update_policy(self):
-        ''' Update policy based on the current regrets
+        ''' Update policy based on the current regrets, for all the states at
+            once
         '''
-        for obs in self.regrets:
-            self.policy[obs] = self.regret_matching(obs)
+        regret_matching(self.table.array('regrets'), self.table.array('legal'), out=self.table.array('policy'))
 
     def regret_matching(self, obs):
         ''' Apply regret matching
@@ -109,17 +143,7 @@ class CFRAgent():
         Args:
             obs (string): The state_str
         '''
-        regret = self.regrets[obs]
-        positive_regret_sum = sum([r for r in regret if r > 0])
-
-        action_probs = np.zeros(self.env.action_num)
-        if positive_regret_sum > 0:
-            for action in range(self.env.action_num):
-                action_probs[action] = max(0.0, regret[action] / positive_regret_sum)
-        else:
-            for action in range(self.env.action_num):
-                action_probs[action] = 1.0 / self.env.action_num
-        return action_probs
+        return regret_matching(self.regrets[obs][np.newaxis])[0]
 
     def action_probs(self, obs, legal_actions, policy):
         ''' Obtain the action probabilities of the current state
@@ -134,9 +158,8 @@ class CFRAgent():
                 action_probs(numpy.array): The action probabilities
                 legal_actions (list): Indices of legal actions
         '''
-        if obs not in policy.keys():
+        if obs not in policy:
             action_probs = np.array([1.0/self.env.action_num for _ in range(self.env.action_num)])
-            self.policy[obs] = action_probs
         else:
             action_probs = policy[obs]
         action_probs = remove_illegal(action_probs, legal_actions)
@@ -169,47 +192,48 @@ class CFRAgent():
         state = self.env.get_state(player_id)
         return state['obs'].tostring(), state['legal_actions']
 
-    def save(self):
-        ''' Save model
-        '''
-        if not os.path.exists(self.model_path):
-            os.makedirs(self.model_path)
-
-        policy_file = open(os.path.join(self.model_path, 'policy.pkl'),'wb')
-        pickle.dump(self.policy, policy_file)
-        policy_file.close()
-
-        average_policy_file = open(os.path.join(self.model_path, 'average_policy.pkl'),'wb')
-        pickle.dump(self.average_policy, average_policy_file)
-        average_policy_file.close()
+    def save(self, incremental=False):
+        ''' Save model to a single checkpoint file in the model directory
 
-        regrets_file = open(os.path.join(self.model_path, 'regrets.pkl'),'wb')
-        pickle.dump(self.regrets, regrets_file)
-        regrets_file.close()
+        Args:
+            incremental (boolean): If True, only the information sets that
+              changed since the previous save or load are appended to the
+              checkpoint. See `rlcard.utils.checkpoint`
+        '''
+        save_table(os.path.join(self.model_path, CHECKPOINT_FILE), self.table,
+                   meta={'iteration': self.iteration}, incremental=incremental)
 
-        iteration_file = open(os.path.join(self.model_path, 'iteration.pkl'),'wb')
-        pickle.dump(self.iteration, iteration_file)
-        iteration_file.close()
+    def load(self, mmap_mode=None):
+        ''' Load model. The .npy files and the dicts of the models saved by
+            earlier versions are converted to a table
 
-    def load(self):
-        ''' Load model
+        Args:
+            mmap_mode (string): If not None, the table is memory-mapped
+              with this mode, e.g., 'r' to evaluate the model without reading
+              it into memory. A checkpoint with incremental saves is read
+              into memory unless it is compacted first
         '''
         if not os.path.exists(self.model_path):
             return
 
-        policy_file = open(os.path.join(self.model_path, 'policy.pkl'),'rb')
-        self.policy = pickle.load(policy_file)
-        policy_file.close()
-
-        average_policy_file = open(os.path.join(self.model_path, 'average_policy.pkl'),'rb')
-        self.average_policy = pickle.load(average_policy_file)
-        average_policy_file.close()
+        checkpoint_path = os.path.join(self.model_path, CHECKPOINT_FILE)
+        if os.path.exists(checkpoint_path):
+            self.table, meta = load_table(checkpoint_path, self.table_fields(), mmap_mode=mmap_mode)
+            self.bind_table()
+            self.iteration = meta['iteration']
+            return
 
-        regrets_file = open(os.path.join(self.model_path, 'regrets.pkl'),'rb')
-        self.regrets = pickle.load(regrets_file)
-        regrets_file.close()
+        if os.path.exists(os.path.join(self.model_path, KEYS_FILE)):
+            self.table = InfosetTable.load(self.model_path, self.table_fields(), mmap_mode=mmap_mode)
+        else:
+            dicts = {}
+            for name in ('policy', 'average_policy', 'regrets'):
+                dict_file = open(os.path.join(self.model_path, name + '.pkl'),'rb')
+                dicts[name] = pickle.load(dict_file)
+                dict_file.close()
+            self.table = InfosetTable.from_dicts(self.env.action_num, self.table_fields(), dicts)
+        self.bind_table()
 
         iteration_file = open(os.path.join(self.model_path, 'iteration.pkl'),'rb')
         self.iteration = pickle.load(iteration_file)
         iteration_file.close()
-
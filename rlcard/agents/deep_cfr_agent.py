@@ -243,6 +243,27 @@ class DeepCFR():
         action = np.random.choice(np.arange(len(action_prob)), p=action_prob)
         return action, action_prob
 
+    def batch_eval_step(self, states):
+        ''' Predict the actions of a batch of states for evaluation
+
+        args:
+            states (list): a list of states
+
+        returns:
+            actions (list): a list of action ids
+            probs (list): a list of action probabilities for each state
+        '''
+        info_states = np.stack([state['obs'] for state in states])
+        probs_batch = np.round(self._session.run(
+            self._action_probs, feed_dict={self._info_state_ph: info_states}), 4)
+        actions, probs = [], []
+        for action_prob, state in zip(probs_batch, states):
+            action_prob = remove_illegal(action_prob, state['legal_actions'])
+            action_prob /= action_prob.sum()
+            actions.append(np.random.choice(np.arange(len(action_prob)), p=action_prob))
+            probs.append(action_prob)
+        return actions, probs
+
     @staticmethod
     def reinitialize_advantage_networks():
         ''' Reinitialize the advantage networks
@@ -133,6 +133,21 @@ class DQNAgent(object):
         if tmp>=0 and tmp%self.train_every == 0:
             self.train()
 
+    def feed_batch(self, columns):
+        ''' Store a batch of transitions in to replay buffer and train the agent
+            as many times as `feed` would do for these transitions
+
+        Args:
+            columns (dict): The transitions of one player in the columnar
+              format, e.g., from `env.run(is_training=True, columnar=True)`
+        '''
+        self.memory.save_batch(columns['obs'], columns['action'], columns['reward'], columns['next_obs'], columns['done'])
+        for _ in range(len(columns['action'])):
+            self.total_t += 1
+            tmp = self.total_t - self.replay_memory_init_size
+            if tmp>=0 and tmp%self.train_every == 0:
+                self.train()
+
     def step(self, state):
         ''' Predict the action for genrating training data but
             have the predictions disconnected from the computation graph
@@ -162,6 +177,37 @@ class DQNAgent(object):
         best_action = np.argmax(probs)
         return best_action, probs
 
+    def batch_step(self, states):
+        ''' Predict the actions of a batch of states for generating training data
+
+        Args:
+            states (list): a list of states
+
+        Returns:
+            actions (list): a list of action ids
+        '''
+        A = self.batch_predict(np.stack([state['obs'] for state in states]))
+        actions = []
+        for probs, state in zip(A, states):
+            probs = remove_illegal(probs, state['legal_actions'])
+            actions.append(np.random.choice(np.arange(len(probs)), p=probs))
+        return actions
+
+    def batch_eval_step(self, states):
+        ''' Predict the actions of a batch of states for evaluation purpose.
+
+        Args:
+            states (list): a list of states
+
+        Returns:
+            actions (list): a list of action ids
+            probs (list): a list of probabilies for each state
+        '''
+        q_values = self.q_estimator.predict_nograd(np.stack([state['obs'] for state in states]))
+        probs = [remove_illegal(np.exp(q), state['legal_actions']) for q, state in zip(q_values, states)]
+        actions = [np.argmax(p) for p in probs]
+        return actions, probs
+
     def predict(self, state):
         ''' Predict the action probabilities but have them
             disconnected from the computation graph
@@ -172,11 +218,23 @@ class DQNAgent(object):
         Returns:
             q_values (numpy.array): a 1-d array where each entry represents a Q value
         '''
+        return self.batch_predict(np.expand_dims(state, 0))[0]
+
+    def batch_predict(self, states):
+        ''' Predict the action probabilities of a batch of states but have
+            them disconnected from the computation graph
+
+        Args:
+            states (numpy.array): a batch of states
+
+        Returns:
+            A (numpy.array): a 2-d array where each row represents the action probabilities
+        '''
         epsilon = self.epsilons[min(self.total_t, self.epsilon_decay_steps-1)]
-        A = np.ones(self.action_num, dtype=float) * epsilon / self.action_num
-        q_values = self.q_estimator.predict_nograd(np.expand_dims(state, 0))[0]
-        best_action = np.argmax(q_values)
-        A[best_action] += (1.0 - epsilon)
+        A = np.ones((len(states), self.action_num), dtype=float) * epsilon / self.action_num
+        q_values = self.q_estimator.predict_nograd(states)
+        best_actions = np.argmax(q_values, axis=1)
+        A[np.arange(len(states)), best_actions] += (1.0 - epsilon)
         return A
 
     def train(self):
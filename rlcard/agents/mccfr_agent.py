@@ -0,0 +1,162 @@
+import numpy as np
+
+from rlcard.agents.cfr_agent import CFRAgent
+from rlcard.utils import seeding
+from rlcard.utils.utils import remove_illegal
+
+class MCCFRAgent(CFRAgent):
+    ''' Monte Carlo CFR, which samples a part of the game tree at each
+        traversal instead of traversing it fully. It shares the table of the
+        regrets and the policies of CFRAgent, and the policy is updated by
+        regret matching at the end of each iteration.
+
+        The deals of the env are the chance events, and each traversal
+        starts from a new deal. The sampling schemes are:
+
+        'chance': Chance-sampled CFR, i.e., all the actions of all the
+          players are traversed for the deal, as in CFRAgent.
+        'external': External sampling, i.e., all the actions of the
+          traversing player are traversed and one action of the other
+          players is sampled from their policy.
+        'outcome': Outcome sampling, i.e., a single trajectory is sampled,
+          with an exploration of `epsilon` for the traversing player, and the
+          values are corrected by importance sampling. It does not use
+          `step_back`, so the env needs not allow it.
+
+        Monte Carlo sampling for regret minimization in extensive games
+        http://mlanctot.info/files/papers/nips09mccfr.pdf
+    '''
+
+    SAMPLINGS = ('chance', 'external', 'outcome')
+
+    def __init__(self, env, model_path='./mccfr_model', sampling='external', samples=1, epsilon=0.6, seed=None):
+        ''' Initilize Agent
+
+        Args:
+            env (Env): Env class
+            model_path (string): The directory of the model
+            sampling (string): 'chance', 'external' or 'outcome'
+            samples (int): The number of traversals of each player in each
+              iteration. The policy is updated after them
+            epsilon (float): The exploration of outcome sampling
+            seed (int): The seed of the sampling of the actions. The deals
+              are sampled by the env
+        '''
+        if sampling not in self.SAMPLINGS:
+            raise ValueError('sampling should be one of {}, got {}'.format(self.SAMPLINGS, sampling))
+        if samples <= 0:
+            raise ValueError('samples should be positive, got {}'.format(samples))
+        if not 0 < epsilon <= 1:
+            raise ValueError('epsilon should be in (0, 1], got {}'.format(epsilon))
+        super().__init__(env, model_path=model_path)
+        self.sampling = sampling
+        self.samples = samples
+        self.epsilon = epsilon
+        self.np_random, _ = seeding.np_random(seed)
+
+    def traverse_players(self):
+        ''' Do the `samples` traversals of each player of one iteration
+        '''
+        for _ in range(self.samples):
+            for player_id in range(self.env.player_num):
+                self.env.reset()
+                if self.sampling == 'chance':
+                    self.traverse_tree(np.ones(self.env.player_num), player_id)
+                elif self.sampling == 'external':
+                    self.traverse_external(player_id)
+                else:
+                    self.traverse_outcome(player_id, 1.0, 1.0, 1.0)
+
+    def traverse_external(self, player_id):
+        ''' Traverse the game tree with external sampling, update the regrets
+            of the player and the average policy of the other players
+
+        Args:
+            player_id (int): The traversing player
+
+        Returns:
+            (float): The sampled utility of the player
+        '''
+        if self.env.is_over():
+            return self.env.get_payoffs()[player_id]
+
+        current_player = self.env.get_player_id()
+        infoset, legal_actions, action_probs = self.visit(current_player)
+
+        if not current_player == player_id:
+            action = self.np_random.choice(len(action_probs), p=action_probs)
+            self.env.step(action, observe=False)
+            utility = self.traverse_external(player_id)
+            self.env.step_back(observe=False)
+
+            self.table.arrays['average_policy'][infoset] += self.strategy_weight() * action_probs
+            return utility
+
+        action_utilities = np.zeros(self.env.action_num)
+        for action in legal_actions:
+            self.env.step(action, observe=False)
+            action_utilities[action] = self.traverse_external(player_id)
+            self.env.step_back(observe=False)
+
+        state_utility = np.dot(action_probs, action_utilities)
+        self.table.arrays['regrets'][infoset, legal_actions] += action_utilities[legal_actions] - state_utility
+        return state_utility
+
+    def traverse_outcome(self, player_id, player_prob, opponent_prob, sample_prob):
+        ''' Sample a trajectory with outcome sampling, update the regrets
+            and the average policy of the player
+
+        Args:
+            player_id (int): The traversing player
+            player_prob (float): The reach probability of the player
+            opponent_prob (float): The reach probability of the other players
+            sample_prob (float): The probability to sample the trajectory so far
+
+        Returns:
+            (float): The importance-weighted utility of the player
+        '''
+        if self.env.is_over():
+            return self.env.get_payoffs()[player_id]
+
+        current_player = self.env.get_player_id()
+        infoset, legal_actions, action_probs = self.visit(current_player)
+
+        sample_probs = action_probs
+        if current_player == player_id:
+            sample_probs = (1 - self.epsilon) * action_probs
+            sample_probs[legal_actions] += self.epsilon / len(legal_actions)
+        action = self.np_random.choice(len(sample_probs), p=sample_probs)
+        action_prob = action_probs[action]
+
+        self.env.step(action, observe=False)
+        if current_player == player_id:
+            utility = self.traverse_outcome(player_id, player_prob * action_prob, opponent_prob,
+                                            sample_prob * sample_probs[action])
+        else:
+            utility = self.traverse_outcome(player_id, player_prob, opponent_prob * action_prob,
+                                            sample_prob * sample_probs[action])
+        # The sampled action is the only one with a non-zero estimate
+        action_utility = utility / sample_probs[action]
+        state_utility = action_prob * action_utility
+
+        if current_player == player_id:
+            action_utilities = np.zeros(self.env.action_num)
+            action_utilities[action] = action_utility
+            self.table.arrays['regrets'][infoset, legal_actions] += (opponent_prob / sample_prob) * (action_utilities[legal_actions] - state_utility)
+            self.table.arrays['average_policy'][infoset] += self.strategy_weight() * player_prob / sample_prob * action_probs
+        return state_utility
+
+    def visit(self, player_id):
+        ''' Get the information set of the current state and its policy
+
+        Args:
+            player_id (int): The current player
+
+        Returns:
+            (tuple): The id of the information set, the legal actions and the
+              action probabilities
+        '''
+        obs, legal_actions = self.get_state(player_id)
+        infoset = self.table.get_id(obs)
+        self.table.arrays['legal'][infoset, legal_actions] = True
+        return infoset, legal_actions, remove_illegal(self.table.arrays['policy'][infoset], legal_actions)
@@ -173,6 +173,19 @@ class NFSPAgent(object):
             sl_loss  = self.train_sl()
             print('\rINFO - Agent {}, step {}, sl-loss: {}'.format(self._scope, self.total_t, sl_loss), end='')
 
+    def feed_batch(self, columns):
+        ''' Feed a batch of transitions to inner RL agent
+
+        Args:
+            columns (dict): The transitions of one player in the columnar format
+        '''
+        self._rl_agent.feed_batch(columns)
+        for _ in range(len(columns['action'])):
+            self.total_t += 1
+            if self.total_t>0 and len(self._reservoir_buffer) >= self._min_buffer_size_to_learn and self.total_t%self._train_every == 0:
+                sl_loss  = self.train_sl()
+                print('\rINFO - Agent {}, step {}, sl-loss: {}'.format(self._scope, self.total_t, sl_loss), end='')
+
     def step(self, state):
         ''' Returns the action to be taken.
 
@@ -219,6 +232,50 @@ class NFSPAgent(object):
             raise ValueError("'evaluate_with' should be either 'average_policy' or 'best_response'.")
         return action, probs
 
+    def batch_step(self, states):
+        ''' Returns the actions to be taken for a batch of states.
+
+        Args:
+            states (list): A list of states
+
+        Returns:
+            actions (list): A list of action ids
+        '''
+        obs_batch = np.stack([state['obs'] for state in states])
+        if self._mode == MODE.best_response:
+            probs_batch = self._rl_agent.batch_predict(obs_batch)
+            for obs, probs in zip(obs_batch, probs_batch):
+                self._add_transition(obs, np.eye(len(probs))[np.argmax(probs)])
+
+        elif self._mode == MODE.average_policy:
+            probs_batch = self._batch_act(obs_batch)
+
+        actions = []
+        for probs, state in zip(probs_batch, states):
+            probs = remove_illegal(probs, state['legal_actions'])
+            actions.append(np.random.choice(len(probs), p=probs))
+        return actions
+
+    def batch_eval_step(self, states):
+        ''' Use the average policy for evaluation purpose on a batch of states
+
+        Args:
+            states (list): A list of states.
+
+        Returns:
+            actions (list): A list of action ids.
+            probs (list): The list of action probabilies for each state
+        '''
+        if self.evaluate_with == 'best_response':
+            actions, probs = self._rl_agent.batch_eval_step(states)
+        elif self.evaluate_with == 'average_policy':
+            probs_batch = self._batch_act(np.stack([state['obs'] for state in states]))
+            probs = [remove_illegal(p, state['legal_actions']) for p, state in zip(probs_batch, states)]
+            actions = [np.random.choice(len(p), p=p) for p in probs]
+        else:
+            raise ValueError("'evaluate_with' should be either 'average_policy' or 'best_response'.")
+        return actions, probs
+
     def sample_episode_policy(self):
         ''' Sample average/best_response policy
         '''
@@ -236,10 +293,20 @@ class NFSPAgent(object):
         Returns:
             action_probs (numpy.array): The predicted action probability.
         '''
-        info_state = np.expand_dims(info_state, axis=0)
+        return self._batch_act(np.expand_dims(info_state, axis=0))[0]
+
+    def _batch_act(self, info_states):
+        ''' Predict action probabilities of a batch of observations
+
+        Args:
+            info_states (numpy.array): A batch of obervations.
+
+        Returns:
+            action_probs (numpy.array): The predicted action probabilities, one row per observation.
+        '''
         action_probs = self._sess.run(
                 self._avg_policy_probs,
-                feed_dict={self._info_state_ph: info_state, self.is_train: False})[0]
+                feed_dict={self._info_state_ph: info_states, self.is_train: False})
 
         return action_probs
 
@@ -1,6 +1,6 @@
 import numpy as np
 from rlcard.agents import RandomAgent
-from rlcard.utils import rank2int
+from rlcard.utils.strength_tables import preflop_strength
 
 # Adds weights to how often an action will be made
 CONSERVATIVE_WEIGHTS = {"fold" : 8, "check" : 5, "call" : 2, "raise" : 1}
@@ -8,16 +8,27 @@ NEUTRIAL_WEIGHTS = {"fold" : 8, "check" : 5, "call" : 2, "raise" : 1}
 AGRESSIVE_WEIGHTS = {"fold" : 1, "check" : 3, "call" : 2, "raise" : 8}
 MODES = [CONSERVATIVE_WEIGHTS, NEUTRIAL_WEIGHTS, AGRESSIVE_WEIGHTS]
 
+# The equity of the hand against a random hand below which the agent plays
+# conservatively, and above which it plays agressively. About 12% and 44%
+# of the hands of the 6+ deck
+CONSERVATIVE_EQUITY = 0.41
+AGRESSIVE_EQUITY = 0.51
+
 class OneLookAgent(object):
     ''' Agent looks at it's card to start the game, then never looks at the board
     '''
-    def __init__(self):
+    def __init__(self, short_deck=True):
         ''' Stateless implementation
+
+        Args:
+            short_deck (boolean): True if the game is played with the 6+
+              deck, e.g., in short limit hold'em, and False for the standard
+              deck. It selects the preflop table of the hands
         '''
         self.use_raw = True
+        self.short_deck = short_deck
 
-    @ staticmethod    
-    def getPolicy(actions, hand):
+    def getPolicy(self, actions, hand):
         ''' Based on purely the cards in the player's hand, they will be more likely to make an action.
 
         Args:
@@ -26,23 +37,20 @@ class OneLookAgent(object):
 
         Returns:
             probablities (list[float]): odds of choosing an action
-        '''       
-        # Figureout how good the hand is just based on card ranks
-        cardScore = 0
-        for card in hand:
-            cardScore += rank2int(card[1])
-        
+        '''
+        # Figureout how good the hand is with the precomputed preflop tables
+        handEquity = preflop_strength(hand, self.short_deck)['equity']
+
         # Decide play style based on our hand
         mode = 2
-        if cardScore < 16:
+        if handEquity < CONSERVATIVE_EQUITY:
             mode = 0
-        elif cardScore < 21:
+        elif handEquity < AGRESSIVE_EQUITY:
             mode = 1
 
         return MODES[mode]
 
-    @staticmethod
-    def step(state):
+    def step(self, state):
         ''' Player will pick a play style purely based on hards in hand
 
         Args:
@@ -54,7 +62,7 @@ class OneLookAgent(object):
         actions = state['raw_obs']['legal_actions']
         hand = state['raw_obs']['hand']
 
-        weights = OneLookAgent.getPolicy(actions, hand)
+        weights = self.getPolicy(actions, hand)
         probabilites = [weights[action] for action in actions]  
         scaler = 1/sum(probabilites)
         normProbs =  [p * scaler for p in probabilites] 
@@ -1,11 +1,10 @@
 ''' Limit Hold 'em rule model
 '''
-import rlcard, random, multiprocessing, time
+import rlcard, random, time
 from rlcard.agents.one_look_agent import OneLookAgent
-from rlcard.core import Card
 from rlcard.utils import tournament, rank2int, init_short_deck, get_random_cards, take_out_cards
-from itertools import combinations
-from rlcard.games.shortlimitholdem.utils import ShortHand
+from rlcard.utils.equity import hand_strength
+from rlcard.utils.strength_tables import preflop_strength, preflop_average
 
 WINNING_ACTIONS = ['raise', 'call']
 LOSING_ACTIONS = ['check', 'fold']
@@ -17,14 +16,22 @@ class ShortLimitholdemAverageAndy(object):
         could have.
     '''
 
-    def __init__(self):
-        ''' Implementation is stateless, but could benefit from some
-            caching to speed up implementation
+    def __init__(self, preflop_threshold=None):
+        ''' The utilities of the hands are looked up in the precomputed
+            tables or evaluated at once
+
+        Args:
+            preflop_threshold (float): The utility of an "average" preflop
+              hand. It defaults to the exact average of all the hands of the
+              preflop tables (~3.37). 3.33 is the value that was decided
+              empirically with getAverageHandUtilityPreFlop
         '''
         self.use_raw = True
+        if preflop_threshold is None:
+            preflop_threshold = preflop_average('mean_category', short_deck=True)
+        self.preflop_threshold = preflop_threshold
 
-    @staticmethod
-    def step(state):
+    def step(self, state):
         ''' Plays if player's cards are "better" than average, becasuse
             it only knows how to play heads up.
         Args:
@@ -39,22 +46,20 @@ class ShortLimitholdemAverageAndy(object):
         hand = state['hand']
         public_cards = state['public_cards']
 
-        # Figureout how "good" our hand is
-        utility = ShortLimitholdemAverageAndy.handUtility(hand + public_cards)
-
         # Play agressively if we have a better than average hand
         actions = WINNING_ACTIONS
 
-        # All possible hands is too large to fully calculate in real time
-        # on a normal desktop PC, 3.33 was emperically decided as a "average"
-        # preflop hand.  See getAverageHandUtilityPreFlop for how this value
-        # was decided
-        if len(public_cards) == 0 and utility <3.33:
-            actions = LOSING_ACTIONS
+        # Before the flop, the utility of the hole cards is looked up in the
+        # precomputed preflop tables
+        if len(public_cards) == 0:
+            utility = preflop_strength(hand, short_deck=True)['mean_category']
+            if utility < self.preflop_threshold:
+                actions = LOSING_ACTIONS
         
         # Decide if our hand is better than the average utility of just
         # the public cards.
-        elif len(public_cards) > 0:
+        else:
+            utility = ShortLimitholdemAverageAndy.handUtility(hand + public_cards)
             otherUtility = ShortLimitholdemAverageAndy.handUtility(public_cards)
             if otherUtility > utility:  
                 actions = LOSING_ACTIONS
@@ -75,44 +80,15 @@ class ShortLimitholdemAverageAndy(object):
         Returns:
             utility (float): 1.0-9.0
         '''
-        # remove availabe hand cards from a full deck
-        fullDeck = init_short_deck()
-        for card in [Card(c[0], c[1]) for c in cards]:
-            fullDeck.remove(card)
-
-        # Generate all possilbe end hands the player could have
-        allHands = ShortLimitholdemAverageAndy.get_all_hands(7-len(cards), fullDeck)
-        allHands = [[card.suit + card.rank for card in hand] for hand in allHands]
-        allHands = [cards + x for x in allHands]
-
-        # Calculate the average utility of all possible hands by using up all
-        # of your CPU resources.  Can switch these lines with the one commented
-        # out to do single CPU computation.
-        pool = multiprocessing.Pool(multiprocessing.cpu_count())
-        utility = sum(pool.map(ShortLimitholdemAverageAndy.evalHand, allHands))
-        pool.close()
-        # utility = sum(map(ShortLimitholdemAverageAndy.evalHand, allHands))
-        return utility / len(allHands)
-
-    @staticmethod
-    def evalHand(hand):
-        ''' Evaluates a full 7 card short holdem hand
-        Args:
-            hand (array of string): Two character formatted the same the game state
-
-        Returns:
-            rank (int): 1-9
-        '''
-        sh = ShortHand(hand)
-        sh.evaluateHand()
-        return sh.category
+        # Average the category of all possible end hands the player could
+        # have, which are evaluated at once
+        return hand_strength(cards, short_deck=True)['mean_category']
 
     @staticmethod
     def getAverageHandUtilityPreFlop(rounds):
-        ''' Finding the average utility of all possible 7 card hands is takes too
-            long to compute on a normal desktop, so this function was used to find
-            the utility of x random hands to get an idea of what a "good" utility is
-            before the flop happens.  The number found was ~3.3.
+        ''' Estimate the average utility of all possible 7 card hands with x
+            random hands. The exact average is precomputed in the preflop
+            tables, see `rlcard.utils.strength_tables.preflop_average`.
         Args:
             rounds (int): number of random hands to evaluate
 
@@ -127,18 +103,6 @@ class ShortLimitholdemAverageAndy(object):
             totalUtil += ShortLimitholdemAverageAndy.handUtility(handStr)
         return totalUtil / rounds
 
-    @staticmethod
-    def get_all_hands(numCards, deck):
-        ''' Generates all possible x number possible hands from a deck
-        Args:
-            numCards (int): how many cards each hand should have
-            deck (list of Card): all possible cards to choose from
-
-        Returns:
-            hands (list of Card): generated hands
-        '''
-        return list(combinations(deck, numCards))
-
 if __name__ == "__main__":
     start = time.time()
     env = rlcard.make('short-limit-holdem', config={'seed': 0})
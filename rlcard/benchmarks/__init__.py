@@ -0,0 +1,6 @@
+''' Benchmarks of the speed of the environments and the game utilities.
+    Run `python -m rlcard.benchmarks --help` for the command line interface.
+'''
+from rlcard.benchmarks.envs import benchmark_env, benchmark_vec_env
+from rlcard.benchmarks.utilities import benchmark_utilities
+from rlcard.benchmarks.suite import run_benchmarks, compare_results
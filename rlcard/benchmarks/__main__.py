@@ -0,0 +1,50 @@
+''' Command line interface of the benchmarks, e.g.,
+
+    python -m rlcard.benchmarks --output new.json --baseline old.json
+'''
+import sys
+import json
+import argparse
+
+from rlcard.benchmarks.suite import run_benchmarks, compare_results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the environments of RLCard')
+    parser.add_argument('--envs', nargs='+', default=None,
+                        help='The ids of the environments. All the registered ones by default')
+    parser.add_argument('--workers', nargs='*', type=int, default=[1, 2, 4],
+                        help='The numbers of workers of VecEnv. Give no number to skip VecEnv')
+    parser.add_argument('--min-time', type=float, default=1.0,
+                        help='The minimum duration of each measurement in seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-utilities', action='store_true',
+                        help='Skip the benchmarks of the game utilities')
+    parser.add_argument('--output', default=None,
+                        help='The JSON file of the results. Printed if not given')
+    parser.add_argument('--baseline', default=None,
+                        help='A JSON file of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='The relative slowdown that counts as a regression')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(env_ids=args.envs, workers=args.workers, min_time=args.min_time,
+                             seed=args.seed, utilities=not args.no_utilities,
+                             log=lambda message: print(message, file=sys.stderr))
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = 0
+    for name, old, new, speedup, is_regression in compare_results(baseline, results, args.threshold):
+        regressions += is_regression
+        print('{:60s} {:14.2f} {:14.2f} {:7.2f}x{}'.format(name, old, new, speedup, '  REGRESSION' if is_regression else ''))
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+''' Benchmarks of the environments with random agents
+'''
+import os
+import time
+import numpy as np
+
+import rlcard
+from rlcard.agents.random_agent import RandomAgent
+from rlcard.envs.vec_env import VecEnv
+from rlcard.envs.registration import DEFAULT_CONFIG
+from rlcard.benchmarks.timer import per_call_us, rate
+
+def benchmark_env(env_id, min_time=1.0, seed=0):
+    ''' Measure the speed of one environment. The actions are drawn uniformly
+        from the legal actions.
+
+    Args:
+        env_id (string): The id of the environment, e.g., 'leduc-holdem'
+        min_time (float): The minimum duration of each measurement in seconds
+        seed (int): The seed of the environment and of the actions
+
+    Returns:
+        (dict): A dict containing:
+
+            'steps_per_sec' (float): The steps of the random games per second
+            'reset_us' (float): The cost of `reset` in microseconds
+            'extract_state_us' (float): The cost of `_extract_state`
+            'step_back_us' (float): The cost of `step_back`, or None if the
+              game does not support it
+    '''
+    np_random = np.random.RandomState(seed)
+    env = rlcard.make(env_id, config={'seed': seed, 'allow_step_back': True})
+
+    def play_game():
+        state, _ = env.reset()
+        steps = 0
+        while not env.is_over():
+            legal_actions = state['legal_actions']
+            state, _ = env.step(legal_actions[np_random.randint(len(legal_actions))])
+            steps += 1
+        return steps
+
+    def reset():
+        env.reset()
+        return 1
+
+    return {'steps_per_sec': rate(play_game, min_time),
+            'reset_us': per_call_us(reset, min_time),
+            'extract_state_us': _extract_state_us(env, np_random, min_time),
+            'step_back_us': _step_back_us(env, np_random, min_time)}
+
+def _extract_state_us(env, np_random, min_time):
+    ''' Measure `_extract_state` alone on the states of random games. The raw
+        states are taken from the game, so the cost of the game is excluded.
+    '''
+    count, spent = 0, 0.0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        env.reset()
+        while not env.is_over():
+            raw_state = env.game.get_state(env.get_player_id())
+            tic = time.perf_counter()
+            state = env._extract_state(raw_state)
+            spent += time.perf_counter() - tic
+            count += 1
+            legal_actions = state['legal_actions']
+            env.step(legal_actions[np_random.randint(len(legal_actions))], observe=False)
+    return spent / max(count, 1) * 1e6
+
+def _step_back_us(env, np_random, min_time):
+    ''' Measure `step_back` by undoing random games back to the root
+
+    Returns:
+        (float): Microseconds per step back, or None if it is not supported
+    '''
+    count, spent = 0, 0.0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        state, _ = env.reset()
+        while not env.is_over():
+            legal_actions = state['legal_actions']
+            state, _ = env.step(legal_actions[np_random.randint(len(legal_actions))])
+        tic = time.perf_counter()
+        try:
+            while env.step_back(observe=False):
+                count += 1
+        except NotImplementedError:
+            return None
+        spent += time.perf_counter() - tic
+    return spent / max(count, 1) * 1e6
+
+def benchmark_vec_env(env_id, workers=(1, 2, 4), min_time=1.0, seed=0):
+    ''' Measure how `VecEnv` scales with the number of workers. Starting the
+        processes is excluded.
+
+    Args:
+        env_id (string): The id of the environment
+        workers (list): The numbers of workers to measure. The ones larger
+          than the number of CPUs are skipped
+        min_time (float): The minimum duration of each measurement in seconds
+        seed (int): The seed of the environments and of the agents
+
+    Returns:
+        (dict): The steps per second of each number of workers. The keys are
+          strings so that the result can be saved to JSON
+    '''
+    result = {}
+    for num in workers:
+        if num > (os.cpu_count() or 1):
+            continue
+        np.random.seed(seed)
+        # `make` returns a plain environment for one worker
+        config = dict(DEFAULT_CONFIG, env_num=num, seed=seed)
+        env = VecEnv(env_id, config)
+        try:
+            env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+            # Warm up the workers
+            env.run(is_training=False)
+
+            def run():
+                timestep = env.timestep
+                env.run(is_training=False)
+                return env.timestep - timestep
+            result[str(num)] = rate(run, min_time)
+        finally:
+            env.close()
+    return result
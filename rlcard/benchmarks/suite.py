@@ -0,0 +1,89 @@
+''' Run all the benchmarks and compare the results of two runs
+'''
+import platform
+import time
+import numpy as np
+
+import rlcard
+from rlcard.benchmarks.envs import benchmark_env, benchmark_vec_env
+from rlcard.benchmarks.utilities import benchmark_utilities
+
+def run_benchmarks(env_ids=None, workers=(1, 2, 4), min_time=1.0, seed=0, utilities=True, log=None):
+    ''' Benchmark the environments and the utilities
+
+    Args:
+        env_ids (list): The ids of the environments. All the registered
+          environments if None
+        workers (list): The numbers of workers of `VecEnv`. Empty to skip
+        min_time (float): The minimum duration of each measurement in seconds
+        seed (int): The seed of the environments and of the random inputs
+        utilities (boolean): True if the utilities should be benchmarked
+        log (callable): If not None, it is called with a message before
+          each benchmark
+
+    Returns:
+        (dict): The results, which can be saved to JSON. The metrics ending
+          with `_us` are microseconds per call, and the others are rates
+    '''
+    from rlcard.envs.registration import registry
+    if env_ids is None:
+        env_ids = list(registry.env_specs)
+    log = log or (lambda message: None)
+
+    results = {'meta': {'rlcard_version': rlcard.__version__,
+                        'python': platform.python_version(),
+                        'numpy': np.__version__,
+                        'platform': platform.platform(),
+                        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                        'min_time': min_time,
+                        'seed': seed},
+               'envs': {}}
+    for env_id in env_ids:
+        log('Benchmarking {}'.format(env_id))
+        result = benchmark_env(env_id, min_time=min_time, seed=seed)
+        result['vec_env_steps_per_sec'] = benchmark_vec_env(env_id, workers=workers, min_time=min_time, seed=seed)
+        results['envs'][env_id] = result
+    if utilities:
+        log('Benchmarking the utilities')
+        results['utilities'] = benchmark_utilities(min_time=min_time, seed=seed)
+    return results
+
+def compare_results(baseline, current, threshold=0.1):
+    ''' Compare the metrics that are in both results
+
+    Args:
+        baseline (dict): The results of the reference run
+        current (dict): The results of the new run
+        threshold (float): The relative slowdown above which a metric is
+          a regression
+
+    Returns:
+        (list): One tuple (name, baseline value, current value, speedup, is
+          regression) for each metric. The speedup is larger than 1 if the
+          current run is faster
+    '''
+    baseline_metrics = _flatten(baseline)
+    current_metrics = _flatten(current)
+    comparison = []
+    for name, old in baseline_metrics.items():
+        new = current_metrics.get(name)
+        if old is None or new is None or old <= 0 or new <= 0:
+            continue
+        speedup = old / new if name.endswith('_us') else new / old
+        comparison.append((name, old, new, speedup, speedup < 1 - threshold))
+    return comparison
+
+def _flatten(results):
+    ''' Flatten the metrics of the environments and the utilities into a
+        dict from paths like `envs/leduc-holdem/steps_per_sec` to values
+    '''
+    metrics = {}
+    def visit(prefix, node):
+        for key, value in node.items():
+            name = prefix + '/' + key if prefix else key
+            if isinstance(value, dict):
+                visit(name, value)
+            elif value is None or isinstance(value, (int, float)):
+                metrics[name] = value
+    visit('', {key: results[key] for key in ('envs', 'utilities') if key in results})
+    return metrics
@@ -0,0 +1,52 @@
+''' Timing helpers of the benchmarks
+'''
+import time
+
+def measure(func, min_time=1.0):
+    ''' Call `func` repeatedly until at least `min_time` seconds have passed
+
+    Args:
+        func (callable): A function that does one round of work and returns
+          the number of operations in the round, e.g., the number of steps
+          of a game
+        min_time (float): The minimum duration of the measurement in seconds
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (int): The number of operations
+            (float): The elapsed time in seconds
+    '''
+    count = 0
+    start = time.perf_counter()
+    while True:
+        count += func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return count, elapsed
+
+def per_call_us(func, min_time=1.0):
+    ''' The average cost of one call in microseconds
+
+    Args:
+        func (callable): The function to measure. See `measure`
+        min_time (float): The minimum duration of the measurement in seconds
+
+    Returns:
+        (float): Microseconds per operation
+    '''
+    count, elapsed = measure(func, min_time)
+    return elapsed / max(count, 1) * 1e6
+
+def rate(func, min_time=1.0):
+    ''' The number of operations per second
+
+    Args:
+        func (callable): The function to measure. See `measure`
+        min_time (float): The minimum duration of the measurement in seconds
+
+    Returns:
+        (float): Operations per second
+    '''
+    count, elapsed = measure(func, min_time)
+    return count / elapsed
@@ -0,0 +1,79 @@
+''' Benchmarks of the hot utilities of the games
+'''
+import numpy as np
+
+from rlcard.benchmarks.timer import per_call_us
+
+def benchmark_hand_evaluation(min_time=1.0, seed=0, pool_size=1000):
+    ''' Measure `evaluate_hand`, which decides the showdowns of Hold'em, on
+        random 7-card hands
+
+    Returns:
+        (float): Microseconds per hand
+    '''
+    from rlcard.games.limitholdem.evaluator import evaluate_hand
+    from rlcard.utils.utils import init_standard_deck
+    np_random = np.random.RandomState(seed)
+    deck = [card.get_index() for card in init_standard_deck()]
+    hands = [list(np_random.choice(deck, 7, replace=False)) for _ in range(pool_size)]
+
+    def evaluate():
+        for cards in hands:
+            evaluate_hand(cards)
+        return len(hands)
+    return per_call_us(evaluate, min_time)
+
+def benchmark_doudizhu_playable_cards(min_time=1.0, seed=0, pool_size=100):
+    ''' Measure `DoudizhuJudger.playable_cards_from_hand` on random hands
+        of 20 cards, i.e., the hands of the landlord
+
+    Returns:
+        (float): Microseconds per hand
+    '''
+    from rlcard.games.doudizhu.judger import DoudizhuJudger
+    from rlcard.games.doudizhu.utils import CARD_RANK_STR, CARD_RANK_STR_INDEX
+    np_random = np.random.RandomState(seed)
+    deck = [rank for rank in CARD_RANK_STR[:-2] for _ in range(4)] + ['B', 'R']
+    hands = []
+    for _ in range(pool_size):
+        cards = sorted(np_random.choice(deck, 20, replace=False), key=lambda card: CARD_RANK_STR_INDEX[card])
+        hands.append(''.join(cards))
+
+    def playable_cards():
+        for hand in hands:
+            DoudizhuJudger.playable_cards_from_hand(hand)
+        return len(hands)
+    return per_call_us(playable_cards, min_time)
+
+def benchmark_gin_rummy_meld_clusters(min_time=1.0, seed=0, pool_size=1000):
+    ''' Measure `get_meld_clusters` on random hands of 11 cards, i.e., the
+        hands before a discard
+
+    Returns:
+        (float): Microseconds per hand
+    '''
+    from rlcard.games.gin_rummy.utils import utils
+    from rlcard.games.gin_rummy.utils.melding import get_meld_clusters
+    np_random = np.random.RandomState(seed)
+    deck = utils.get_deck()
+    hands = [[deck[i] for i in np_random.choice(len(deck), 11, replace=False)] for _ in range(pool_size)]
+
+    def meld_clusters():
+        for hand in hands:
+            get_meld_clusters(hand)
+        return len(hands)
+    return per_call_us(meld_clusters, min_time)
+
+UTILITY_BENCHMARKS = {
+    'hand_evaluation_us': benchmark_hand_evaluation,
+    'doudizhu_playable_cards_us': benchmark_doudizhu_playable_cards,
+    'gin_rummy_meld_clusters_us': benchmark_gin_rummy_meld_clusters,
+}
+
+def benchmark_utilities(min_time=1.0, seed=0):
+    ''' Run all the benchmarks of the utilities
+
+    Returns:
+        (dict): The microseconds per call of each utility
+    '''
+    return {name: benchmark(min_time=min_time, seed=seed) for name, benchmark in UTILITY_BENCHMARKS.items()}
@@ -1,7 +1,8 @@
 ''' Register new environments
 '''
 from rlcard.envs.env import Env
-from rlcard.envs.vec_env import VecEnv
+from rlcard.envs.vec_env import VecEnv, EnvPool
+from rlcard.envs.batched_env import BatchedEnv
 from rlcard.envs.registration import register, make
 
 register(
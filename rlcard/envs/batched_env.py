@@ -0,0 +1,154 @@
+'''
+A wrapper for running a batch of environments in lockstep in a single process
+'''
+import numpy as np
+
+from rlcard.utils import merge_stats
+from rlcard.utils.seeding import spawn_seeds
+
+class BatchedEnv(object):
+    '''
+    The wrapper for a batch of environments that are stepped together in
+    the current process. Unlike `VecEnv`, no states are sent between
+    processes, which makes it a better fit for cheap games such as
+    Leduc Hold'em or Blackjack. Observations are stacked into arrays so
+    that a whole batch can be fed to an agent at once. Finished games are
+    reset automatically.
+    '''
+
+    def __init__(self, env_id, config):
+        ''' Initialize the BatchedEnv class
+
+        Args:
+            env_id (string): The id of the environment, e.g., 'blackjack'
+            config (dict): The same as the config in Env. `env_num` is the
+                number of games in the batch
+        '''
+        from rlcard.envs.registration import registry
+        if config['single_agent_mode']:
+            raise ValueError('Single agent mode is not supported in BatchedEnv')
+        self.num = config['env_num']
+        self.envs = [registry.make(env_id, config) for _ in range(self.num)]
+
+        # A counter for the timesteps
+        self.timestep = 0
+
+        # Get the number of players/actions/state_shape in this game
+        self.player_num = self.envs[0].player_num
+        self.action_num = self.envs[0].action_num
+        self.state_shape = getattr(self.envs[0], 'state_shape', None)
+
+        # The latest extracted states of all the games
+        self.states = [None for _ in range(self.num)]
+
+        self._seed(config['seed'])
+
+    def reset(self):
+        ''' Start a new game in every environment of the batch
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (numpy.array): The observations of shape (env_num, *state_shape)
+                (numpy.array): The legal action masks of shape (env_num, action_num)
+                (numpy.array): The IDs of the current players of shape (env_num,)
+        '''
+        player_ids = np.zeros(self.num, dtype=int)
+        for i, env in enumerate(self.envs):
+            self.states[i], player_ids[i] = env.reset()
+        obs, legal_masks = self._stack_states()
+        return obs, legal_masks, player_ids
+
+    def step(self, actions, raw_action=False):
+        ''' Step forward every environment of the batch. The games that are
+            over after this step are reset, so the returned observations of
+            these games are the first observations of the new games.
+
+        Args:
+            actions (list or numpy.array): One action for each environment
+            raw_action (boolean): True if the actions are raw actions
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (numpy.array): The observations of shape (env_num, *state_shape)
+                (numpy.array): The legal action masks of shape (env_num, action_num)
+                (numpy.array): The IDs of the current players of shape (env_num,)
+                (numpy.array): The payoffs of shape (env_num, player_num).
+                  Only the rows of the finished games are non-zero
+                (numpy.array): A boolean array of shape (env_num,) that
+                  indicates which games are finished in this step
+        '''
+        if len(actions) != self.num:
+            raise ValueError('Expect {} actions, got {}'.format(self.num, len(actions)))
+
+        player_ids = np.zeros(self.num, dtype=int)
+        payoffs = np.zeros((self.num, self.player_num))
+        dones = np.zeros(self.num, dtype=bool)
+        for i, env in enumerate(self.envs):
+            self.states[i], player_ids[i] = env.step(actions[i], raw_action)
+            if env.is_over():
+                payoffs[i] = env.get_payoffs()
+                dones[i] = True
+                self.states[i], player_ids[i] = env.reset()
+        self.timestep += self.num
+
+        obs, legal_masks = self._stack_states()
+        return obs, legal_masks, player_ids, payoffs, dones
+
+    def get_player_ids(self):
+        ''' Get the current player id of every environment
+
+        Returns:
+            (numpy.array): The IDs of the current players of shape (env_num,)
+        '''
+        return np.array([env.get_player_id() for env in self.envs], dtype=int)
+
+    def get_stats(self):
+        ''' Get the counters and the timers of the phases, summed over the
+            environments of the batch
+
+        Returns:
+            (dict): The stats in the same format as `Env.get_stats`
+        '''
+        return merge_stats([env.get_stats() for env in self.envs])
+
+    def reset_stats(self):
+        ''' Set the counters and the timers to zero
+        '''
+        for env in self.envs:
+            env.reset_stats()
+
+    def _stack_states(self):
+        ''' Stack the latest states of the batch into arrays
+
+        Returns:
+            (tuple): Tuple containing:
+
+                (numpy.array): The observations of shape (env_num, *state_shape)
+                (numpy.array): The legal action masks of shape (env_num, action_num)
+        '''
+        obs = np.stack([state['obs'] for state in self.states])
+        legal_masks = np.zeros((self.num, self.action_num), dtype=bool)
+        for i, state in enumerate(self.states):
+            legal_masks[i, state['legal_actions']] = True
+        return obs, legal_masks
+
+    def get_game_seeds(self):
+        ''' Get the seed of the current game of each environment. See
+            `seed_each_game` in `Env`
+
+        Returns:
+            (list): The seed of the game of each environment
+        '''
+        return [env.game_seed for env in self.envs]
+
+    def _seed(self, seed=None):
+        ''' Seed the environments with independent streams. Environment i
+            gets `derive_seed(seed, i)`.
+        '''
+        self.seed = seed
+        self.env_seeds = [None for _ in range(self.num)]
+        if seed is not None:
+            self.env_seeds = [env._seed(env_seed) for env, env_seed in zip(self.envs, spawn_seeds(seed, self.num))]
+        return self.env_seeds
@@ -8,18 +8,18 @@ class DoudizhuEnv(Env):
     '''
 
     def __init__(self, config):
-        from rlcard.games.doudizhu.utils import SPECIFIC_MAP, CARD_RANK_STR
-        from rlcard.games.doudizhu.utils import ACTION_LIST, ACTION_SPACE
+        from rlcard.games.doudizhu.utils import load_tables, CARD_RANK_STR
         from rlcard.games.doudizhu.utils import encode_cards
         from rlcard.games.doudizhu.utils import cards2str, cards2str_with_suit
         from rlcard.games.doudizhu import Game
         self._encode_cards = encode_cards
         self._cards2str = cards2str
         self._cards2str_with_suit = cards2str_with_suit
-        self._SPECIFIC_MAP = SPECIFIC_MAP
+        tables = load_tables()
+        self._SPECIFIC_MAP = tables['SPECIFIC_MAP']
         self._CARD_RANK_STR = CARD_RANK_STR
-        self._ACTION_LIST = ACTION_LIST
-        self._ACTION_SPACE = ACTION_SPACE
+        self._ACTION_LIST = tables['ACTION_LIST']
+        self._ACTION_SPACE = tables['ACTION_SPACE']
         
         self.name = 'doudizhu'
         self.game = Game()
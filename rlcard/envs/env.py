@@ -27,6 +27,14 @@ class Env(object):
                 'active_player' (int) - If 'singe_agent_mode' is True,
                  'active_player' specifies the player that does not use
                   pretrained models.
+                'seed_each_game' (boolean) - True if each game should be
+                 seeded with `derive_seed(seed, k)`, where k is the index of
+                 the game since the environment was seeded. The seed of the
+                 current game is `env.game_seed`, and `env._seed(game_seed)`
+                 replays the game.
+                'profile' (boolean or dict) - True if the counters and the
+                 timers of the hot paths should be kept. See `enable_profiling`.
+                 A dict is passed to `enable_profiling` as keyword arguments.
                 There can be some game specific configurations, e.g., the
                 number of players in the game. These fields should start with
                 'game_', e.g., 'game_player_num' we specify the number of
@@ -60,6 +68,10 @@ class Env(object):
         # A counter for the timesteps
         self.timestep = 0
 
+        # The extracted states of the current timestep, keyed by player id.
+        # It is cleared whenever the game moves.
+        self._state_cache = {}
+
         # Modes
         self.single_agent_mode = config['single_agent_mode']
         self.active_player = config['active_player']
@@ -74,14 +86,22 @@ class Env(object):
                     break
 
         # Set random seed, default is None
+        self.seed_each_game = config['seed_each_game']
         self._seed(config['seed'])
 
+        # Profiling is off by default, which adds no overhead
+        self.profiler = None
+        if config['profile']:
+            self.enable_profiling(**(config['profile'] if isinstance(config['profile'], dict) else {}))
+
 
     def reset(self):
         '''
         Reset environment in single-agent mode
         Call `_init_game` if not in single agent mode
         '''
+        if self.seed_each_game:
+            self._seed_game()
         if not self.single_agent_mode:
             return self._init_game()
 
@@ -97,19 +117,23 @@ class Env(object):
             if not self.game.is_over():
                 break
 
+        self._state_cache = {}
         return self._extract_state(state)
 
-    def step(self, action, raw_action=False):
+    def step(self, action, raw_action=False, observe=True):
         ''' Step forward
 
         Args:
             action (int): The action taken by the current player
             raw_action (boolean): True if the action is a raw action
+            observe (boolean): False if the next state is not needed. This
+              skips the state encoding, e.g., when traversing the game tree.
+              The state can still be obtained later with `get_state`
 
         Returns:
             (tuple): Tuple containing:
 
-                (dict): The next state
+                (dict): The next state, or None if `observe` is False
                 (int): The ID of the next player
         '''
         if not raw_action:
@@ -122,16 +146,24 @@ class Env(object):
         if self.record_action:
             self.action_recorder.append([self.get_player_id(), action])
         next_state, player_id = self.game.step(action)
+        self._state_cache = {}
+        if not observe:
+            return None, player_id
 
-        return self._extract_state(next_state), player_id
+        state = self._extract_state(next_state)
+        self._state_cache[player_id] = state
+        return self._copy_state(state), player_id
 
-    def step_back(self):
+    def step_back(self, observe=True):
         ''' Take one step backward.
 
+        Args:
+            observe (boolean): False if the previous state is not needed
+
         Returns:
             (tuple): Tuple containing:
 
-                (dict): The previous state
+                (dict): The previous state, or None if `observe` is False
                 (int): The ID of the previous player
 
         Note: Error will be raised if step back from the root node.
@@ -141,12 +173,45 @@ class Env(object):
 
         if not self.game.step_back():
             return False
+        if self.record_action:
+            self.action_recorder.pop()
+        self._state_cache = {}
 
         player_id = self.get_player_id()
+        if not observe:
+            return None, player_id
         state = self.get_state(player_id)
 
         return state, player_id
 
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the environment
+
+        Returns:
+            (tuple): A compact token that can be passed to `restore`
+
+        Note: Unlike `step_back`, this does not require allow_step_back=True.
+              It is useful for tree search, where the same node is visited
+              again after exploring each of its children.
+        '''
+        record_len = len(self.action_recorder) if self.record_action else None
+        return (self.game.snapshot(), record_len)
+
+    def restore(self, snapshot):
+        ''' Restore the environment to a snapshot
+
+        Args:
+            snapshot (tuple): A token returned by `snapshot`
+
+        Note: The state is not extracted here to keep tree search cheap. Use
+              `get_state` to obtain the restored state.
+        '''
+        game_snapshot, record_len = snapshot
+        self.game.restore(game_snapshot)
+        if self.record_action:
+            del self.action_recorder[record_len:]
+        self._state_cache = {}
+
     def set_agents(self, agents):
         '''
         Set the agents that will interact with the environment.
@@ -165,12 +230,14 @@ class Env(object):
                 self.allow_raw_data = True
                 break
 
-    def run(self, is_training=False):
+    def run(self, is_training=False, columnar=False):
         '''
         Run a complete game, either for evaluation or training RL agent.
 
         Args:
             is_training (boolean): True if for training purpose.
+            columnar (boolean): True if the transitions of each player should
+              be returned as columns of NumPy arrays. See `reorganize_columns`
 
         Returns:
             (tuple) Tuple containing:
@@ -180,10 +247,14 @@ class Env(object):
 
         Note: The trajectories are 3-dimension list. The first dimension is for different players.
               The second dimension is for different transitions. The third dimension is for the contents of each transiton
+              If `columnar` is True, the trajectories are a list of dicts of arrays, one for each player.
         '''
         if self.single_agent_mode:
             raise ValueError('Run in single agent not allowed.')
+        if columnar and any(agent.use_raw for agent in self.agents):
+            raise ValueError('Columnar trajectories do not support agents with raw actions')
 
+        agents = self.agents if self.profiler is None else self.profiler.wrap_agents(self.agents)
         trajectories = [[] for _ in range(self.player_num)]
         state, player_id = self.reset()
 
@@ -192,12 +263,12 @@ class Env(object):
         while not self.is_over():
             # Agent plays
             if not is_training:
-                action, _ = self.agents[player_id].eval_step(state)
+                action, _ = agents[player_id].eval_step(state)
             else:
-                action = self.agents[player_id].step(state)
+                action = agents[player_id].step(state)
 
             # Environment steps
-            next_state, next_player_id = self.step(action, self.agents[player_id].use_raw)
+            next_state, next_player_id = self.step(action, agents[player_id].use_raw)
             # Save action
             trajectories[player_id].append(action)
 
@@ -218,10 +289,65 @@ class Env(object):
         payoffs = self.get_payoffs()
 
         # Reorganize the trajectories
-        trajectories = reorganize(trajectories, payoffs)
+        if columnar:
+            reorganize_func = lambda trajectories, payoffs: reorganize_columns(trajectories, payoffs, self.action_num)
+        else:
+            reorganize_func = reorganize
+        if self.profiler is not None:
+            reorganize_func = self.profiler.wrap('reorganize', reorganize_func)
+        trajectories = reorganize_func(trajectories, payoffs)
 
         return trajectories, payoffs
 
+    def enable_profiling(self, cprofile_every=None, callback=None):
+        ''' Keep a counter and a cumulative timer for each phase of the games:
+            'run', 'reset', 'game_step', 'game_step_back', 'extract_state',
+            'payoffs', 'reorganize' and 'agent_i' for the inference of player
+            i in `run`. The methods are replaced by timed wrappers on this
+            instance, so `disable_profiling` removes all the overhead.
+
+        Args:
+            cprofile_every (int): If not None, one game in every
+              `cprofile_every` games is run under cProfile. The statistics
+              are returned by `self.profiler.get_cprofile_stats()`
+            callback (callable): If not None, it is called with the name of
+              the phase and the elapsed seconds after each timed call
+        '''
+        if self.profiler is not None:
+            self.disable_profiling()
+        self.profiler = Profiler(cprofile_every=cprofile_every, callback=callback)
+        self.profiler.instrument(self, 'run', 'run')
+        self.profiler.instrument(self.game, 'init_game', 'reset', before=self.profiler.start_game)
+        self.profiler.instrument(self.game, 'step', 'game_step')
+        self.profiler.instrument(self.game, 'step_back', 'game_step_back')
+        self.profiler.instrument(self, '_extract_state', 'extract_state')
+        self.profiler.instrument(self, 'get_payoffs', 'payoffs')
+
+    def disable_profiling(self):
+        ''' Restore the methods replaced by `enable_profiling`
+        '''
+        if self.profiler is not None:
+            self.profiler.uninstrument()
+            self.profiler = None
+
+    def get_stats(self):
+        ''' Get the counters and the timers of the phases
+
+        Returns:
+            (dict): A dict from the name of each phase to a dict containing
+              'count', the number of calls, and 'time', the cumulative time
+              in seconds. See `enable_profiling`
+        '''
+        if self.profiler is None:
+            raise ValueError('Profiling is off. To use get_stats, please set profile=True in rlcard.make')
+        return self.profiler.get_stats()
+
+    def reset_stats(self):
+        ''' Set the counters and the timers to zero
+        '''
+        if self.profiler is not None:
+            self.profiler.reset_stats()
+
     def is_over(self):
         ''' Check whether the curent game is over
 
@@ -240,7 +366,11 @@ class Env(object):
 
 
     def get_state(self, player_id):
-        ''' Get the state given player id
+        ''' Get the state given player id. The state is encoded at most once
+            per timestep and player. Each call returns a new dict with its
+            own copy of `obs` and `legal_actions`, so the caller may modify
+            them. The raw data, e.g., `raw_obs`, is shared and should not be
+            modified.
 
         Args:
             player_id (int): The player id
@@ -248,7 +378,30 @@ class Env(object):
         Returns:
             (numpy.array): The observed state of the player
         '''
-        return self._extract_state(self.game.get_state(player_id))
+        state = self._state_cache.get(player_id)
+        if state is None:
+            state = self._extract_state(self.game.get_state(player_id))
+            self._state_cache[player_id] = state
+        return self._copy_state(state)
+
+    @staticmethod
+    def _copy_state(state):
+        ''' Copy a cached state for a caller. Copying is much cheaper than
+            encoding the state again
+
+        Args:
+            state (dict): The cached state
+
+        Returns:
+            (dict): A shallow copy of the state, with copies of `obs` and
+              `legal_actions`
+        '''
+        state = dict(state)
+        if isinstance(state.get('obs'), np.ndarray):
+            state['obs'] = state['obs'].copy()
+        if isinstance(state.get('legal_actions'), list):
+            state['legal_actions'] = list(state['legal_actions'])
+        return state
 
     def get_payoffs(self):
         ''' Get the payoffs of players. Must be implemented in the child class.
@@ -273,8 +426,21 @@ class Env(object):
     def _seed(self, seed=None):
         self.np_random, seed = seeding.np_random(seed)
         self.game.np_random = self.np_random
+        # The root of the seeds of the games if `seed_each_game` is set
+        self.seed = seed
+        self.game_index = 0
+        self.game_seed = None
         return seed
 
+    def _seed_game(self):
+        ''' Seed the next game from the root seed and the index of the game.
+            The generator is reseeded in place, which is the same as
+            `_seed(game_seed)` for this game.
+        '''
+        self.game_seed = seeding.derive_seed(self.seed, self.game_index)
+        self.game_index += 1
+        seeding.reseed(self.np_random, self.game_seed)
+
     def _init_game(self):
         ''' Start a new game
 
@@ -287,7 +453,9 @@ class Env(object):
         state, player_id = self.game.init_game()
         if self.record_action:
             self.action_recorder = []
-        return self._extract_state(state), player_id
+        state = self._extract_state(state)
+        self._state_cache = {player_id: state}
+        return self._copy_state(state), player_id
 
     def _load_model(self):
         ''' Load pretrained/rule model
@@ -344,6 +512,7 @@ class Env(object):
         reward = 0.
         done = False
         self.timestep += 1
+        self._state_cache = {}
         state, player_id = self.game.step(action)
         while not self.game.is_over() and not player_id == self.active_player:
             self.timestep += 1
@@ -1,5 +1,5 @@
 import importlib
-from rlcard.envs import VecEnv
+from rlcard.envs import VecEnv, BatchedEnv
 
 # Default Config
 DEFAULT_CONFIG = {
@@ -9,7 +9,13 @@ DEFAULT_CONFIG = {
         'active_player' : 0,
         'record_action' : False,
         'seed': None,
+        'seed_each_game': False,
         'env_num': 1,
+        'batched': False,
+        'shared_memory': False,
+        'start_method': 'spawn',
+        'env_pool': None,
+        'profile': False,
         }
 
 class EnvSpec(object):
@@ -21,11 +27,26 @@ class EnvSpec(object):
 
         Args:
             env_id (string): The name of the environent
-            entry_point (string): A string the indicates the location of the envronment class
+            entry_point (string): A string the indicates the location of the envronment class.
+              The module is imported on the first `make`, so that registering
+              does not import the games
         '''
         self.env_id = env_id
-        mod_name, class_name = entry_point.split(':')
-        self._entry_point = getattr(importlib.import_module(mod_name), class_name)
+        if len(entry_point.split(':')) != 2:
+            raise ValueError('The entry point should be in the form module:class, got {}'.format(entry_point))
+        self.entry_point = entry_point
+        self._entry_point = None
+
+    def load_entry_point(self):
+        ''' Import the environment class
+
+        Returns:
+            (class): The environment class
+        '''
+        if self._entry_point is None:
+            mod_name, class_name = self.entry_point.split(':')
+            self._entry_point = getattr(importlib.import_module(mod_name), class_name)
+        return self._entry_point
 
     def make(self, config=DEFAULT_CONFIG):
         ''' Instantiates an instance of the environment
@@ -34,7 +55,7 @@ class EnvSpec(object):
             env (Env): An instance of the environemnt
             config (dict): A dictionary of the environment settings
         '''
-        env = self._entry_point(config)
+        env = self.load_entry_point()(config)
         return env
 
 class EnvRegistry(object):
@@ -98,5 +119,7 @@ def make(env_id, config={}):
         raise ValueError('Active player should be a non-negative integer')
     if _config['env_num'] == 1:
         return registry.make(env_id, _config)
+    elif _config['batched']:
+        return BatchedEnv(env_id, _config)
     else:
         return VecEnv(env_id, _config)
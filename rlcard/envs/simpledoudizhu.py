@@ -10,11 +10,11 @@ class SimpleDoudizhuEnv(Env):
         from rlcard.games.simpledoudizhu import Game
         from rlcard.games.doudizhu.utils import encode_cards
         from rlcard.games.doudizhu.utils import cards2str
-        from rlcard.games.doudizhu.utils import SPECIFIC_MAP, CARD_RANK_STR
+        from rlcard.games.doudizhu.utils import load_tables, CARD_RANK_STR
         from rlcard.games.simpledoudizhu.utils import ACTION_LIST, ACTION_SPACE
         self._encode_cards = encode_cards
         self._cards2str = cards2str
-        self._SPECIFIC_MAP = SPECIFIC_MAP
+        self._SPECIFIC_MAP = load_tables()['SPECIFIC_MAP']
         self._CARD_RANK_STR = CARD_RANK_STR
         self._ACTION_LIST = ACTION_LIST
         self._ACTION_SPACE = ACTION_SPACE
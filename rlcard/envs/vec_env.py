@@ -3,8 +3,73 @@ A wrapper for running multiple environments with multiple processes
 Reference: https://github.com/openai/baselines/blob/master/baselines/common/vec_env/subproc_vec_env.py
 '''
 import multiprocessing as mp
+import weakref
+import numpy as np
 
-from rlcard.utils import reorganize
+from rlcard.utils import reorganize, reorganize_columns, concatenate_columns, Profiler, merge_stats
+from rlcard.utils.seeding import spawn_seeds
+
+class EnvPool(object):
+    '''
+    A pool of worker processes. Each worker holds one environment. A pool
+    can be created once and shared by several `VecEnv`, so that the
+    workers are not spawned again for every run.
+    '''
+
+    def __init__(self, env_id, config, num=None):
+        ''' Initialize the EnvPool class
+
+        Args:
+            env_id (string): The id of the environment, e.g., 'blackjack'
+            config (dict): The same as the config in Env. `start_method`
+              can be 'spawn', 'fork' or 'forkserver'
+            num (int): The number of workers. Default is `env_num` in config
+        '''
+        from rlcard.envs.registration import registry
+        self.env_id = env_id
+        self.num = num if num is not None else config['env_num']
+        start_method = config['start_method']
+        ctx = mp.get_context(start_method)
+
+        # With fork, the environment is built once and inherited by the
+        # workers, e.g., the Doudizhu tables are loaded only once and their
+        # pages are shared. With forkserver, the environment module is
+        # imported once in the server.
+        template = None
+        if start_method == 'fork':
+            template = registry.make(env_id, config)
+        elif start_method == 'forkserver':
+            ctx.set_forkserver_preload(['rlcard', registry.env_specs[env_id].entry_point.split(':')[0]])
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(self.num)])
+        self.ps = [ctx.Process(target=worker, args=(work_remote, remote, env_id, config, template))
+                    for (work_remote, remote) in zip(self.work_remotes, self.remotes)]
+        for p in self.ps:
+            p.daemon = True  # if the main process crashes, we should not cause things to hang
+            p.start()
+        for remote in self.work_remotes:
+            remote.close()
+
+        # Get the number of players/actions/state_shape in this game
+        self.remotes[0].send(('info', None))
+        self.player_num, self.action_num, self.state_shape = self.remotes[0].recv()
+        self.closed = False
+
+    def close(self):
+        ''' Stop all the workers
+        '''
+        if self.closed:
+            return
+        self.closed = True
+        for remote in self.remotes:
+            try:
+                remote.send(('close', None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for p in self.ps:
+            p.join()
+        for remote in self.remotes:
+            remote.close()
 
 class VecEnv(object):
     '''
@@ -18,38 +83,68 @@ class VecEnv(object):
 
         Args:
             env_id (string): The id of the environment, e.g., 'blackjack'
-            config (dict): The same as the config in Env
+            config (dict): The same as the config in Env. If `env_pool` is
+              an EnvPool, its workers are used instead of new processes
         '''
         self.num = config['env_num']
 
         # For multiprocessing
-        ctx = mp.get_context('spawn')
-        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(self.num)])
-        self.ps = [ctx.Process(target=worker, args=(work_remote, remote, env_id, config))
-                    for (work_remote, remote) in zip(self.work_remotes, self.remotes)]
-        for p in self.ps:
-            p.daemon = True  # if the main process crashes, we should not cause things to hang
-            p.start()
-        for remote in self.work_remotes:
-            remote.close()
+        self.pool = config['env_pool']
+        self._owns_pool = self.pool is None
+        if self._owns_pool:
+            self.pool = EnvPool(env_id, config)
+            weakref.finalize(self, self.pool.close)
+        elif self.pool.env_id != env_id or self.pool.num < self.num:
+            raise ValueError('The pool should have at least {} workers of {}'.format(self.num, env_id))
+        if self.pool.closed:
+            raise ValueError('The pool is closed')
+        self.remotes = self.pool.remotes[:self.num]
+        self.ps = self.pool.ps[:self.num]
 
         # A counter for the timesteps
         self.timestep = 0
 
         # Get the number of players/actions/state_shape in this game
-        self.remotes[0].send(('info', None))
-        self.player_num, self.action_num, self.state_shape = self.remotes[0].recv()
+        self.player_num = self.pool.player_num
+        self.action_num = self.pool.action_num
+        self.state_shape = self.pool.state_shape
+
+        # Optionally transport the observations through shared memory
+        self.shared = None
+        if config['shared_memory']:
+            self._init_shared_memory()
 
         self._seed(config['seed'])
 
+        # The inference of the agents and the waiting for the workers are
+        # timed in this process. The workers time their own environments
+        self.profiler = None
+        if config['profile']:
+            self.profiler = Profiler(**(config['profile'] if isinstance(config['profile'], dict) else {}))
+
+    def close(self):
+        ''' Release the shared memory, and stop the workers if the pool
+            is not shared with other environments
+        '''
+        if self.shared is not None:
+            if not self.pool.closed:
+                send_command_to_all(self.remotes, ('detach', None))
+            self._release_shared_memory()
+            self.shared = None
+        if self._owns_pool:
+            self.pool.close()
+
     def set_agents(self, agents):
         self.agents = agents
 
-    def run(self, is_training=False):
+    def run(self, is_training=False, columnar=False):
         ''' Run X complete games, where X is the number of environemnts.
             The input/output are similar to Env. The difference is that
             The transitions for each player are stacked over the environments
         '''
+        if columnar and any(agent.use_raw for agent in self.agents):
+            raise ValueError('Columnar trajectories do not support agents with raw actions')
+        agents, step_workers, reorganize_func = self._get_timed_funcs(columnar)
         trajectories = [[[] for _ in range(self.player_num)] for _ in range(self.num)]
         ready_trajectories = [None for _ in range(self.num)]
         active_remotes = [remote for remote in self.remotes]
@@ -59,31 +154,25 @@ class VecEnv(object):
         # Reset
         states = []
         player_ids = []
-        for state, player_id in send_command_to_all(active_remotes, ('reset', None)):
-            states.append(state)
+        for i, (state, player_id) in enumerate(send_command_to_all(active_remotes, ('reset', None))):
+            states.append(self._unpack_state(mapping[i], state))
             player_ids.append(player_id)
         for i in range(active_num):
             trajectories[i][player_ids[i]].append(states[i])
 
         # Loop until all the environments are over
         while active_num > 0:
-            # Agent playes
-            # TODO: Currently we naively feed one obs to the agent. This can be improved via batch
+            # Agent playes. The states of each agent are fed as one batch
+            actions = batch_agents_step(agents, states, player_ids, is_training)
             commands = []
-            actions = []
             for i in range(active_num):
-                opt = 'raw_step' if self.agents[player_ids[i]].use_raw else 'step'
-                if not is_training:
-                    action, _ = self.agents[player_ids[i]].eval_step(states[i])
-                else:
-                    action = self.agents[player_ids[i]].step(states[i])
-                commands.append((opt, action))
-                actions.append(action)
+                opt = 'step_raw' if self.agents[player_ids[i]].use_raw else 'step'
+                commands.append((opt, actions[i]))
 
             # Environment steps
             next_states, next_player_ids, dones = [], [], []
-            for next_state, next_player_id, done in send_commands_to_all(active_remotes, commands):
-                next_states.append(next_state)
+            for i, (next_state, next_player_id, done) in enumerate(step_workers(active_remotes, commands)):
+                next_states.append(self._unpack_state(mapping[i], next_state))
                 next_player_ids.append(next_player_id)
                 dones.append(done)
 
@@ -102,7 +191,7 @@ class VecEnv(object):
                     # Add a final state to all the players
                     for j in range(self.player_num):
                         active_remotes[i].send(('get_state', j))
-                        trajectories[i][j].append(active_remotes[i].recv())
+                        trajectories[i][j].append(self._unpack_state(mapping[i], active_remotes[i].recv()))
 
                     # Save the ready trajectories and mark them as finished
                     ready_trajectories[mapping[i]] = trajectories[i]
@@ -124,8 +213,14 @@ class VecEnv(object):
         # Payoffs
         payoffs = send_command_to_all(self.remotes, ('get_payoffs', None))
 
+        if columnar:
+            for i in range(self.num):
+                ready_trajectories[i] = reorganize_func(ready_trajectories[i], payoffs[i])
+            trajectories = [concatenate_columns([trs[i] for trs in ready_trajectories]) for i in range(self.player_num)]
+            return trajectories, payoffs
+
         for i in range(self.num):
-            ready_trajectories[i] = reorganize(ready_trajectories[i], payoffs[i])
+            ready_trajectories[i] = reorganize_func(ready_trajectories[i], payoffs[i])
 
         trajectories = [[] for _ in range(self.player_num)]
         for trs in ready_trajectories:
@@ -133,12 +228,287 @@ class VecEnv(object):
                 trajectories[i].extend(trs[i])
         return trajectories, payoffs
 
+    def rollout(self, num_transitions=None, is_training=False):
+        ''' Keep all the environments busy and yield the games as soon as
+            they are over. Unlike `run`, the environment of a finished game
+            is reset immediately without waiting for the others.
+
+        Args:
+            num_transitions (int): Stop after yielding at least this number
+              of transitions of all the players. If None, the games are
+              generated until the caller stops iterating.
+            is_training (boolean): True if for training purpose.
+
+        Yields:
+            (tuple) Tuple containing:
+
+                (list): The transitions of each player in the finished game,
+                  in the same format as the trajectories returned by `Env.run`
+                (list): The payoffs of the finished game
+
+        Note: Every call starts new games in all the environments. The games
+              that are still being played when the generator stops are dropped.
+        '''
+        agents, step_workers, reorganize_func = self._get_timed_funcs()
+        trajectories = [None for _ in range(self.num)]
+        states = [None for _ in range(self.num)]
+        player_ids = [None for _ in range(self.num)]
+        for i, (state, player_id) in enumerate(send_command_to_all(self.remotes, ('reset', None))):
+            self._start_trajectory(trajectories, states, player_ids, i, state, player_id)
+
+        counter = 0
+        while True:
+            # Agent playes
+            actions = batch_agents_step(agents, states, player_ids, is_training)
+            commands = []
+            for i in range(self.num):
+                opt = 'step_raw' if self.agents[player_ids[i]].use_raw else 'step'
+                commands.append((opt, actions[i]))
+
+            # Environment steps
+            results = [(self._unpack_state(i, next_state), next_player_id, done)
+                       for i, (next_state, next_player_id, done) in enumerate(step_workers(self.remotes, commands))]
+            self.timestep += self.num
+
+            for i, (next_state, next_player_id, done) in enumerate(results):
+                trajectories[i][player_ids[i]].append(actions[i])
+                if not done:
+                    states[i], player_ids[i] = next_state, next_player_id
+                    trajectories[i][next_player_id].append(next_state)
+                    continue
+
+                # Add a final state to all the players
+                for j in range(self.player_num):
+                    self.remotes[i].send(('get_state', j))
+                    trajectories[i][j].append(self._unpack_state(i, self.remotes[i].recv()))
+                self.remotes[i].send(('get_payoffs', None))
+                payoffs = self.remotes[i].recv()
+                transitions = reorganize_func(trajectories[i], payoffs)
+
+                # Start a new game in this environment right away
+                self.remotes[i].send(('reset', None))
+                state, player_id = self.remotes[i].recv()
+                self._start_trajectory(trajectories, states, player_ids, i, state, player_id)
+
+                yield transitions, payoffs
+                counter += sum([len(ts) for ts in transitions])
+                if num_transitions is not None and counter >= num_transitions:
+                    return
+
+    def get_stats(self):
+        ''' Get the counters and the timers of the phases, summed over the
+            workers. The phases of this process are 'agent_i', 'workers',
+            i.e., waiting for the workers to step, and 'reorganize'. See
+            `Env.enable_profiling` for the phases of the workers.
+
+        Returns:
+            (dict): The stats in the same format as `Env.get_stats`
+        '''
+        return merge_stats([self._get_main_stats()] + self.get_worker_stats())
+
+    def get_worker_stats(self):
+        ''' Get the counters and the timers of each worker
+
+        Returns:
+            (list): The stats of the environment of each worker
+        '''
+        self._get_main_stats()
+        return send_command_to_all(self.remotes, ('get_stats', None))
+
+    def reset_stats(self):
+        ''' Set the counters and the timers to zero in this process and in
+            the workers
+        '''
+        if self.profiler is not None:
+            self.profiler.reset_stats()
+            send_command_to_all(self.remotes, ('reset_stats', None))
+
+    def _get_main_stats(self):
+        if self.profiler is None:
+            raise ValueError('Profiling is off. To use get_stats, please set profile=True in rlcard.make')
+        return self.profiler.get_stats()
+
+    def _get_timed_funcs(self, columnar=False):
+        ''' Return the agents, the function that steps the workers and the
+            function that reorganizes a game, which are timed if profiling
+            is on
+        '''
+        if columnar:
+            reorganize_func = lambda trajectories, payoffs: reorganize_columns(trajectories, payoffs, self.action_num)
+        else:
+            reorganize_func = reorganize
+        if self.profiler is None:
+            return self.agents, send_commands_to_all, reorganize_func
+        return (self.profiler.wrap_agents(self.agents),
+                self.profiler.wrap('workers', send_commands_to_all),
+                self.profiler.wrap('reorganize', reorganize_func))
+
+    def _start_trajectory(self, trajectories, states, player_ids, index, state, player_id):
+        ''' Record the first state of a new game in the environment of index
+        '''
+        state = self._unpack_state(index, state)
+        trajectories[index] = [[] for _ in range(self.player_num)]
+        trajectories[index][player_id].append(state)
+        states[index] = state
+        player_ids[index] = player_id
+
+    def _init_shared_memory(self):
+        ''' Allocate the shared memory blocks for the observations and the
+            legal action masks, and attach all the workers to them. Each
+            environment writes into its own slot, so that only a small
+            header is sent through the pipes.
+        '''
+        from multiprocessing import shared_memory
+
+        self.remotes[0].send(('obs_spec', None))
+        obs_shape, obs_dtype = self.remotes[0].recv()
+        obs_dtype = np.dtype(obs_dtype)
+        obs_size = int(np.prod(obs_shape)) * obs_dtype.itemsize * self.num
+        mask_size = self.action_num * self.num
+
+        obs_shm = shared_memory.SharedMemory(create=True, size=max(obs_size, 1))
+        mask_shm = shared_memory.SharedMemory(create=True, size=max(mask_size, 1))
+        self.shared = SharedBuffers(obs_shm, mask_shm, self.num, obs_shape, obs_dtype, self.action_num)
+
+        # Destroy the blocks once the VecEnv is closed or garbage collected
+        self._release_shared_memory = weakref.finalize(self, self.shared.close, True)
+
+        commands = [('attach', (obs_shm.name, mask_shm.name, self.num, i, obs_shape, obs_dtype.str, self.action_num))
+                    for i in range(self.num)]
+        send_commands_to_all(self.remotes, commands)
+
+    def _unpack_state(self, index, state):
+        ''' Rebuild the state sent by the worker
+
+        Args:
+            index (int): The index of the environment
+            state (dict): The state or the header sent by the worker
+
+        Returns:
+            (dict): The state
+        '''
+        if self.shared is None:
+            return state
+        return self.shared.read(index, state)
+
+    def get_game_seeds(self):
+        ''' Get the seed of the current or the last game of each worker. See
+            `seed_each_game` in `Env`. Together with `worker_seeds`, it
+            allows to replay any game of a run.
+
+        Returns:
+            (list): The seed of the game of each worker, or None if
+              `seed_each_game` is not set
+        '''
+        return send_command_to_all(self.remotes, ('get_game_seed', None))
+
     def _seed(self, seed=None):
-        seeds = [None for _ in range(self.num)]
+        ''' Seed the workers with independent streams. Worker i gets
+            `derive_seed(seed, i)`.
+        '''
+        self.seed = seed
+        self.worker_seeds = [None for _ in range(self.num)]
         if seed is not None:
-            commands = [('seed', seed+i*1000) for i in range(self.num)]
-            seeds = send_commands_to_all(self.remotes, commands)
-        return seeds
+            commands = [('seed', worker_seed) for worker_seed in spawn_seeds(seed, self.num)]
+            self.worker_seeds = send_commands_to_all(self.remotes, commands)
+        return self.worker_seeds
+
+class SharedBuffers(object):
+    ''' The views on the shared memory blocks that hold the observations
+        and the legal action masks of all the environments
+    '''
+
+    def __init__(self, obs_shm, mask_shm, num, obs_shape, obs_dtype, action_num):
+        ''' Initialize the views
+
+        Args:
+            obs_shm (SharedMemory): The block for the observations
+            mask_shm (SharedMemory): The block for the legal action masks
+            num (int): The number of environments
+            obs_shape (list): The shape of a single observation
+            obs_dtype (numpy.dtype): The data type of the observations
+            action_num (int): The number of actions
+        '''
+        self.obs_shm = obs_shm
+        self.mask_shm = mask_shm
+        self.obs = np.ndarray([num] + list(obs_shape), dtype=obs_dtype, buffer=obs_shm.buf)
+        self.legal_masks = np.ndarray((num, action_num), dtype=bool, buffer=mask_shm.buf)
+
+    def write(self, index, state):
+        ''' Write a state into the slot of an environment
+
+        Args:
+            index (int): The index of the environment
+            state (dict): The extracted state
+
+        Returns:
+            (dict): The remaining entries of the state, such as the raw data,
+              that should be sent through the pipe
+        '''
+        self.obs[index] = state['obs']
+        self.legal_masks[index] = False
+        self.legal_masks[index, state['legal_actions']] = True
+        return {key: state[key] for key in state if key not in ('obs', 'legal_actions')}
+
+    def read(self, index, header):
+        ''' Read a state from the slot of an environment
+
+        Args:
+            index (int): The index of the environment
+            header (dict): The remaining entries sent through the pipe
+
+        Returns:
+            (dict): The state
+        '''
+        state = {'obs': self.obs[index].copy(),
+                 'legal_actions': np.flatnonzero(self.legal_masks[index]).tolist()}
+        state.update(header)
+        return state
+
+    def close(self, unlink=False):
+        ''' Release the views and the shared memory blocks
+
+        Args:
+            unlink (boolean): True if the blocks should be destroyed
+        '''
+        self.obs = self.legal_masks = None
+        for shm in (self.obs_shm, self.mask_shm):
+            shm.close()
+            if unlink:
+                shm.unlink()
+
+def batch_agents_step(agents, states, player_ids, is_training=False):
+    ''' Predict the actions of a batch of states. The states are grouped by
+        the acting player, so that each agent is called once per batch. An
+        agent can implement `batch_step(states)` and `batch_eval_step(states)`
+        to make a single forward pass. Otherwise, `step`/`eval_step` is
+        called on each state.
+
+    Args:
+        agents (list): The agents of the players
+        states (list): A list of states
+        player_ids (list): The ID of the acting player of each state
+        is_training (boolean): True if for training purpose
+
+    Returns:
+        (list): The action of each state
+    '''
+    actions = [None for _ in range(len(states))]
+    for player_id in sorted(set(player_ids)):
+        indices = [i for i, p in enumerate(player_ids) if p == player_id]
+        agent = agents[player_id]
+        player_states = [states[i] for i in indices]
+        if is_training and hasattr(agent, 'batch_step'):
+            player_actions = agent.batch_step(player_states)
+        elif not is_training and hasattr(agent, 'batch_eval_step'):
+            player_actions, _ = agent.batch_eval_step(player_states)
+        elif is_training:
+            player_actions = [agent.step(state) for state in player_states]
+        else:
+            player_actions = [agent.eval_step(state)[0] for state in player_states]
+        for i, action in zip(indices, player_actions):
+            actions[i] = action
+    return actions
 
 def send_commands_to_all(remotes, commands):
     results = []
@@ -156,37 +526,85 @@ def send_command_to_all(remotes, command):
         results.append(remote.recv())
     return results
 
-def worker(remote, parent_remote, env_id, config):
+def worker(remote, parent_remote, env_id, config, template=None):
+    shared = None
+    def pack_state(state):
+        if shared is None:
+            return state
+        return shared.write(index, state)
     def step_env(env, action, use_raw):
         state, player_id = env.step(action, use_raw)
         done = env.is_over()
-        return state, player_id, done
-    from rlcard.envs.registration import registry
-    env = registry.make(env_id, config)
+        return pack_state(state), player_id, done
+    if template is not None:
+        # The environment is inherited from the parent process, so that
+        # the random state is renewed for each worker
+        env = template
+        env._seed(config['seed'])
+    else:
+        from rlcard.envs.registration import registry
+        env = registry.make(env_id, config)
     parent_remote.close()
     try:
         while True:
             cmd, data = remote.recv()
             if cmd == 'reset':
-                remote.send(env.reset())
+                state, player_id = env.reset()
+                remote.send((pack_state(state), player_id))
             elif cmd == 'step_raw':
                 remote.send(step_env(env, data, True))
             elif cmd == 'step':
                 remote.send(step_env(env, data, False))
             elif cmd == 'seed':
                 remote.send(env._seed(data))
+            elif cmd == 'get_game_seed':
+                remote.send(env.game_seed)
             elif cmd == 'get_state':
-                remote.send(env.get_state(data))
+                remote.send(pack_state(env.get_state(data)))
             elif cmd == 'get_payoffs':
                 remote.send(env.get_payoffs())
+            elif cmd == 'get_stats':
+                # The workers of a shared pool may not be profiled
+                remote.send(env.get_stats() if env.profiler is not None else {})
+            elif cmd == 'reset_stats':
+                env.reset_stats()
+                remote.send(None)
             elif cmd == 'info':
-                remote.send((env.player_num, env.action_num, env.state_shape))
+                remote.send((env.player_num, env.action_num, get_state_shape(env)))
+            elif cmd == 'obs_spec':
+                obs = env.reset()[0]['obs']
+                remote.send((list(obs.shape), obs.dtype.str))
+            elif cmd == 'attach':
+                obs_name, mask_name, num, index, obs_shape, obs_dtype, action_num = data
+                from multiprocessing import shared_memory
+                shared = SharedBuffers(shared_memory.SharedMemory(name=obs_name),
+                                       shared_memory.SharedMemory(name=mask_name), num, obs_shape, np.dtype(obs_dtype), action_num)
+                remote.send(None)
+            elif cmd == 'detach':
+                if shared is not None:
+                    shared.close()
+                    shared = None
+                remote.send(None)
             elif cmd == 'close':
                 remote.close()
                 break
             else:
                 raise NotImplementedError
+    except (EOFError, BrokenPipeError):
+        # The main process has exited
+        pass
     except KeyboardInterrupt:
         print('SubprocVecEnv worker: got KeyboardInterrupt')
     finally:
+        if shared is not None:
+            shared.close()
         del env
+
+def get_state_shape(env):
+    ''' Get the state shape of an environment. Some environments, such as
+        Limit Hold'em, do not define `state_shape`, so that it is inferred
+        from an observation.
+    '''
+    if getattr(env, 'state_shape', None) is not None:
+        return env.state_shape
+    return list(env.reset()[0]['obs'].shape)
@@ -28,3 +28,22 @@ class BlackjackDealer(object):
         '''
         card = self.deck.pop()
         player.hand.append(card)
+
+    def snapshot(self):
+        ''' Take a snapshot of the dealer
+
+        Returns:
+            (tuple): An immutable record of the remaining deck, the hand,
+              the status and the score of the dealer
+        '''
+        return (tuple(self.deck), tuple(self.hand), self.status, self.score)
+
+    def restore(self, snapshot):
+        ''' Restore the dealer from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        deck, hand, self.status, self.score = snapshot
+        self.deck = list(deck)
+        self.hand = list(hand)
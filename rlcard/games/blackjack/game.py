@@ -1,4 +1,3 @@
-from copy import deepcopy
 import numpy as np
 
 from rlcard.games.blackjack import Dealer
@@ -63,10 +62,7 @@ class BlackjackGame(object):
             int: next plater's id
         '''
         if self.allow_step_back:
-            p = deepcopy(self.players[self.game_pointer])
-            d = deepcopy(self.dealer)
-            w = deepcopy(self.winner)
-            self.history.append((d, p, w))
+            self.history.append(self.snapshot())
 
         next_state = {}
         # Play hit
@@ -111,12 +107,36 @@ class BlackjackGame(object):
         Returns:
             Status (bool): check if the step back is success or not
         '''
-        #while len(self.history) > 0:
         if len(self.history) > 0:
-            self.dealer, self.players[self.game_pointer], self.winner = self.history.pop()
+            self.restore(self.history.pop())
             return True
         return False
 
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            snapshot (tuple): a compact and immutable record of the game
+        '''
+        return (self.dealer.snapshot(),
+                tuple(p.snapshot() for p in self.players),
+                tuple(self.winner.items()),
+                self.game_pointer,
+                len(self.history))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): a record returned by `snapshot`
+        '''
+        d, ps, w, self.game_pointer, history_len = snapshot
+        self.dealer.restore(d)
+        for player, player_snapshot in zip(self.players, ps):
+            player.restore(player_snapshot)
+        self.winner = dict(w)
+        del self.history[history_len:]
+
     def get_player_num(self):
         ''' Return the number of players in blackjack
 
@@ -17,3 +17,20 @@ class BlackjackPlayer(object):
         ''' Return player's id
         '''
         return self.player_id
+
+    def snapshot(self):
+        ''' Take a snapshot of the player
+
+        Returns:
+            (tuple): An immutable record of the hand, status and score of the player
+        '''
+        return (tuple(self.hand), self.status, self.score)
+
+    def restore(self, snapshot):
+        ''' Restore the player from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        hand, self.status, self.score = snapshot
+        self.hand = list(hand)
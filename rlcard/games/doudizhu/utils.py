@@ -3,6 +3,9 @@
 
 import os
 import json
+import pickle
+import hashlib
+import tempfile
 from collections import OrderedDict
 import threading
 import collections
@@ -11,24 +14,138 @@ import rlcard
 
 # Read required docs
 ROOT_PATH = rlcard.__path__[0]
+JSON_DIR = os.path.join(ROOT_PATH, 'games/doudizhu/jsondata')
+
+# The tables below are loaded on first use by `load_tables`, which also sets
+# them as attributes of the module. From Python 3.7, importing them, e.g.,
+# `from rlcard.games.doudizhu.utils import SPECIFIC_MAP`, loads them too. The
+# code of the package uses `load_tables` so that it runs on Python 3.6
+#   SPECIFIC_MAP: a map of action to abstract action
+#   ACTION_SPACE: a map of abstract action to its index
+#   ACTION_LIST: a list of abstract action
+#   CARD_TYPE: a map of card to its type. Also return both dict and list to accelerate
+#   TYPE_CARD: a map of type to its cards
+TABLE_NAMES = ('SPECIFIC_MAP', 'ACTION_SPACE', 'ACTION_LIST', 'CARD_TYPE', 'TYPE_CARD')
+TABLE_FILES = {'SPECIFIC_MAP': 'specific_map.json',
+               'ACTION_SPACE': 'action_space.json',
+               'CARD_TYPE': 'card_type.json',
+               'TYPE_CARD': 'type_card.json'}
+# Increase it when the format of the compiled tables changes
+TABLE_FORMAT_VERSION = 1
+
+_tables = None
+_tables_lock = threading.Lock()
+
+def __getattr__(name):
+    if name in TABLE_NAMES:
+        return load_tables()[name]
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def load_tables():
+    ''' Load the tables of actions and card types. Parsing the JSON files
+        is slow, so they are compiled once into a pickle in the cache
+        directory (see `get_cache_dir`), which is loaded by the other
+        processes. The strings and the lists are shared within the tables,
+        so the tables should not be modified.
 
-# a map of action to abstract action
-with open(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/specific_map.json'), 'r') as file:
-    SPECIFIC_MAP = json.load(file, object_pairs_hook=OrderedDict)
-
-# a map of abstract action to its index and a list of abstract action
-with open(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/action_space.json'), 'r') as file:
-    ACTION_SPACE = json.load(file, object_pairs_hook=OrderedDict)
-    ACTION_LIST = list(ACTION_SPACE.keys())
+    Returns:
+        (dict): The tables, keyed by their names in `TABLE_NAMES`
+    '''
+    global _tables
+    if _tables is not None:
+        return _tables
+    with _tables_lock:
+        if _tables is None:
+            tables = _load_compiled_tables()
+            tables['ACTION_LIST'] = list(tables['ACTION_SPACE'])
+            card_type = tables['CARD_TYPE']
+            tables['CARD_TYPE'] = (card_type, list(card_type), set(card_type))
+            globals().update(tables)
+            _tables = tables
+    return _tables
+
+def get_cache_dir():
+    ''' Get the directory of the compiled tables. It is `RLCARD_CACHE_DIR`
+        if set, or `rlcard` in the user cache directory.
+
+        The tables are unpickled from this directory, and unpickling a file
+        can run arbitrary code. So the directory must only be writable by
+        trusted users, i.e., it should not be shared with other users.
 
-# a map of card to its type. Also return both dict and list to accelerate
-with open(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/card_type.json'), 'r') as file:
-    data = json.load(file, object_pairs_hook=OrderedDict)
-    CARD_TYPE = (data, list(data), set(data))
+    Returns:
+        (str): The path of the directory
+    '''
+    if os.environ.get('RLCARD_CACHE_DIR'):
+        return os.environ['RLCARD_CACHE_DIR']
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'rlcard')
+
+def _load_compiled_tables():
+    ''' Load the compiled tables from the cache, or compile them if the
+        cache is missing or out of date
+    '''
+    # The name depends on the JSON files, so that a changed file is compiled again
+    fingerprint = hashlib.sha1()
+    fingerprint.update('{} {}'.format(TABLE_FORMAT_VERSION, pickle.HIGHEST_PROTOCOL).encode())
+    for name in sorted(TABLE_FILES):
+        stat = os.stat(os.path.join(JSON_DIR, TABLE_FILES[name]))
+        fingerprint.update('{} {} {}'.format(name, stat.st_size, stat.st_mtime_ns).encode())
+    cache_path = os.path.join(get_cache_dir(), 'doudizhu_tables_{}.pkl'.format(fingerprint.hexdigest()[:16]))
+
+    # A missing or a truncated file is compiled again
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    tables = compile_tables()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temporary file first so that other processes never
+        # read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        # The tables still work without the cache, e.g., on a read-only disk
+        pass
+    return tables
+
+def compile_tables():
+    ''' Parse the JSON files into the tables. Equal strings and lists are
+        replaced by a single object, which makes the pickle several times
+        smaller and faster to load than the JSON files.
 
-# a map of type to its cards
-with open(os.path.join(ROOT_PATH, 'games/doudizhu/jsondata/type_card.json'), 'r') as file:
-    TYPE_CARD = json.load(file, object_pairs_hook=OrderedDict)
+    Returns:
+        (dict): SPECIFIC_MAP, ACTION_SPACE, CARD_TYPE (the map only) and TYPE_CARD
+    '''
+    objects = {}
+    def intern(value):
+        if isinstance(value, list):
+            value = [intern(item) for item in value]
+            # The items are already shared, so equal lists have equal ids
+            key = ('list',) + tuple(map(id, value))
+        else:
+            key = value
+        return objects.setdefault(key, value)
+
+    tables = {}
+    for name, file_name in TABLE_FILES.items():
+        with open(os.path.join(JSON_DIR, file_name), 'r') as file:
+            data = json.load(file)
+        if name == 'TYPE_CARD':
+            tables[name] = {intern(card_type): {intern(rank): [intern(cards) for cards in cards_list]
+                                                for rank, cards_list in ranks.items()}
+                            for card_type, ranks in data.items()}
+        else:
+            tables[name] = {intern(key): intern(value) for key, value in data.items()}
+    return tables
 
 # rank list of solo character of cards
 CARD_RANK_STR = ['3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K',
@@ -127,12 +244,13 @@ def get_optimal_action(probs, legal_actions, np_random):
     Returns:
         str: optimal legal action
     '''
-    abstract_actions = [SPECIFIC_MAP[action] for action in legal_actions]
+    tables = load_tables()
+    abstract_actions = [tables['SPECIFIC_MAP'][action] for action in legal_actions]
     action_probs = []
     for actions in abstract_actions:
         max_prob = -1
         for action in actions:
-            prob = probs[ACTION_SPACE[action]]
+            prob = probs[tables['ACTION_SPACE'][action]]
             if prob > max_prob:
                 max_prob = prob
         action_probs.append(max_prob)
@@ -262,7 +380,8 @@ def get_gt_cards(player, greater_player):
     gt_cards = ['pass']
     current_hand = cards2str(player.current_hand)
     target_cards = greater_player.played_cards
-    target_types = CARD_TYPE[0][target_cards]
+    tables = load_tables()
+    target_types = tables['CARD_TYPE'][0][target_cards]
     type_dict = {}
     for card_type, weight in target_types:
         if card_type not in type_dict:
@@ -273,7 +392,7 @@ def get_gt_cards(player, greater_player):
     if 'bomb' not in type_dict:
         type_dict['bomb'] = -1
     for card_type, weight in type_dict.items():
-        candidate = TYPE_CARD[card_type]
+        candidate = tables['TYPE_CARD'][card_type]
         for can_weight, cards_list in candidate.items():
             if int(can_weight) > int(weight):
                 for cards in cards_list:
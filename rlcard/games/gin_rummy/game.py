@@ -4,6 +4,7 @@
     Date created: 2/12/2020
 '''
 
+import copy
 import numpy as np
 
 from rlcard.core import Game
@@ -12,6 +13,7 @@ from .player import GinRummyPlayer
 from .round import GinRummyRound
 from .judge import GinRummyJudge
 from .utils.settings import Settings, DealerForRound
+from .utils import utils
 
 from .utils.action_event import *
 
@@ -79,6 +81,38 @@ class GinRummyGame(Game):
         '''
         raise NotImplementedError
 
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): A copy of the round and the number of actions taken
+        '''
+        return (self._copy_round(self.round), len(self.actions))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        saved_round, actions_num = snapshot
+        # The saved round is copied again so that the snapshot can be restored several times
+        self.round = self._copy_round(saved_round)
+        del self.actions[actions_num:]
+
+    def _copy_round(self, game_round):
+        ''' Copy a round, sharing the cards of the deck and the random generator
+
+        Args:
+            game_round (GinRummyRound): The round to copy
+
+        Returns:
+            (GinRummyRound): The copy of the round
+        '''
+        memo = {id(card): card for card in utils.get_deck()}
+        memo[id(self.np_random)] = self.np_random
+        return copy.deepcopy(game_round, memo)
+
     def get_player_num(self):
         ''' Return the number of players in the game
         '''
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import copy
 
 from rlcard.games.leducholdem import Dealer
 from rlcard.games.leducholdem import Player
@@ -102,16 +101,8 @@ class LeducholdemGame(Game):
                 (int): next plater's id
         '''
         if self.allow_step_back:
-            # First snapshot the current state
-            r = copy(self.round)
-            r_raised = copy(self.round.raised)
-            gp = self.game_pointer
-            r_c = self.round_counter
-            d_deck = copy(self.dealer.deck)
-            p = copy(self.public_card)
-            ps = [copy(self.players[i]) for i in range(self.num_players)]
-            ps_hand = [copy(self.players[i].hand) for i in range(self.num_players)]
-            self.history.append((r, r_raised, gp, r_c, d_deck, p, ps, ps_hand))
+            # Only record the fields that this action can change
+            self.history.append(self._get_undo_record())
 
         # Then we proceed to the next round
         self.game_pointer = self.round.proceed_round(self.players, action)
@@ -179,14 +170,62 @@ class LeducholdemGame(Game):
             (bool): True if the game steps back successfully
         '''
         if len(self.history) > 0:
-            self.round, r_raised, self.game_pointer, self.round_counter, d_deck, self.public_card, self.players, ps_hand = self.history.pop()
-            self.round.raised = r_raised
-            self.dealer.deck = d_deck
-            for i, hand in enumerate(ps_hand):
-                self.players[i].hand = hand
+            self._undo(self.history.pop())
             return True
         return False
 
+    def _get_undo_record(self):
+        ''' Record the fields that the next action can change
+
+        Returns:
+            (tuple): An undo record for `_undo`
+        '''
+        return (self.game_pointer,
+                self.round_counter,
+                self.round.snapshot(),
+                self.players[self.game_pointer].snapshot(),
+                self.public_card)
+
+    def _undo(self, record):
+        ''' Revert the last action with its undo record
+
+        Args:
+            record (tuple): A record returned by `_get_undo_record`
+        '''
+        self.game_pointer, self.round_counter, r, p, public_card = record
+        self.round.restore(r)
+        self.players[self.game_pointer].restore(p)
+        if self.public_card is not public_card:
+            self.dealer.deck.append(self.public_card)
+            self.public_card = public_card
+
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): A compact and immutable record of the game
+        '''
+        return (self.round.snapshot(),
+                self.game_pointer,
+                self.round_counter,
+                self.dealer.snapshot(),
+                self.public_card,
+                tuple(p.snapshot() for p in self.players),
+                len(self.history))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        r, self.game_pointer, self.round_counter, d, self.public_card, ps, history_len = snapshot
+        self.round.restore(r)
+        self.dealer.restore(d)
+        for player, player_snapshot in zip(self.players, ps):
+            player.restore(player_snapshot)
+        del self.history[history_len:]
+
 
 # Test the game
 
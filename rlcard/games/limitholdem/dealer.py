@@ -22,3 +22,20 @@ class LimitholdemDealer(object):
             (Card): The drawn card from the deck
         '''
         return self.deck.pop()
+
+    def snapshot(self):
+        ''' Take a snapshot of the dealer
+
+        Returns:
+            (tuple): An immutable record of the remaining deck and the pot
+        '''
+        return (tuple(self.deck), self.pot)
+
+    def restore(self, snapshot):
+        ''' Restore the dealer from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        deck, self.pot = snapshot
+        self.deck = list(deck)
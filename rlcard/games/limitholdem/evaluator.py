@@ -0,0 +1,346 @@
+''' Lookup-table evaluator of Texas Hold'em hands
+
+The strength of a hand of 5 to 7 cards is a single integer, so that a
+stronger hand has a larger strength and equal hands have equal strengths.
+The category is in the high bits, using the numbering of `Hand.category`
+(1 for a high card up to 9 for a straight flush), followed by the ranks of
+the best five cards that break ties, 4 bits each.
+
+Instead of sorting and grouping the cards, the evaluator adds up per-card
+keys and looks the sums up in two tables, which are built on first use:
+
+    - If some suit has at least 5 cards, the bit mask of the ranks of that
+      suit gives the flush or straight flush
+    - Otherwise the hand only depends on how many cards of each rank it has.
+      The counts are encoded in base 5, which is a perfect hash of the
+      multisets of ranks
+'''
+import threading
+import numpy as np
+
+RANK_LOOKUP = '23456789TJQKA'
+SUIT_LOOKUP = 'SHDC'
+
+HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH = range(1, 10)
+CATEGORY_SHIFT = 20
+
+# Every suit has a nibble in the suit sum. Adding 3 to each nibble sets its
+# top bit if and only if the suit has at least 5 cards
+_SUIT_BIAS = 0x33333333
+_FLUSH_BITS = 0x88888888
+_MAX_SUITS = 8
+
+# The base-5 keys of the array tables are split into the 7 low digits and
+# the 6 high digits
+_LOW_BASE = 5 ** 7
+_HIGH_BASE = 5 ** 6
+
+_tables = {}
+_array_tables = {}
+_lock = threading.Lock()
+
+class _CardTable(dict):
+    ''' A dict from card strings, e.g., 'SA', to tuples (rank key, suit key,
+        rank bit, suit slot). Suits other than SUIT_LOOKUP get a slot when
+        they are first seen, so that hands written with other letters are
+        evaluated as well
+    '''
+
+    def __init__(self):
+        super(_CardTable, self).__init__()
+        self.suits = list(SUIT_LOOKUP)
+        for suit in SUIT_LOOKUP:
+            for rank in RANK_LOOKUP:
+                self[suit + rank]
+
+    def __missing__(self, card):
+        if len(card) != 2 or card[1] not in RANK_LOOKUP:
+            raise ValueError('Invalid card: {}'.format(card))
+        if card[0] not in self.suits:
+            if len(self.suits) == _MAX_SUITS:
+                raise ValueError('Too many suits, got {}'.format(card))
+            self.suits.append(card[0])
+        rank = RANK_LOOKUP.index(card[1])
+        slot = self.suits.index(card[0])
+        info = (5 ** rank, 1 << (4 * slot), 1 << rank, slot)
+        self[card] = info
+        return info
+
+_CARDS = _CardTable()
+
+def card_to_id(card):
+    ''' Convert a card string to an integer in [0, 52)
+
+    Args:
+        card (string): The suit and the rank, e.g., 'SA'
+
+    Returns:
+        (int): 4 times the rank index in RANK_LOOKUP plus the suit index in
+          SUIT_LOOKUP
+    '''
+    if len(card) != 2 or card[0] not in SUIT_LOOKUP or card[1] not in RANK_LOOKUP:
+        raise ValueError('Invalid card: {}'.format(card))
+    return 4 * RANK_LOOKUP.index(card[1]) + SUIT_LOOKUP.index(card[0])
+
+def id_to_card(card_id):
+    ''' Convert an integer in [0, 52) to a card string
+
+    Args:
+        card_id (int): See `card_to_id`
+
+    Returns:
+        (string): The suit and the rank, e.g., 'SA'
+    '''
+    return SUIT_LOOKUP[card_id % 4] + RANK_LOOKUP[card_id // 4]
+
+def get_tables(short_deck=False):
+    ''' Get the lookup tables, building them on first use
+
+    Args:
+        short_deck (boolean): True for the rules of the 6+ deck, where A6789
+          is the lowest straight and a flush beats a full house
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (list): The strength of the flush of each 13-bit rank mask, or 0
+              if the mask has less than 5 ranks
+            (dict): The strength of each base-5 encoded multiset of ranks
+    '''
+    tables = _tables.get(short_deck)
+    if tables is None:
+        with _lock:
+            if short_deck not in _tables:
+                _tables[short_deck] = _build_tables(short_deck)
+            tables = _tables[short_deck]
+    return tables
+
+def evaluate_hand(cards, short_deck=False):
+    ''' Evaluate a hand
+
+    Args:
+        cards (list): 5 to 7 card strings, e.g., ['SA', 'HT', 'D2', 'C9', 'S9']
+        short_deck (boolean): True for the rules of the 6+ deck
+
+    Returns:
+        (int): The strength. See the module docstring
+    '''
+    flush_table, rank_table = _tables.get(short_deck) or get_tables(short_deck)
+    infos = [_CARDS[card] for card in cards]
+    rank_key = suit_key = 0
+    for info in infos:
+        rank_key += info[0]
+        suit_key += info[1]
+    flush_bits = (suit_key + _SUIT_BIAS) & _FLUSH_BITS
+    if flush_bits:
+        slot = (flush_bits.bit_length() - 1) // 4
+        mask = 0
+        for info in infos:
+            if info[3] == slot:
+                mask |= info[2]
+        # Duplicated cards may leave less than 5 ranks in the suit
+        strength = flush_table[mask]
+        if strength:
+            return strength
+    try:
+        return rank_table[rank_key]
+    except KeyError:
+        raise ValueError('Cannot evaluate the hand {}'.format(cards))
+
+def evaluate_ids(card_ids, short_deck=False):
+    ''' Evaluate a hand given as integers. See `card_to_id`
+
+    Args:
+        card_ids (list): 5 to 7 distinct integers in [0, 52)
+        short_deck (boolean): True for the rules of the 6+ deck
+
+    Returns:
+        (int): The strength
+    '''
+    return evaluate_hand([id_to_card(card_id) for card_id in card_ids], short_deck)
+
+def get_array_tables(short_deck=False):
+    ''' Get the lookup tables as arrays for `evaluate_batch`. A binary search
+        in the keys of the rank table would be the bottleneck, so the base-5
+        key is split into the digits of the 7 lowest ranks and of the 6
+        highest ranks, which index a two-level table
+        `ranks[offsets[low] + high_indexes[high]]`
+
+    Args:
+        short_deck (boolean): True for the rules of the 6+ deck
+
+    Returns:
+        (tuple): Tuple containing:
+
+            (numpy.array): The flush table. See `get_tables`
+            (numpy.array): The offsets of the patterns of the low ranks
+            (numpy.array): The indexes of the patterns of the high ranks
+            (numpy.array): The strength of each pair of patterns, or 0 if
+              the hand has less than 5 cards
+    '''
+    tables = _array_tables.get(short_deck)
+    if tables is None:
+        flush_table, rank_table = get_tables(short_deck)
+        low_sizes = _digit_sums(_LOW_BASE, 7)
+        high_sizes = _digit_sums(_HIGH_BASE, 6)
+
+        # The high patterns are ordered by size, so that the ones that fit
+        # beside a low pattern of size s are the first `fits[7 - s]`
+        high_order = np.argsort(high_sizes, kind='stable')
+        high_indexes = np.empty(_HIGH_BASE, dtype=np.int64)
+        high_indexes[high_order] = np.arange(_HIGH_BASE)
+        fits = np.cumsum(np.bincount(high_sizes, minlength=30))
+        sizes = np.where(low_sizes <= 7, fits[np.clip(7 - low_sizes, 0, None)], 0)
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+        keys = np.array(list(rank_table), dtype=np.int64)
+        ranks = np.zeros(int(sizes.sum()), dtype=np.int64)
+        ranks[offsets[keys % _LOW_BASE] + high_indexes[keys // _LOW_BASE]] = list(rank_table.values())
+        tables = _array_tables.setdefault(short_deck, (np.array(flush_table, dtype=np.int64), offsets, high_indexes, ranks))
+    return tables
+
+def _digit_sums(size, num_digits):
+    ''' The sum of the base-5 digits of each integer in [0, size)
+    '''
+    numbers = np.arange(size)
+    sums = np.zeros(size, dtype=np.int64)
+    for _ in range(num_digits):
+        sums += numbers % 5
+        numbers //= 5
+    return sums
+
+# The keys of the cards indexed by their ids. The suit key is in the high
+# bits of the packed key, so that one gather gives both sums
+_ID_RANK_KEYS = np.array([5 ** (card_id // 4) for card_id in range(52)], dtype=np.int64)
+_ID_SUIT_KEYS = np.array([1 << (4 * (card_id % 4)) for card_id in range(52)], dtype=np.int64)
+_ID_PACKED_KEYS = (_ID_SUIT_KEYS << 32) | _ID_RANK_KEYS
+_ID_RANK_BITS = np.array([1 << (card_id // 4) for card_id in range(52)], dtype=np.int64)
+_ID_SUITS = np.arange(52) % 4
+_SUIT_FLUSH_BITS = np.array([0x8 << (4 * suit) for suit in range(4)], dtype=np.int64)
+
+def evaluate_batch(card_ids, short_deck=False):
+    ''' Evaluate many hands at once
+
+    Args:
+        card_ids (numpy.array): An integer array of shape (..., k) with
+          5 <= k <= 7, where each row holds the distinct ids of a hand. See
+          `card_to_id`. Gathering is faster with a small type, e.g., uint8
+        short_deck (boolean): True for the rules of the 6+ deck
+
+    Returns:
+        (numpy.array): The strength of each hand, of shape (...)
+    '''
+    flush_table, offsets, high_indexes, ranks = get_array_tables(short_deck)
+    card_ids = np.asarray(card_ids)
+    if not 5 <= card_ids.shape[-1] <= 7:
+        raise ValueError('The hands should have 5 to 7 cards, got {}'.format(card_ids.shape[-1]))
+    packed_key = _ID_PACKED_KEYS[card_ids].sum(axis=-1)
+    rank_key = packed_key & 0xFFFFFFFF
+    strengths = ranks[offsets[rank_key % _LOW_BASE] + high_indexes[rank_key // _LOW_BASE]]
+
+    flush_bits = ((packed_key >> 32) + _SUIT_BIAS) & _FLUSH_BITS
+    flushes = np.nonzero(flush_bits)
+    if len(flushes[0]):
+        # At most one suit has 5 cards out of 7
+        suits = np.searchsorted(_SUIT_FLUSH_BITS, flush_bits[flushes])
+        flush_ids = card_ids[flushes]
+        in_suit = _ID_SUITS[flush_ids] == suits[:, None]
+        masks = (_ID_RANK_BITS[flush_ids] * in_suit).sum(axis=-1)
+        # Duplicated cards may leave less than 5 ranks in the suit
+        flush_strengths = flush_table[masks]
+        strengths[flushes] = np.where(flush_strengths > 0, flush_strengths, strengths[flushes])
+    return strengths
+
+def get_category(strength):
+    ''' Get the category of a strength, e.g., STRAIGHT
+
+    Args:
+        strength (int): The result of `evaluate_hand`
+
+    Returns:
+        (int): The category, numbered as `Hand.category`. The categories of
+          the 6+ deck are numbered as `ShortHand.category`, where a flush is
+          FULL_HOUSE and a full house is FLUSH
+    '''
+    return strength >> CATEGORY_SHIFT
+
+def _encode(category, ranks):
+    ''' Pack a category and up to five tie breaking ranks
+    '''
+    strength = category
+    for i in range(5):
+        strength = (strength << 4) | (ranks[i] if i < len(ranks) else 0)
+    return strength
+
+def _straight_high(mask, short_deck):
+    ''' The rank of the highest card of the best straight in a rank mask, or
+        -1 if there is none
+    '''
+    for high in range(12, 3, -1):
+        window = 0b11111 << (high - 4)
+        if mask & window == window:
+            return high
+    low_ace = 0b1000000001111 if not short_deck else 0b1000011110000
+    if mask & low_ace == low_ace:
+        return 3 if not short_deck else 7
+    return -1
+
+def _build_tables(short_deck):
+    ''' Build the flush table and the rank table
+    '''
+    # The 6+ deck ranks a flush above a full house. Swapping the codes keeps
+    # `get_category` consistent with `Hand.category`
+    flush_code, full_house_code = (FLUSH, FULL_HOUSE) if not short_deck else (FULL_HOUSE, FLUSH)
+
+    flush_table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if bin(mask).count('1') < 5:
+            continue
+        high = _straight_high(mask, short_deck)
+        if high >= 0:
+            flush_table[mask] = _encode(STRAIGHT_FLUSH, [high])
+        else:
+            ranks = [rank for rank in range(12, -1, -1) if mask >> rank & 1][:5]
+            flush_table[mask] = _encode(flush_code, ranks)
+
+    # The ranks are visited from the highest, so that the groups of ranks
+    # of equal count are sorted in descending order
+    rank_table = {}
+    groups = [[], [], [], [], []]
+
+    def visit(rank, remaining, key):
+        if rank < 0:
+            if remaining <= 2:
+                rank_table[key] = _evaluate_groups(groups, short_deck, full_house_code)
+            return
+        rank_key = 5 ** rank
+        for count in range(min(4, remaining) + 1):
+            group = groups[count]
+            group.append(rank)
+            visit(rank - 1, remaining - count, key + count * rank_key)
+            group.pop()
+    visit(12, 7, 0)
+    return flush_table, rank_table
+
+def _evaluate_groups(groups, short_deck, full_house_code):
+    ''' The strength of a hand without flush given the ranks that appear 1,
+        2, 3 and 4 times, in descending order
+    '''
+    singles, pairs, trips, quads = groups[1:]
+    if quads:
+        return _encode(FOUR_OF_A_KIND, [quads[0], max(quads[1:] + trips + pairs + singles)])
+    if trips and (len(trips) > 1 or pairs):
+        return _encode(full_house_code, [trips[0], max(trips[1:] + pairs)])
+    mask = 0
+    for rank in singles + pairs + trips:
+        mask |= 1 << rank
+    high = _straight_high(mask, short_deck)
+    if high >= 0:
+        return _encode(STRAIGHT, [high])
+    if trips:
+        return _encode(THREE_OF_A_KIND, trips + singles[:2])
+    if len(pairs) > 1:
+        return _encode(TWO_PAIR, pairs[:2] + [max(pairs[2:] + singles)])
+    if pairs:
+        return _encode(ONE_PAIR, pairs + singles[:3])
+    return _encode(HIGH_CARD, singles[:5])
@@ -1,4 +1,3 @@
-from copy import deepcopy, copy
 import numpy as np
 
 from rlcard.games.limitholdem import Dealer
@@ -106,15 +105,8 @@ class LimitholdemGame(object):
                 (int): next plater's id
         '''
         if self.allow_step_back:
-            # First snapshot the current state
-            r = deepcopy(self.round)
-            b = self.game_pointer
-            r_c = self.round_counter
-            d = deepcopy(self.dealer)
-            p = deepcopy(self.public_cards)
-            ps = deepcopy(self.players)
-            rn = copy(self.history_raise_nums)
-            self.history.append((r, b, r_c, d, p, ps, rn))
+            # Only record the fields that this action can change
+            self.history.append(self._get_undo_record())
 
         # Then we proceed to the next round
         self.game_pointer = self.round.proceed_round(self.players, action)
@@ -152,10 +144,74 @@ class LimitholdemGame(object):
             (bool): True if the game steps back successfully
         '''
         if len(self.history) > 0:
-            self.round, self.game_pointer, self.round_counter, self.dealer, self.public_cards, self.players, self.history_raises_nums = self.history.pop()
+            self._undo(self.history.pop())
             return True
         return False
 
+    def _get_undo_record(self):
+        ''' Record the fields that the next action can change. An action only
+            changes the acting player, the round and the raise num of the
+            current round. The cards dealt afterwards are put back to the deck
+            by their number, so the deck is never copied.
+
+        Returns:
+            (tuple): An undo record for `_undo`
+        '''
+        return (self.game_pointer,
+                self.round_counter,
+                self.round.snapshot(),
+                self.players[self.game_pointer].snapshot(),
+                self.history_raise_nums[self.round_counter],
+                len(self.public_cards))
+
+    def _undo(self, record):
+        ''' Revert the last action with its undo record
+
+        Args:
+            record (tuple): A record returned by `_get_undo_record`
+        '''
+        self.game_pointer, self.round_counter, r, p, raise_num, public_len = record
+        self.round.restore(r)
+        self.players[self.game_pointer].restore(p)
+        self.history_raise_nums[self.round_counter] = raise_num
+        while len(self.public_cards) > public_len:
+            self.dealer.deck.append(self.public_cards.pop())
+
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): A compact and immutable record of the game. Cards are
+              shared with the game rather than copied since they are never
+              modified
+
+        Note: The snapshot can be passed to `restore` at any later point of
+              the same game, e.g., to return to a node in a tree search.
+        '''
+        return (self.round.snapshot(),
+                self.game_pointer,
+                self.round_counter,
+                self.dealer.snapshot(),
+                tuple(self.public_cards),
+                tuple(p.snapshot() for p in self.players),
+                tuple(self.history_raise_nums),
+                len(self.history))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        r, self.game_pointer, self.round_counter, d, p, ps, rn, history_len = snapshot
+        self.round.restore(r)
+        self.dealer.restore(d)
+        self.public_cards = list(p)
+        for player, player_snapshot in zip(self.players, ps):
+            player.restore(player_snapshot)
+        self.history_raise_nums = list(rn)
+        del self.history[history_len:]
+
     def get_player_num(self):
         ''' Return the number of players in Limit Texas Hold'em
 
@@ -194,7 +250,7 @@ class LimitholdemGame(object):
         legal_actions = self.get_legal_actions()
         state = self.players[player].get_state(self.public_cards, chips, legal_actions)
         state['player_id'] = player
-        state['raise_nums'] = self.history_raise_nums
+        state['raise_nums'] = list(self.history_raise_nums)
 
         return state
 
@@ -45,3 +45,20 @@ class LimitholdemPlayer(object):
         ''' Return the id of the player
         '''
         return self.player_id
+
+    def snapshot(self):
+        ''' Take a snapshot of the player
+
+        Returns:
+            (tuple): An immutable record of the hand, status and chips of the player
+        '''
+        return (tuple(self.hand), self.status, self.in_chips)
+
+    def restore(self, snapshot):
+        ''' Restore the player from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        hand, self.status, self.in_chips = snapshot
+        self.hand = list(hand)
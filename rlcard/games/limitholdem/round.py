@@ -121,6 +121,23 @@ class LimitholdemRound(object):
             return True
         return False
 
+    def snapshot(self):
+        ''' Take a snapshot of the round
+
+        Returns:
+            (tuple): An immutable record of the betting status of the round
+        '''
+        return (self.game_pointer, self.raise_amount, self.have_raised, self.not_raise_num, tuple(self.raised))
+
+    def restore(self, snapshot):
+        ''' Restore the round from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        self.game_pointer, self.raise_amount, self.have_raised, self.not_raise_num, raised = snapshot
+        self.raised = list(raised)
+
 #import numpy as np
 #from rlcard.games.limitholdem.player import LimitholdemPlayer as Player
 #
@@ -1,4 +1,4 @@
-import numpy as np
+from rlcard.games.limitholdem.evaluator import evaluate_hand
 
 class Hand:
     RANK_TO_STRING = {2: "2", 3: "3", 4: "4", 5: "5", 6: "6",
@@ -409,163 +409,22 @@ class Hand:
         High_cards = self.all_cards[2:7]
         return High_cards
 
-def compare_ranks(position, hands):
+def compare_hands(hands, short_deck=False):
     '''
-    Compare cards in same position of plays' five handcards
+    Compare the seven cards of all the players
     Args:
-        position(int): the position of a card in a sorted handcard
-        hands(list): cards of those players.
+        hands(list): cards of those players, None for the players who folded.
         e.g. hands = [['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CJ', 'SJ', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7']]
+        short_deck(boolean): True for the rules of the 6+ deck
     Returns:
         [0, 1, 0]: player1 wins
         [1, 0, 0]: player0 wins
         [1, 1, 1]: draw
         [1, 1, 0]: player1 and player0 draws
-
-    '''
-    RANKS = '23456789TJQKA'
-    winner = [0]*len(hands)
-    figure = [['1', 'J']]*len(hands) #cards without suit
-    for _ in enumerate(hands):
-        i = hands[_[0]].get_hand_five_cards()
-        if len(i[0]) != 1:# remove suit
-            for p in range(5):
-                i[p] = i[p][1:]
-        figure[_[0]] = i
-
-    rival_figures = [] # figures in the same position, to be compared
-    rival_ranks = [] # ranks of rival_figures
-    for _ in enumerate(figure):
-        rival_figures.append(figure[_[0]][position])
-        rival_ranks.append(RANKS.index(rival_figures[_[0]]))
-    high_ranks = [q for q, j in enumerate(rival_ranks) if j == max(rival_ranks)]
-    for _ in high_ranks:
-        winner[_] = 1
-    return winner
-
-def determine_winner(key_index, hands, all_players, potential_winner_index):
-    '''
-    Find out who wins in the situation of having players with same highest hand_catagory
-    Args:
-        key_index(int): the position of a card in a sorted handcard
-        hands(list): cards of those players with same highest hand_catagory.
-        e.g. hands = [['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CJ', 'SJ', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7']]
-        all_players(list): all the players in this round, 0 for losing and 1 for winning or draw
-        potential_winner_index(list): the positions of those players with same highest hand_catagory in all_players
-    Returns:
-        [0, 1, 0]: player1 wins
-        [1, 0, 0]: player0 wins
-        [1, 1, 1]: draw
-        [1, 1, 0]: player1 and player0 draws
-
-    '''
-    count = 0
-    losers = []
-    winner = [1]*len(hands)
-    for _ in key_index:
-        index_winner = compare_ranks(_, hands)
-        for loser in losers:
-            index_winner.insert(loser, 0)
-        for _ in enumerate(winner):
-            if winner[_[0]] == 1:
-                winner[_[0]] = index_winner[_[0]]
-            if winner[_[0]] == 0:
-                if _[0] not in losers:
-                    i = _[0]
-                    i = i - np.sum(list(map(lambda x: x < i, losers)))
-                    i = int(i)
-                    del hands[i]
-                    losers.append(_[0])
-                continue
-        if winner.count(1) == 1:
-            break
-    for _ in winner:
-        if _ == 1:
-            all_players[potential_winner_index[count]] = 1
-        count+=1
-    return all_players
-
-def compare_hands(hands):
-    '''
-    Compare all palyer's all seven cards
-    Args:
-        hands(list): cards of those players with same highest hand_catagory.
-        e.g. hands = [['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CJ', 'SJ', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7']]
-    Returns:
-        [0, 1, 0]: player1 wins
-        [1, 0, 0]: player0 wins
-        [1, 1, 1]: draw
-        [1, 1, 0]: player1 and player0 draws
-
-    if hands[0] == None:
-        return [0, 1]
-    elif hands[1] == None:
-        return [1, 0]
-    '''
-    hand_category = [] #such as high_card, straight_flush, etc
-    all_players = [0]*len(hands) #all the players in this round, 0 for losing and 1 for winning or draw
-    if None in hands:
-        fold_players = [i for i, j in enumerate(hands) if j is None]
-        if len(fold_players) == len(all_players) - 1:
-            for _ in enumerate(hands):
-                if _[0] in fold_players:
-                    all_players[_[0]] = 0
-                else:
-                    all_players[_[0]] = 1
-            return all_players
-        else:
-            for _ in enumerate(hands):
-                if hands[_[0]] is not None:
-                    hands[_[0]] = Hand(hands[_[0]])
-                    hands[_[0]].evaluateHand()
-                    hand_category.append(hands[_[0]].category)
-                elif hands[_[0]] is None:
-                    hand_category.append(0)
-    else:
-            for i in enumerate(hands):
-                hands[i[0]] = Hand(hands[i[0]])
-                hands[i[0]].evaluateHand()
-                hand_category.append(hands[i[0]].category)
-    potential_winner_index = [i for i, j in enumerate(hand_category) if j == max(hand_category)]# potential winner are those with same max card_catagory
-
-    return final_compare(hands, potential_winner_index, all_players)
-
-def final_compare(hands, potential_winner_index, all_players):
-    '''
-    Find out the winners from those who didn't fold
-    Args:
-        hands(list): cards of those players with same highest hand_catagory.
-        e.g. hands = [['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CJ', 'SJ', 'H9', 'B9', 'C2', 'C8', 'C7'], ['CT', 'ST', 'H9', 'B9', 'C2', 'C8', 'C7']]
-        potential_winner_index(list): index of those with same max card_catagory in all_players
-        all_players(list): a list of all the player's win/lose situation, 0 for lose and 1 for win
-    Returns:
-        [0, 1, 0]: player1 wins
-        [1, 0, 0]: player0 wins
-        [1, 1, 1]: draw
-        [1, 1, 0]: player1 and player0 draws
-
-    if hands[0] == None:
-        return [0, 1]
-    elif hands[1] == None:
-        return [1, 0]
     '''
-    if len(potential_winner_index) == 1:
-        all_players[potential_winner_index[0]] = 1
-        return all_players
-    elif len(potential_winner_index) > 1:
-        # compare when having equal max categories
-        equal_hands = []
-        for _ in potential_winner_index:
-            equal_hands.append(hands[_])
-        if hands[potential_winner_index[0]].category == 9 or hands[potential_winner_index[0]].category == 5 or hands[potential_winner_index[0]].category == 8:
-            return determine_winner([0], equal_hands, all_players, potential_winner_index)
-        if hands[potential_winner_index[0]].category == 7:
-            return determine_winner([2, 0], equal_hands, all_players, potential_winner_index)
-        if hands[potential_winner_index[0]].category == 4:
-            return determine_winner([2, 1, 0], equal_hands, all_players, potential_winner_index)
-        if hands[potential_winner_index[0]].category == 3:
-            return determine_winner([4, 2, 0], equal_hands, all_players, potential_winner_index)
-        if hands[potential_winner_index[0]].category == 2:
-            return determine_winner([4, 2, 1, 0], equal_hands, all_players, potential_winner_index)
-        if hands[potential_winner_index[0]].category == 1 or hands[potential_winner_index[0]].category == 6:
-            return determine_winner([4, 3, 2, 1, 0], equal_hands, all_players, potential_winner_index)
+    if sum(hand is not None for hand in hands) == 1:
+        # The others folded, so the cards are not compared
+        return [int(hand is not None) for hand in hands]
+    strengths = [evaluate_hand(hand, short_deck) if hand is not None else -1 for hand in hands]
+    best = max(strengths)
+    return [int(strength == best) for strength in strengths]
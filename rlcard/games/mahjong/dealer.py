@@ -25,6 +25,24 @@ class MahjongDealer(object):
         for _ in range(num):
             player.hand.append(self.deck.pop())
 
+    def snapshot(self):
+        ''' Take a snapshot of the dealer
+
+        Returns:
+            (tuple): An immutable record of the remaining deck and the table
+        '''
+        return (tuple(self.deck), tuple(self.table))
+
+    def restore(self, snapshot):
+        ''' Restore the dealer from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        deck, table = snapshot
+        self.deck = list(deck)
+        self.table = list(table)
+
 
 ## For test
 #if __name__ == '__main__':
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 from rlcard.games.mahjong import Dealer
 from rlcard.games.mahjong import Player
@@ -61,10 +60,7 @@ class MahjongGame(object):
         '''
         # First snapshot the current state
         if self.allow_step_back:
-            hist_dealer = deepcopy(self.dealer)
-            hist_round = deepcopy(self.round)
-            hist_players = deepcopy(self.players)
-            self.history.append((hist_dealer, hist_players, hist_round))
+            self.history.append(self.snapshot())
         self.round.proceed_round(self.players, action)
         state = self.get_state(self.round.current_player)
         self.cur_state = state
@@ -78,9 +74,34 @@ class MahjongGame(object):
         '''
         if not self.history:
             return False
-        self.dealer, self.players, self.round = self.history.pop()
+        self.restore(self.history.pop())
         return True
 
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): A compact and immutable record of the game
+        '''
+        return (self.dealer.snapshot(),
+                tuple(p.snapshot() for p in self.players),
+                self.round.snapshot(),
+                len(self.history))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        d, ps, r, history_len = snapshot
+        self.dealer.restore(d)
+        for player, player_snapshot in zip(self.players, ps):
+            player.restore(player_snapshot)
+        self.round.restore(r)
+        del self.history[history_len:]
+        self.cur_state = self.get_state(self.round.current_player)
+
     def get_state(self, player_id):
         ''' Return player's state
 
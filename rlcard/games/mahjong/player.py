@@ -70,3 +70,21 @@ class MahjongPlayer(object):
             if card in self.hand:
                 self.hand.pop(self.hand.index(card))
         self.pile.append(cards)
+
+    def snapshot(self):
+        ''' Take a snapshot of the player
+
+        Returns:
+            (tuple): An immutable record of the hand and the pile of the player
+        '''
+        return (tuple(self.hand), tuple(tuple(s) for s in self.pile))
+
+    def restore(self, snapshot):
+        ''' Restore the player from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        hand, pile = snapshot
+        self.hand = list(hand)
+        self.pile = [list(s) for s in pile]
@@ -108,3 +108,24 @@ class MahjongRound(object):
             state['action_cards'] = players[player_id].hand # For doing action (pong, chow, gong)
         return state
 
+    def snapshot(self):
+        ''' Take a snapshot of the round
+
+        Returns:
+            (tuple): An immutable record of the round
+        '''
+        return (self.target, self.current_player, self.last_player, self.direction,
+                tuple(self.played_cards), self.is_over, self.player_before_act,
+                self.prev_status, self.valid_act, tuple(self.last_cards))
+
+    def restore(self, snapshot):
+        ''' Restore the round from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        (self.target, self.current_player, self.last_player, self.direction,
+         played_cards, self.is_over, self.player_before_act,
+         self.prev_status, self.valid_act, last_cards) = snapshot
+        self.played_cards = list(played_cards)
+        self.last_cards = list(last_cards)
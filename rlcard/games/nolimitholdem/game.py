@@ -1,7 +1,6 @@
 from enum import Enum
 
 import numpy as np
-from copy import deepcopy
 from rlcard.games.limitholdem import Game
 from rlcard.games.limitholdem import PlayerStatus
 
@@ -117,14 +116,8 @@ class NolimitholdemGame(Game):
             raise Exception('Action not allowed')
 
         if self.allow_step_back:
-            # First snapshot the current state
-            r = deepcopy(self.round)
-            b = self.game_pointer
-            r_c = self.round_counter
-            d = deepcopy(self.dealer)
-            p = deepcopy(self.public_cards)
-            ps = deepcopy(self.players)
-            self.history.append((r, b, r_c, d, p, ps))
+            # Only record the fields that this action can change
+            self.history.append(self._get_undo_record())
 
         # Then we proceed to the next round
         self.game_pointer = self.round.proceed_round(self.players, action)
@@ -196,10 +189,65 @@ class NolimitholdemGame(Game):
             (bool): True if the game steps back successfully
         '''
         if len(self.history) > 0:
-            self.round, self.game_pointer, self.round_counter, self.dealer, self.public_cards, self.players = self.history.pop()
+            self._undo(self.history.pop())
             return True
         return False
 
+    def _get_undo_record(self):
+        ''' Record the fields that the next action can change
+
+        Returns:
+            (tuple): An undo record for `_undo`
+        '''
+        return (self.game_pointer,
+                self.round_counter,
+                self.stage,
+                self.round.snapshot(),
+                self.players[self.game_pointer].snapshot(),
+                self.dealer.pot,
+                len(self.public_cards))
+
+    def _undo(self, record):
+        ''' Revert the last action with its undo record
+
+        Args:
+            record (tuple): A record returned by `_get_undo_record`
+        '''
+        self.game_pointer, self.round_counter, self.stage, r, p, self.dealer.pot, public_len = record
+        self.round.restore(r)
+        self.players[self.game_pointer].restore(p)
+        while len(self.public_cards) > public_len:
+            self.dealer.deck.append(self.public_cards.pop())
+
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): A compact and immutable record of the game
+        '''
+        return (self.round.snapshot(),
+                self.game_pointer,
+                self.round_counter,
+                self.stage,
+                self.dealer.snapshot(),
+                tuple(self.public_cards),
+                tuple(p.snapshot() for p in self.players),
+                len(self.history))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        r, self.game_pointer, self.round_counter, self.stage, d, p, ps, history_len = snapshot
+        self.round.restore(r)
+        self.dealer.restore(d)
+        self.public_cards = list(p)
+        for player, player_snapshot in zip(self.players, ps):
+            player.restore(player_snapshot)
+        del self.history[history_len:]
+
     def get_payoffs(self):
         ''' Return the payoffs of the game
 
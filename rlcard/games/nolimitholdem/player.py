@@ -17,3 +17,20 @@ class NolimitholdemPlayer(Player):
         quantity = chips if chips <= self.remained_chips else self.remained_chips
         self.in_chips += quantity
         self.remained_chips -= quantity
+
+    def snapshot(self):
+        ''' Take a snapshot of the player
+
+        Returns:
+            (tuple): An immutable record of the hand, status and chips of the player
+        '''
+        return super(NolimitholdemPlayer, self).snapshot() + (self.remained_chips,)
+
+    def restore(self, snapshot):
+        ''' Restore the player from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        super(NolimitholdemPlayer, self).restore(snapshot[:-1])
+        self.remained_chips = snapshot[-1]
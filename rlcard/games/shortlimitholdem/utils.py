@@ -1,19 +1,32 @@
-from rlcard.games.limitholdem.utils import Hand
-
-class ShortHand(Hand):
-    ''' Employs an alternative ranking system for a short hand game. '''
-    RANK_TO_STRING = {6: "6", 7: "7", 8: "8", 9: "9", 10: "T",
-                      11: "J", 12: "Q", 13: "K", 14: "A"}
-    RANK_LOOKUP = "6789TJQKA"
-
-    def evaluateHand(self):
-        """
-        Evaluate all the seven cards, get the best combination catagory
-        And pick the best five cards (for comparing in case 2 hands have the same Category) .
-        """
-        # Fullhouse and Flush categories are swapped
-        super().evaluateHand()
-        if self.category == 7:  # Fullhouse
-            self.category = 6
-        elif self.category == 6:  # Flush
-            self.category = 7
+from rlcard.games.limitholdem.utils import Hand
+from rlcard.games.limitholdem.utils import compare_hands as compare_limit_hands
+
+class ShortHand(Hand):
+    ''' Employs an alternative ranking system for a short hand game. '''
+    RANK_TO_STRING = {6: "6", 7: "7", 8: "8", 9: "9", 10: "T",
+                      11: "J", 12: "Q", 13: "K", 14: "A"}
+    RANK_LOOKUP = "6789TJQKA"
+
+    def evaluateHand(self):
+        """
+        Evaluate all the seven cards, get the best combination catagory
+        And pick the best five cards (for comparing in case 2 hands have the same Category) .
+        """
+        # Fullhouse and Flush categories are swapped
+        super().evaluateHand()
+        if self.category == 7:  # Fullhouse
+            self.category = 6
+        elif self.category == 6:  # Flush
+            self.category = 7
+
+def compare_hands(hands):
+    '''
+    Compare the seven cards of all the players with the rules of the 6+ deck,
+    where A6789 is a straight and a flush beats a full house
+    Args:
+        hands(list): cards of those players, None for the players who folded
+    Returns:
+        (list): 1 for the winners and 0 for the others. See
+          `rlcard.games.limitholdem.utils.compare_hands`
+    '''
+    return compare_limit_hands(hands, short_deck=True)
@@ -114,6 +114,29 @@ class SimpleDoudizhuGame(object):
         self.state = self.get_state(self.round.current_player)
         return True
 
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (int): The length of the public trace. The game already keeps an
+              undo log in the trace, so a snapshot only needs to remember
+              how far to unwind it
+
+        Note: A snapshot can only be restored from the states that follow it.
+        '''
+        return len(self.round.trace)
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot by stepping back
+
+        Args:
+            snapshot (int): A record returned by `snapshot`
+        '''
+        if snapshot > len(self.round.trace):
+            raise ValueError('Can not restore a snapshot that is ahead of the current state')
+        while len(self.round.trace) > snapshot:
+            self.step_back()
+
     def get_state(self, player_id):
         ''' Return player's state
 
@@ -37,3 +37,19 @@ class UnoDealer(object):
             self.shuffle()
             top_card = self.deck.pop()
         return top_card
+
+    def snapshot(self):
+        ''' Take a snapshot of the dealer
+
+        Returns:
+            (tuple): An immutable record of the remaining deck
+        '''
+        return tuple(self.deck)
+
+    def restore(self, snapshot):
+        ''' Restore the dealer from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        self.deck = list(snapshot)
@@ -1,4 +1,3 @@
-from copy import deepcopy
 import numpy as np
 
 from rlcard.games.uno import Dealer
@@ -29,6 +28,10 @@ class UnoGame(object):
         # Initialize a dealer that can deal cards
         self.dealer = Dealer(self.np_random)
 
+        # The color of a wild card is assigned when it is flipped or drawn,
+        # so it has to be saved in the snapshots
+        self.wild_cards = [card for card in self.dealer.deck if card.type == 'wild']
+
         # Initialize four players to play the game
         self.players = [Player(i, self.np_random) for i in range(self.num_players)]
 
@@ -65,10 +68,7 @@ class UnoGame(object):
 
         if self.allow_step_back:
             # First snapshot the current state
-            his_dealer = deepcopy(self.dealer)
-            his_round = deepcopy(self.round)
-            his_players = deepcopy(self.players)
-            self.history.append((his_dealer, his_players, his_round))
+            self.history.append(self.snapshot())
 
         self.round.proceed_round(self.players, action)
         player_id = self.round.current_player
@@ -83,9 +83,38 @@ class UnoGame(object):
         '''
         if not self.history:
             return False
-        self.dealer, self.players, self.round = self.history.pop()
+        self.restore(self.history.pop())
         return True
 
+    def snapshot(self):
+        ''' Take a snapshot of the current state of the game
+
+        Returns:
+            (tuple): A compact and immutable record of the game
+        '''
+        return (self.dealer.snapshot(),
+                tuple(p.snapshot() for p in self.players),
+                self.round.snapshot(),
+                tuple(card.color for card in self.wild_cards),
+                tuple(self.payoffs),
+                len(self.history))
+
+    def restore(self, snapshot):
+        ''' Restore the game to a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        d, ps, r, wild_colors, payoffs, history_len = snapshot
+        self.dealer.restore(d)
+        for player, player_snapshot in zip(self.players, ps):
+            player.restore(player_snapshot)
+        self.round.restore(r)
+        for card, color in zip(self.wild_cards, wild_colors):
+            card.color = color
+        self.payoffs = list(payoffs)
+        del self.history[history_len:]
+
     def get_state(self, player_id):
         ''' Return player's state
 
@@ -17,3 +17,19 @@ class UnoPlayer(object):
         '''
 
         return self.player_id
+
+    def snapshot(self):
+        ''' Take a snapshot of the player
+
+        Returns:
+            (tuple): An immutable record of the hand of the player
+        '''
+        return tuple(self.hand)
+
+    def restore(self, snapshot):
+        ''' Restore the player from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        self.hand = list(snapshot)
@@ -163,6 +163,26 @@ class UnoRound(object):
         self.dealer.shuffle()
         self.played_cards = []
 
+    def snapshot(self):
+        ''' Take a snapshot of the round
+
+        Returns:
+            (tuple): An immutable record of the round
+        '''
+        winner = tuple(self.winner) if self.winner is not None else None
+        return (self.target, self.current_player, self.direction,
+                tuple(self.played_cards), self.is_over, winner)
+
+    def restore(self, snapshot):
+        ''' Restore the round from a snapshot
+
+        Args:
+            snapshot (tuple): A record returned by `snapshot`
+        '''
+        self.target, self.current_player, self.direction, played_cards, self.is_over, winner = snapshot
+        self.played_cards = list(played_cards)
+        self.winner = list(winner) if winner is not None else None
+
     def _perform_draw_action(self, players):
         # replace deck if there is no card in draw pile
         if not self.dealer.deck:
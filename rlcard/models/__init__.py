@@ -2,14 +2,11 @@
 '''
 
 from rlcard.models.registration import register, load
-import subprocess
-import sys
+from importlib.util import find_spec
 from packaging import version
 
-reqs = subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
-installed_packages = [r.decode().split('==')[0] for r in reqs.split()]
-
-if 'tensorflow' in installed_packages:
+# Check whether the frameworks are installed without importing them
+if find_spec('tensorflow') is not None:
     import tensorflow as tf
     if version.parse(tf.__version__) < version.parse('1.14.0') \
             or version.parse(tf.__version__) >= version.parse('2.0.0'):
@@ -18,7 +15,7 @@ if 'tensorflow' in installed_packages:
         model_id = 'leduc-holdem-nfsp',
         entry_point='rlcard.models.pretrained_models:LeducHoldemNFSPModel')
 
-if 'torch' in installed_packages:
+if find_spec('torch') is not None:
     register(
         model_id = 'leduc-holdem-nfsp-pytorch',
         entry_point='rlcard.models.pretrained_models:LeducHoldemNFSPPytorchModel')
@@ -4,7 +4,7 @@
 import numpy as np
 
 import rlcard
-from rlcard.games.doudizhu.utils import CARD_TYPE, INDEX
+from rlcard.games.doudizhu.utils import load_tables, INDEX
 from rlcard.models.model import Model
 
 class DouDizhuRuleAgentV1(object):
@@ -39,13 +39,14 @@ class DouDizhuRuleAgentV1(object):
             if target == 'pass':
                 target = state['trace'][-2][-1]
                 target_player = state['trace'][-1][0]
-            the_type = CARD_TYPE[0][target][0][0]
+            card_type = load_tables()['CARD_TYPE'][0]
+            the_type = card_type[target][0][0]
             chosen_action = ''
             rank = 1000
             for action in state['actions']:
-                if action != 'pass' and the_type == CARD_TYPE[0][action][0][0]:
-                    if int(CARD_TYPE[0][action][0][1]) < rank:
-                        rank = int(CARD_TYPE[0][action][0][1])
+                if action != 'pass' and the_type == card_type[action][0][0]:
+                    if int(card_type[action][0][1]) < rank:
+                        rank = int(card_type[action][0][1])
                         chosen_action = action
             if chosen_action != '':
                 return chosen_action
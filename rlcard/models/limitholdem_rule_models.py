@@ -2,6 +2,16 @@
 '''
 import rlcard
 from rlcard.models.model import Model
+from rlcard.utils.strength_tables import preflop_class
+
+# The classes of hand cards that are raised before the flop, e.g., 'AKs'
+# (s means flush) and 'AKo' (o means offsuit): the pairs, AK, AQ, AJ, AT,
+# A9s, A8s, ... A2s, KQ, KJ, KT, QJ, QT and JT
+PREFLOP_RAISE_CLASSES = frozenset(
+    [rank + rank for rank in 'AKQJT98765432'] +
+    ['A' + rank + suited for rank in 'KQJT' for suited in 'so'] +
+    ['A' + rank + 's' for rank in '98765432'] +
+    [high + low + suited for high, low in ('KQ', 'KJ', 'KT', 'QJ', 'QT', 'JT') for suited in 'so'])
 
 class LimitholdemRuleAgentV1(object):
     ''' Limit Hold 'em Rule agent version 1
@@ -29,19 +39,12 @@ class LimitholdemRuleAgentV1(object):
         # Pairs
         # AK, AQ, AJ, AT
         # A9s, A8s, ... A2s(s means flush)
-        # KQ, KJ, QJ, JT
+        # KQ, KJ, KT, QJ, QT, JT
+        # The class of the hand cards is looked up in PREFLOP_RAISE_CLASSES
         # Fold all hand types except those mentioned above to save money
         if len(public_cards) == 0:
-            if hand[0][1] == hand [1][1]:
+            if preflop_class(hand) in PREFLOP_RAISE_CLASSES:
                 action = 'raise'
-            elif hand[0][1] == 'A' or hand[1][1] == 'A':
-                if 'K' in [hand[0][1], hand[1][1]] or 'Q' in [hand[0][1], hand[1][1]] or 'J' in [hand[0][1], hand[1][1]] or 'T' in [hand[0][1], hand[1][1]]:
-                    action = 'raise'
-                elif hand[0][0] == hand[1][0]:
-                    action = 'raise'
-            elif hand[0][1] == 'K' or hand[0][1] == 'Q' or hand[0][1] == 'J' or hand[0][1] == 'T':
-                if hand[1][1] == 'K' or hand[1][1] == 'Q' or hand[1][1] == 'J' or hand[1][1] == 'T':
-                    action = 'raise'
         if len(public_cards) == 3:
             public_cards_ranks = ['A', 'A', 'A']
             public_cards_flush = ['S', 'S', 'S']
@@ -15,5 +15,5 @@ class OneLookModelShortHoldem(LimitholdemRuleModelV1):
         self.game = "short-limit-holdem"
         env = rlcard.make(self.game)
 
-        rule_agent = OneLookAgent()
+        rule_agent = OneLookAgent(short_deck=True)
         self.rule_agents = [rule_agent for _ in range(env.player_num)]
\ No newline at end of file
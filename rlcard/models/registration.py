@@ -9,11 +9,25 @@ class ModelSpec(object):
 
         Args:
             model_id (string): the name of the model
-            entry_point (string): a string that indicates the location of the model class
+            entry_point (string): a string that indicates the location of the model class.
+              The module is imported on the first `load`
         '''
         self.model_id = model_id
-        mod_name, class_name = entry_point.split(':')
-        self._entry_point = getattr(importlib.import_module(mod_name), class_name)
+        if len(entry_point.split(':')) != 2:
+            raise ValueError('The entry point should be in the form module:class, got {}'.format(entry_point))
+        self.entry_point = entry_point
+        self._entry_point = None
+
+    def load_entry_point(self):
+        ''' Import the model class
+
+        Returns:
+            (class): The model class
+        '''
+        if self._entry_point is None:
+            mod_name, class_name = self.entry_point.split(':')
+            self._entry_point = getattr(importlib.import_module(mod_name), class_name)
+        return self._entry_point
 
     def load(self):
         ''' Instantiates an instance of the model
@@ -21,7 +35,7 @@ class ModelSpec(object):
         Returns:
             Model (Model): an instance of the Model
         '''
-        model = self._entry_point()
+        model = self.load_entry_point()()
         return model
 
 
@@ -1,3 +1,7 @@
 from rlcard.utils.logger import Logger
 from rlcard.utils import seeding
 from rlcard.utils.utils import *
+from rlcard.utils.dataset import TrajectoryWriter, TrajectoryReader
+from rlcard.utils.evaluation import parallel_tournament
+from rlcard.utils.profiling import Profiler, merge_stats
+from rlcard.utils.parallel_cfr import ParallelCFRTrainer
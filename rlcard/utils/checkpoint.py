@@ -0,0 +1,287 @@
+''' Single-file checkpoints of the tables of the tabular agents
+
+A checkpoint file is a sequence of records. Each record is made of:
+
+- The magic bytes `MAGIC` and the length of the header as a little-endian
+  uint64.
+- The header, in JSON: the type of the record, 'full' or 'delta', the number
+  of actions, the fields and their initial values, the number of
+  information sets after the record, the user metadata, e.g., the iteration,
+  and the name, type, shape and offset of each data block.
+- The data blocks, each aligned to `ALIGNMENT` bytes so that they can be
+  memory-mapped: the keys of the information sets added by the record, the
+  ids of the rows it holds for a delta, and one block per field.
+
+The first record is a full copy of the table. An incremental save appends a
+delta with the new keys and the dirty rows only, so that frequent
+checkpoints of a large table stay cheap. A record that was not fully written,
+e.g., because the process was killed, is ignored when the file is read.
+'''
+import os
+import json
+import struct
+import numpy as np
+
+from rlcard.utils.infoset_table import InfosetTable
+from rlcard.utils.regret_matching import CHUNK_SIZE
+
+MAGIC = b'RLCTAB01'
+ALIGNMENT = 64
+CHECKPOINT_FILE = 'table.ckpt'
+
+_LENGTH = struct.Struct('<Q')
+
+def save_table(path, table, meta=None, incremental=False, dtype=np.float32):
+    ''' Save a table to a checkpoint file
+
+    Args:
+        path (string): The path of the file
+        table (InfosetTable): The table
+        meta (dict): Metadata saved with the table, which should be
+          serializable in JSON, e.g., {'iteration': 100}
+        incremental (boolean): If True and the table was last saved to or
+          loaded from the same file, only the new information sets and the
+          dirty rows are appended to the file. Otherwise the file is replaced
+          by a full copy of the table
+        dtype (numpy.dtype): The type with which the values are stored. The
+          masks are stored as booleans
+    '''
+    path = os.path.abspath(path)
+    size = len(table)
+    records = None
+    if incremental and table.saved_path == path and table.saved_num <= size and os.path.exists(path):
+        records, end = _read_records(path)
+    if records:
+        table.dirty[table.saved_num:size] = True
+        rows = np.flatnonzero(table.dirty[:size])
+        with open(path, 'r+b') as f:
+            # Drop an incomplete record left by an interrupted save
+            f.truncate(end)
+            f.seek(end)
+            _write_record(f, 'delta', table, table.saved_num, rows, meta, dtype)
+    else:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            _write_record(f, 'full', table, 0, None, meta, dtype)
+        os.replace(tmp_path, path)
+    table.dirty[:] = False
+    table.saved_path = path
+    table.saved_num = size
+
+def load_table(path, fields=None, mmap_mode=None, dtype=np.float64):
+    ''' Load a table from a checkpoint file
+
+    Args:
+        path (string): The path of the file
+        fields (dict): The fields and their initial values. See
+          `InfosetTable`. The fields that were not saved are set to their
+          initial values. If None, the fields of the file are used
+        mmap_mode (string): If not None and the file holds a single full
+          record, e.g., after `compact_table`, the arrays are memory-mapped
+          with this mode instead of being read, e.g., 'r' to share a
+          read-only table between evaluation processes. The arrays then keep
+          the type with which they were stored. The files with deltas are
+          read into memory
+        dtype (numpy.dtype): The type of the values of the arrays read into
+          memory
+
+    Returns:
+        (tuple): The table and the metadata of the last record
+    '''
+    path = os.path.abspath(path)
+    records, _ = _read_records(path)
+    if not records:
+        raise ValueError('No complete record in {}'.format(path))
+    header, data_offset = records[0]
+    if header['type'] != 'full':
+        raise ValueError('The first record of {} is not a full table'.format(path))
+    if fields is None:
+        fields = header['fields']
+    if len(records) > 1 or header['num_keys'] == 0:
+        mmap_mode = None
+
+    with open(path, 'rb') as f:
+        blocks = {block['name']: block for block in header['blocks']}
+        keys = _read_keys(f, data_offset, blocks)
+        arrays = {}
+        for name in fields:
+            if name not in blocks:
+                continue
+            block = blocks[name]
+            if mmap_mode is not None:
+                arrays[name] = np.memmap(path, dtype=block['dtype'], mode=mmap_mode,
+                                         offset=data_offset + block['offset'], shape=tuple(block['shape']))
+            else:
+                arrays[name] = _read_block(f, data_offset, block, None if block['dtype'] == '|b1' else dtype)
+        table = InfosetTable.from_arrays(header['action_num'], fields, keys, arrays, dtype=dtype)
+
+        for header, data_offset in records[1:]:
+            blocks = {block['name']: block for block in header['blocks']}
+            for key in _read_keys(f, data_offset, blocks):
+                table.get_id(key)
+            rows = _read_block(f, data_offset, blocks['indices'])
+            for name in fields:
+                if name in blocks:
+                    table.arrays[name][rows] = _read_block(f, data_offset, blocks[name])
+
+    table.dirty[:] = False
+    table.saved_path = path
+    table.saved_num = len(table)
+    return table, header['meta']
+
+def compact_table(path, fields=None):
+    ''' Merge the deltas of a checkpoint file into a single full record, which
+        can then be memory-mapped
+
+    Args:
+        path (string): The path of the file
+        fields (dict): The fields and their initial values. If None, the
+          fields of the file are used
+    '''
+    table, meta = load_table(path, fields)
+    save_table(path, table, meta=meta, dtype=_stored_dtype(path))
+
+def _stored_dtype(path):
+    ''' The type of the values stored in the first record of a file
+    '''
+    records, _ = _read_records(path)
+    for block in records[0][0]['blocks']:
+        if block['name'] not in ('key_offsets', 'key_data', 'indices') and block['dtype'] != '|b1':
+            return np.dtype(block['dtype'])
+    return np.dtype(np.float32)
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def _write_record(f, record_type, table, first_key, rows, meta, dtype):
+    ''' Write a record at the current position of the file
+
+    Args:
+        f (file): The file, opened in binary mode
+        record_type (string): 'full' or 'delta'
+        table (InfosetTable): The table
+        first_key (int): The id of the first information set whose key is
+          written
+        rows (numpy.array): The ids of the rows to write, or None for all
+        meta (dict): The metadata
+        dtype (numpy.dtype): The type of the values
+    '''
+    size = len(table)
+    keys = table.keys[first_key:size]
+    key_offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    key_offsets[1:] = np.cumsum([len(key) for key in keys])
+    sources = [('key_offsets', key_offsets, None), ('key_data', np.frombuffer(b''.join(keys), dtype=np.uint8), None)]
+    if rows is not None:
+        sources.append(('indices', rows.astype(np.int64), None))
+    row_num = size if rows is None else len(rows)
+    for name in table.fields:
+        field_dtype = table.field_dtype(name)
+        sources.append((name, table.arrays[name], np.dtype(bool) if field_dtype == bool else np.dtype(dtype)))
+
+    blocks = []
+    offset = 0
+    for name, array, block_dtype in sources:
+        if block_dtype is None:
+            block_dtype, shape = array.dtype, array.shape
+        else:
+            shape = (row_num, table.action_num)
+        offset = _align(offset)
+        blocks.append({'name': name, 'dtype': block_dtype.str, 'shape': list(shape), 'offset': offset})
+        offset += block_dtype.itemsize * int(np.prod(shape))
+    header = json.dumps({'type': record_type,
+                         'action_num': table.action_num,
+                         'fields': {name: _json_value(value) for name, value in table.fields.items()},
+                         'num_keys': size,
+                         'meta': meta if meta is not None else {},
+                         'blocks': blocks,
+                         'size': offset}).encode()
+
+    start = f.tell()
+    f.write(MAGIC)
+    f.write(_LENGTH.pack(len(header)))
+    f.write(header)
+    data_offset = _align(start + len(MAGIC) + _LENGTH.size + len(header))
+    for block, (name, array, block_dtype) in zip(blocks, sources):
+        f.write(b'\0' * (data_offset + block['offset'] - f.tell()))
+        if len(array) == 0:
+            continue
+        if block_dtype is None:
+            f.write(array.tobytes())
+            continue
+        # The rows are converted in chunks to keep the copies small
+        for chunk_start in range(0, row_num, CHUNK_SIZE):
+            if rows is None:
+                chunk = array[chunk_start:min(chunk_start + CHUNK_SIZE, row_num)]
+            else:
+                chunk = array[rows[chunk_start:chunk_start + CHUNK_SIZE]]
+            f.write(np.ascontiguousarray(chunk, dtype=block_dtype).tobytes())
+    f.write(b'\0' * (data_offset + offset - f.tell()))
+
+def _json_value(value):
+    ''' Convert an initial value of a field to a JSON value
+    '''
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    return float(value)
+
+def _read_records(path):
+    ''' Read the headers of the complete records of a file
+
+    Args:
+        path (string): The path of the file
+
+    Returns:
+        (tuple): The list of the headers and of the offsets of their data,
+          and the end of the last complete record
+    '''
+    records = []
+    file_size = os.path.getsize(path)
+    offset = 0
+    with open(path, 'rb') as f:
+        while offset + len(MAGIC) + _LENGTH.size <= file_size:
+            f.seek(offset)
+            if f.read(len(MAGIC)) != MAGIC:
+                if offset == 0:
+                    raise ValueError('{} is not a checkpoint file'.format(path))
+                break
+            header_length, = _LENGTH.unpack(f.read(_LENGTH.size))
+            if offset + len(MAGIC) + _LENGTH.size + header_length > file_size:
+                break
+            try:
+                header = json.loads(f.read(header_length).decode())
+            except ValueError:
+                break
+            data_offset = _align(offset + len(MAGIC) + _LENGTH.size + header_length)
+            if data_offset + header['size'] > file_size:
+                break
+            records.append((header, data_offset))
+            offset = data_offset + header['size']
+    return records, offset
+
+def _read_block(f, data_offset, block, dtype=None):
+    ''' Read a data block into memory
+
+    Args:
+        f (file): The file
+        data_offset (int): The offset of the data of the record
+        block (dict): The description of the block in the header
+        dtype (numpy.dtype): If not None, the type to convert the block to
+
+    Returns:
+        (numpy.array): The block
+    '''
+    shape = tuple(block['shape'])
+    f.seek(data_offset + block['offset'])
+    array = np.fromfile(f, dtype=block['dtype'], count=int(np.prod(shape))).reshape(shape)
+    if dtype is not None:
+        array = array.astype(dtype, copy=False)
+    return array
+
+def _read_keys(f, data_offset, blocks):
+    ''' Read the keys of the information sets added by a record
+    '''
+    offsets = _read_block(f, data_offset, blocks['key_offsets'])
+    data = _read_block(f, data_offset, blocks['key_data']).tobytes()
+    return [data[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
@@ -0,0 +1,174 @@
+''' Save the generated trajectories to disk and read them back without
+    loading the whole dataset into memory
+'''
+import os
+import json
+import numpy as np
+
+INDEX_FILE = 'index.json'
+
+class TrajectoryWriter(object):
+    ''' TrajectoryWriter streams the transitions in the columnar format into
+        shards of a fixed number of transitions. Each column of a shard is
+        saved as a `.npy` file so that it can be memory-mapped, and an index
+        file records the shards that are complete.
+    '''
+
+    def __init__(self, dataset_dir, shard_size=100000):
+        ''' Initialize the writer
+
+        Args:
+            dataset_dir (str): The directory of the dataset. It must not
+              contain another dataset
+            shard_size (int): The number of transitions in each shard
+        '''
+        if shard_size <= 0:
+            raise ValueError('shard_size should be positive, got {}'.format(shard_size))
+        if os.path.exists(os.path.join(dataset_dir, INDEX_FILE)):
+            raise ValueError('A dataset already exists in {}'.format(dataset_dir))
+        os.makedirs(dataset_dir, exist_ok=True)
+
+        self.dataset_dir = dataset_dir
+        self.shard_size = shard_size
+        self.columns = None
+        self.shards = []
+        self.pending = []
+        self.pending_num = 0
+
+    def write(self, trajectories):
+        ''' Add the trajectories of some games to the dataset
+
+        Args:
+            trajectories (list): The trajectories returned by `env.run` with
+              `columnar=True`, i.e., one dict of columns for each player. A
+              `player_id` column is added to the transitions
+        '''
+        for player_id, columns in enumerate(trajectories):
+            transition_num = len(columns['action'])
+            if transition_num == 0:
+                continue
+            columns = dict(columns)
+            columns['player_id'] = np.full(transition_num, player_id, dtype=int)
+            if self.columns is None:
+                self.columns = {key: {'dtype': value.dtype.str, 'shape': list(value.shape[1:])} for key, value in columns.items()}
+            self.pending.append(columns)
+            self.pending_num += transition_num
+
+        while self.pending_num >= self.shard_size:
+            self._flush(self.shard_size)
+
+    def close(self):
+        ''' Write the remaining transitions as the last shard
+        '''
+        if self.pending_num > 0:
+            self._flush(self.pending_num)
+        elif not self.shards:
+            self._write_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _flush(self, size):
+        ''' Write the first `size` pending transitions as a new shard
+
+        Args:
+            size (int): The number of transitions in the shard
+        '''
+        merged = {key: np.concatenate([columns[key] for columns in self.pending]) for key in self.columns}
+        name = 'shard_{:05d}'.format(len(self.shards))
+        for key, value in merged.items():
+            np.save(os.path.join(self.dataset_dir, '{}_{}.npy'.format(name, key)), value[:size])
+
+        self.pending_num -= size
+        self.pending = [{key: value[size:] for key, value in merged.items()}] if self.pending_num > 0 else []
+        self.shards.append({'name': name, 'size': size})
+
+        # The index is rewritten after every shard so that an unfinished
+        # dataset can still be read
+        self._write_index()
+
+    def _write_index(self):
+        ''' Save the columns and the complete shards to the index file
+        '''
+        with open(os.path.join(self.dataset_dir, INDEX_FILE), 'w') as f:
+            json.dump({'columns': self.columns or {}, 'shards': self.shards}, f)
+
+class TrajectoryReader(object):
+    ''' TrajectoryReader memory-maps the shards written by `TrajectoryWriter`
+        and samples minibatches from them. Only the sampled rows are read
+        from disk.
+    '''
+
+    def __init__(self, dataset_dir, np_random=None):
+        ''' Initialize the reader
+
+        Args:
+            dataset_dir (str): The directory of the dataset
+            np_random (numpy.random.RandomState): The random generator for
+              sampling. A new one is created if None
+        '''
+        with open(os.path.join(dataset_dir, INDEX_FILE)) as f:
+            index = json.load(f)
+        self.columns = index['columns']
+        self.shards = []
+        for shard in index['shards']:
+            self.shards.append({key: np.load(os.path.join(dataset_dir, '{}_{}.npy'.format(shard['name'], key)), mmap_mode='r') for key in self.columns})
+        sizes = [shard['size'] for shard in index['shards']]
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(int)
+        self.np_random = np_random if np_random is not None else np.random.RandomState()
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def get_batch(self, indices):
+        ''' Read the transitions with the given indices
+
+        Args:
+            indices (numpy.array): The indices of the transitions in the dataset
+
+        Returns:
+            (dict): The columns of the transitions, in the order of `indices`
+        '''
+        indices = np.asarray(indices, dtype=int)
+        if len(indices) > 0 and (indices.min() < 0 or indices.max() >= len(self)):
+            raise ValueError('Index out of range for a dataset of {} transitions'.format(len(self)))
+        batch = {key: np.empty((len(indices),) + tuple(spec['shape']), dtype=np.dtype(spec['dtype']))
+                 for key, spec in self.columns.items()}
+        shard_ids = np.searchsorted(self.offsets, indices, side='right') - 1
+        for shard_id in np.unique(shard_ids):
+            positions = np.flatnonzero(shard_ids == shard_id)
+            rows = indices[positions] - self.offsets[shard_id]
+            # Sorted rows make the reads from the memory map sequential
+            order = np.argsort(rows)
+            for key in self.columns:
+                batch[key][positions[order]] = self.shards[shard_id][key][rows[order]]
+        return batch
+
+    def sample(self, batch_size):
+        ''' Sample a random minibatch with replacement
+
+        Args:
+            batch_size (int): The number of transitions
+
+        Returns:
+            (dict): The columns of the sampled transitions
+        '''
+        return self.get_batch(self.np_random.randint(0, len(self), size=batch_size))
+
+    def iterate(self, batch_size, shuffle=True):
+        ''' Iterate over the whole dataset once in minibatches
+
+        Args:
+            batch_size (int): The number of transitions in each minibatch
+            shuffle (boolean): True if the transitions should be visited in
+              a random order
+
+        Yields:
+            (dict): The columns of a minibatch
+        '''
+        indices = self.np_random.permutation(len(self)) if shuffle else np.arange(len(self))
+        for start in range(0, len(self), batch_size):
+            yield self.get_batch(indices[start:start+batch_size])
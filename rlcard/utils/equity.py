@@ -0,0 +1,252 @@
+''' Hand strength and equity of Hold'em hands
+
+The unknown cards are either enumerated exactly or sampled, and all the
+resulting hands are evaluated at once with `evaluate_batch`. The work is
+split into chunks, which can be sent to a pool of processes that is kept
+alive between the calls.
+'''
+import atexit
+import functools
+import itertools
+import multiprocessing as mp
+import numpy as np
+
+from rlcard.games.limitholdem.evaluator import card_to_id, evaluate_batch, RANK_LOOKUP, CATEGORY_SHIFT
+from rlcard.utils.seeding import derive_seed
+
+# The number of rows of the hands evaluated together
+CHUNK_SIZE = 1 << 16
+# The exact enumerations are refused above this number of outcomes
+MAX_EXACT_OUTCOMES = 10 ** 7
+
+_pool = None
+_pool_workers = 0
+
+def hand_strength(cards, short_deck=False, samples=None, seed=None, workers=1):
+    ''' Get the distribution of the category of a hand once it is completed
+        to 7 cards, e.g., the hole cards and the public cards of a player
+
+    Args:
+        cards (list): Up to 7 card strings, e.g., ['SA', 'HA']
+        short_deck (boolean): True for the 6+ deck and its rules
+        samples (int): The number of random completions. All of them are
+          enumerated if None
+        seed (int): The seed of the samples
+        workers (int): The number of processes. See `get_pool`
+
+    Returns:
+        (dict): A dict containing:
+
+            'categories' (numpy.array): The probability of each category,
+              indexed as `Hand.category` or `ShortHand.category`
+            'mean_category' (float): The average category
+            'num_boards' (int): The number of completions evaluated
+    '''
+    cards = _to_ids(cards, short_deck)
+    if len(cards) > 7:
+        raise ValueError('A hand has at most 7 cards, got {}'.format(len(cards)))
+    counts = _count(cards, [], 0, 7 - len(cards), short_deck, samples, seed, workers)
+    categories = counts['categories'] / counts['num']
+    return {'categories': categories,
+            'mean_category': float(np.dot(categories, np.arange(len(categories)))),
+            'num_boards': counts['num']}
+
+def equity(hole_cards, public_cards=None, opponents=1, short_deck=False, samples=None, seed=None, workers=1):
+    ''' Get the chances of a player against opponents with random hole cards
+
+    Args:
+        hole_cards (list): The 2 card strings of the player
+        public_cards (list): Up to 5 public card strings
+        opponents (int): The number of opponents. More than one opponent
+          needs `samples`
+        short_deck (boolean): True for the 6+ deck and its rules
+        samples (int): The number of random deals of the public cards and
+          of the hole cards of the opponents. All of them are enumerated if
+          None
+        seed (int): The seed of the samples
+        workers (int): The number of processes. See `get_pool`
+
+    Returns:
+        (dict): A dict containing:
+
+            'win' (float): The probability to win alone
+            'tie' (float): The probability to share the pot
+            'lose' (float): The probability to lose
+            'equity' (float): The expected share of the pot
+            'categories' (numpy.array): The probability of each category
+              of the player. See `hand_strength`
+            'num_boards' (int): The number of deals evaluated
+    '''
+    hole_cards = _to_ids(hole_cards, short_deck)
+    public_cards = _to_ids(public_cards or [], short_deck)
+    if len(hole_cards) != 2:
+        raise ValueError('A player has 2 hole cards, got {}'.format(len(hole_cards)))
+    if len(public_cards) > 5:
+        raise ValueError('There are at most 5 public cards, got {}'.format(len(public_cards)))
+    if opponents < 1:
+        raise ValueError('opponents should be positive, got {}'.format(opponents))
+    if samples is None and opponents > 1:
+        raise ValueError('The exact equity is only computed against one opponent, set samples')
+    counts = _count(hole_cards, public_cards, opponents, 5 - len(public_cards), short_deck, samples, seed, workers)
+    num = counts['num']
+    return {'win': counts['win'] / num,
+            'tie': counts['tie'] / num,
+            'lose': 1 - (counts['win'] + counts['tie']) / num,
+            'equity': counts['equity'] / num,
+            'categories': counts['categories'] / num,
+            'num_boards': num}
+
+def get_pool(workers, start_method='spawn'):
+    ''' Get the pool of processes, which is kept alive between the calls so
+        that the processes and their lookup tables are only built once
+
+    Args:
+        workers (int): The number of processes. A new pool is started if it
+          differs from the current one
+        start_method (string): The start method of the processes
+
+    Returns:
+        (multiprocessing.Pool): The pool
+    '''
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        close_pool()
+        _pool = mp.get_context(start_method).Pool(workers)
+        _pool_workers = workers
+    return _pool
+
+def close_pool():
+    ''' Stop the pool of processes if it is running
+    '''
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.close()
+        _pool.join()
+        _pool, _pool_workers = None, 0
+
+atexit.register(close_pool)
+
+def _to_ids(cards, short_deck):
+    ''' Convert card strings to ids and check them
+    '''
+    ids = [card_to_id(card) for card in cards]
+    if len(set(ids)) != len(ids):
+        raise ValueError('The cards should be distinct, got {}'.format(cards))
+    if short_deck and any(card_id < 16 for card_id in ids):
+        raise ValueError('The 6+ deck has no card below 6, got {}'.format(cards))
+    return ids
+
+def _get_deck(known, short_deck):
+    ''' The ids of the cards that are not known
+    '''
+    first = 4 * RANK_LOOKUP.index('6') if short_deck else 0
+    return np.array([card_id for card_id in range(first, 52) if card_id not in known], dtype=np.uint8)
+
+@functools.lru_cache(maxsize=8)
+def _combinations(n, k):
+    ''' All the k-combinations of range(n), as an array of shape (C(n, k), k)
+        with increasing rows. The result is shared, so it should not be
+        modified
+    '''
+    combinations = np.zeros((1, 0), dtype=np.uint8)
+    for _ in range(k):
+        # Extend every combination with each larger element
+        last = combinations[:, -1].astype(np.int64) if combinations.shape[1] else np.full(len(combinations), -1)
+        parts = []
+        for element in range(n):
+            rows = combinations[last < element]
+            parts.append(np.hstack([rows, np.full((len(rows), 1), element, dtype=np.uint8)]))
+        combinations = np.concatenate(parts)
+    return combinations
+
+def _count(hole_cards, public_cards, opponents, board_num, short_deck, samples, seed, workers):
+    ''' Split the deals into tasks, run them and sum their counts
+    '''
+    deck = _get_deck(hole_cards + public_cards, short_deck)
+    draw_num = board_num + 2 * opponents
+    if samples is None:
+        # The opponent takes 2 of the drawn cards in every possible way
+        splits = [tuple(i for i in range(draw_num) if i not in pair) + pair
+                  for pair in itertools.combinations(range(draw_num), 2)] if opponents else [tuple(range(draw_num))]
+        combination_num = _comb(len(deck), draw_num)
+        if combination_num * len(splits) > MAX_EXACT_OUTCOMES:
+            raise ValueError('Too many outcomes to enumerate ({}), set samples'.format(combination_num * len(splits)))
+        combinations = _combinations(len(deck), draw_num)
+        tasks = [(_enumerate_draws, (deck, combinations[start:start + CHUNK_SIZE], splits))
+                 for start in range(0, len(combinations), CHUNK_SIZE)]
+    else:
+        if samples <= 0:
+            raise ValueError('samples should be positive, got {}'.format(samples))
+        if seed is None:
+            seed = np.random.randint(0, 2**31)
+        # The chunks have fixed sizes and seeds, so the result only depends
+        # on the seed, not on the number of workers
+        tasks = [(_sample_draws, (deck, draw_num, min(CHUNK_SIZE, samples - start), derive_seed(seed, i)))
+                 for i, start in enumerate(range(0, samples, CHUNK_SIZE))]
+    tasks = [(draws, args, hole_cards, public_cards, opponents, short_deck) for draws, args in tasks]
+    if workers > 1 and len(tasks) > 1:
+        results = get_pool(workers).map(_run_task, tasks)
+    else:
+        results = map(_run_task, tasks)
+
+    counts = {'num': 0, 'win': 0, 'tie': 0, 'equity': 0.0, 'categories': np.zeros(10, dtype=np.int64)}
+    for result in results:
+        for key, value in result.items():
+            counts[key] = counts[key] + value
+    return counts
+
+def _comb(n, k):
+    ''' The number of k-combinations of n elements
+    '''
+    if k > n:
+        return 0
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+def _enumerate_draws(deck, combinations, splits):
+    ''' The cards of a chunk of combinations, once for each split
+    '''
+    draws = deck[combinations]
+    return np.concatenate([draws[:, np.array(split, dtype=np.intp)] for split in splits])
+
+def _sample_draws(deck, draw_num, size, seed):
+    ''' Draw random cards without replacement with a partial Fisher-Yates
+        shuffle of every row
+    '''
+    np_random = np.random.RandomState(seed % 2**32)
+    decks = np.tile(deck, (size, 1))
+    rows = np.arange(size)
+    for i in range(draw_num):
+        picks = np_random.randint(i, len(deck), size=size)
+        picked = decks[rows, picks]
+        decks[rows, picks] = decks[:, i]
+        decks[:, i] = picked
+    return decks[:, :draw_num]
+
+def _run_task(task):
+    ''' Evaluate the deals of one task. The first cards of each draw complete
+        the public cards, and each opponent takes the next 2 cards
+
+    Returns:
+        (dict): The counts of the task
+    '''
+    draw_func, args, hole_cards, public_cards, opponents, short_deck = task
+    draws = draw_func(*args)
+    num = len(draws)
+    board_num = draws.shape[1] - 2 * opponents
+    common = np.hstack([np.tile(np.array(public_cards, dtype=np.uint8), (num, 1)), draws[:, :board_num]])
+    strengths = evaluate_batch(np.hstack([np.tile(np.array(hole_cards, dtype=np.uint8), (num, 1)), common]), short_deck)
+    counts = {'num': num, 'categories': np.bincount(strengths >> CATEGORY_SHIFT, minlength=10)}
+    if opponents:
+        opponent_strengths = np.stack([evaluate_batch(np.hstack([draws[:, board_num + 2 * i:board_num + 2 * i + 2], common]), short_deck)
+                                       for i in range(opponents)])
+        best = opponent_strengths.max(axis=0)
+        win = strengths > best
+        tie = strengths == best
+        tied_num = (opponent_strengths == strengths).sum(axis=0)
+        counts['win'] = int(win.sum())
+        counts['tie'] = int(tie.sum())
+        counts['equity'] = float(win.sum() + (tie / (1 + tied_num)).sum())
+    return counts
@@ -0,0 +1,292 @@
+''' Evaluate agents on many games in parallel
+'''
+import os
+import math
+import queue
+import random
+import multiprocessing as mp
+import numpy as np
+
+from rlcard.utils.utils import run_duplicate_deal
+from rlcard.utils.seeding import derive_seed
+
+# The interval in seconds at which the workers are checked while waiting for
+# a result
+POLL_INTERVAL = 1.0
+
+def parallel_tournament(env_id, agent_factories, num_games, workers=None, config=None,
+                        seed=0, ci_width=None, confidence=0.95, chunk_size=1000,
+                        start_method='spawn', duplicate=False):
+    ''' Evaluate the agents on `num_games` games with several processes. The
+        games are split into chunks of `chunk_size` games. Chunk k is always
+        played with the same seed, and the chunks are merged in their order,
+        so the results only depend on `seed`, not on the number of workers.
+
+    Args:
+        env_id (string): The id of the environment, e.g., 'leduc-holdem'
+        agent_factories (list): One callable for each seat that returns the
+          agent of the seat. They are called in the workers, so they need to
+          be picklable, e.g., classes or functions defined at module level
+        num_games (int): The maximum number of games to play
+        workers (int): The number of processes. It defaults to the number of
+          CPUs. If it is 0, the games are played in the current process
+        config (dict): The config of the environment. See `rlcard.make`
+        seed (int): The seed from which the seeds of the chunks are derived
+        ci_width (float): If not None, stop as soon as the confidence interval
+          of the mean payoff of every seat is narrower than `ci_width`. It is
+          checked after each chunk
+        confidence (float): The confidence level of the intervals
+        chunk_size (int): The number of games in each chunk
+        start_method (string): The start method of the processes
+        duplicate (boolean): True if each deal should be played from every
+          permutation of the seats. See `tournament`. The payoffs and the
+          number of games are then counted per agent and per deal
+
+    Returns:
+        (dict): A dict containing:
+
+            'payoffs' (list): The average payoff of each seat
+            'std_errors' (list): The standard error of each average payoff
+            'num_games' (int): The number of games played
+    '''
+    if num_games <= 0:
+        raise ValueError('num_games should be positive, got {}'.format(num_games))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    config = dict(config) if config is not None else {}
+    chunk_num = (num_games + chunk_size - 1) // chunk_size
+    chunks = [(k, min(chunk_size, num_games - k * chunk_size)) for k in range(chunk_num)]
+    z = normal_quantile((1 + confidence) / 2)
+
+    stats = RunningStats(len(agent_factories))
+    if workers == 0:
+        runner = _ChunkRunner(env_id, agent_factories, config, seed, duplicate)
+        for k, size in chunks:
+            stats.merge(runner.run_chunk(k, size))
+            if _is_narrow(stats, z, ci_width):
+                break
+        return stats.summary()
+
+    ctx = mp.get_context(start_method)
+    task_queue, result_queue = ctx.Queue(), ctx.Queue()
+    ps = [ctx.Process(target=_tournament_worker,
+                      args=(task_queue, result_queue, env_id, agent_factories, config, seed, duplicate),
+                      daemon=True)
+          for _ in range(min(workers, chunk_num))]
+    for p in ps:
+        p.start()
+
+    # Keep every worker busy with two chunks, and merge the results in the
+    # order of the chunks so that early stopping is deterministic
+    sent, merged = 0, 0
+    pending = {}
+    try:
+        while sent < min(2 * len(ps), chunk_num):
+            task_queue.put(chunks[sent])
+            sent += 1
+        while merged < chunk_num:
+            k, chunk_stats = _get_result(result_queue, ps)
+            if isinstance(chunk_stats, Exception):
+                raise chunk_stats
+            pending[k] = chunk_stats
+            if sent < chunk_num:
+                task_queue.put(chunks[sent])
+                sent += 1
+            while merged in pending:
+                stats.merge(pending.pop(merged))
+                merged += 1
+                if _is_narrow(stats, z, ci_width):
+                    return stats.summary()
+        return stats.summary()
+    finally:
+        # Drop the chunks that are not started yet, so that the workers stop
+        # after their current chunk
+        try:
+            while True:
+                task_queue.get(timeout=0.1)
+        except queue.Empty:
+            pass
+        for _ in ps:
+            task_queue.put(None)
+        for p in ps:
+            p.join(timeout=10)
+            if p.is_alive():
+                p.terminate()
+
+def normal_quantile(p):
+    ''' The quantile of the standard normal distribution, computed by
+        bisection of its cumulative distribution function
+
+    Args:
+        p (float): The probability, in (0, 1)
+
+    Returns:
+        (float): The value z such that P(Z <= z) = p
+    '''
+    if not 0 < p < 1:
+        raise ValueError('p should be in (0, 1), got {}'.format(p))
+    low, high = -40.0, 40.0
+    for _ in range(100):
+        middle = (low + high) / 2
+        if (1 + math.erf(middle / math.sqrt(2))) / 2 < p:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+class RunningStats(object):
+    ''' The count, mean and sum of squared deviations of the payoffs of each
+        seat. Two running stats are merged with the parallel algorithm of
+        Chan et al., which is numerically stable.
+    '''
+
+    def __init__(self, seat_num):
+        ''' Initialize empty stats
+
+        Args:
+            seat_num (int): The number of seats
+        '''
+        self.n = 0
+        self.mean = np.zeros(seat_num)
+        self.m2 = np.zeros(seat_num)
+
+    def add(self, payoffs):
+        ''' Add the payoffs of one game
+
+        Args:
+            payoffs (list): The payoff of each seat
+        '''
+        self.n += 1
+        delta = np.asarray(payoffs, dtype=float) - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (np.asarray(payoffs, dtype=float) - self.mean)
+
+    def merge(self, other):
+        ''' Merge the stats of other games
+
+        Args:
+            other (RunningStats): The stats to merge
+        '''
+        n = self.n + other.n
+        if n == 0:
+            return
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.n / n
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.n * other.n / n
+        self.n = n
+
+    def std_errors(self):
+        ''' Return the standard error of the mean of each seat
+        '''
+        if self.n < 2:
+            return np.full(len(self.mean), np.inf)
+        return np.sqrt(self.m2 / (self.n - 1) / self.n)
+
+    def summary(self):
+        ''' Return the result of the tournament
+
+        Returns:
+            (dict): See `parallel_tournament`
+        '''
+        return {'payoffs': self.mean.tolist(),
+                'std_errors': self.std_errors().tolist(),
+                'num_games': self.n}
+
+class _ChunkRunner(object):
+    ''' Play the chunks of a tournament with one environment
+    '''
+
+    def __init__(self, env_id, agent_factories, config, seed, duplicate=False):
+        from rlcard.envs.registration import make
+        self.env = make(env_id, config)
+        self.env.set_agents([factory() for factory in agent_factories])
+        self.seed = seed
+        self.duplicate = duplicate
+
+    def run_chunk(self, k, size):
+        ''' Play one chunk of games
+
+        Args:
+            k (int): The index of the chunk
+            size (int): The number of games in the chunk
+
+        Returns:
+            (RunningStats): The stats of the chunk
+        '''
+        chunk_seed = chunk_seed_of(self.seed, k)
+        self.env._seed(chunk_seed)
+        # The agents may use the global generators. NumPy only accepts
+        # 32-bit seeds
+        np.random.seed(chunk_seed % 2**32)
+        random.seed(chunk_seed)
+
+        stats = RunningStats(self.env.player_num)
+        for i in range(size):
+            if self.duplicate:
+                payoffs = run_duplicate_deal(self.env, derive_seed(chunk_seed, i))
+            else:
+                _, payoffs = self.env.run(is_training=False)
+            stats.add(payoffs)
+        return stats
+
+def chunk_seed_of(seed, k):
+    ''' Derive the seed of a chunk. The seeds of different chunks are
+        independent, instead of being consecutive integers.
+
+    Args:
+        seed (int): The seed of the tournament
+        k (int): The index of the chunk
+
+    Returns:
+        (int): The seed of chunk k
+    '''
+    return derive_seed(seed, k)
+
+def _is_narrow(stats, z, ci_width):
+    ''' Check whether the confidence intervals of all the seats are narrower
+        than `ci_width`
+    '''
+    if ci_width is None or stats.n < 2:
+        return False
+    return bool(np.all(2 * z * stats.std_errors() <= ci_width))
+
+def _get_result(result_queue, ps):
+    ''' Wait for the result of a chunk, and fail if a worker has died, e.g.,
+        because it was killed by a signal or ran out of memory
+
+    Args:
+        result_queue (multiprocessing.Queue): The queue of the results
+        ps (list): The worker processes
+
+    Returns:
+        (tuple): The index of the chunk and its stats or its exception
+    '''
+    while True:
+        try:
+            return result_queue.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            for p in ps:
+                if p.exitcode is not None:
+                    raise RuntimeError('A worker of the tournament exited with code {}'.format(p.exitcode))
+
+def _tournament_worker(task_queue, result_queue, env_id, agent_factories, config, seed, duplicate):
+    ''' Play the chunks in `task_queue` until None is received
+    '''
+    # The results that are not collected after an early stop can be dropped
+    result_queue.cancel_join_thread()
+    try:
+        runner = _ChunkRunner(env_id, agent_factories, config, seed, duplicate)
+    except Exception as e:
+        runner, error = None, e
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        k, size = task
+        if runner is None:
+            result_queue.put((k, error))
+            continue
+        try:
+            result_queue.put((k, runner.run_chunk(k, size)))
+        except Exception as e:
+            result_queue.put((k, e))
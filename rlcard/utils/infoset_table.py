@@ -0,0 +1,299 @@
+''' Dense storage of the tabular values of the information sets
+'''
+import os
+import collections.abc
+import numpy as np
+
+KEYS_FILE = 'infoset_keys.npy'
+OFFSETS_FILE = 'infoset_offsets.npy'
+
+class InfosetTable(object):
+    ''' InfosetTable maps the key of each information set, e.g., the bytes of
+        the observation, to a dense integer id the first time it is seen. The
+        values of the information sets are stored in contiguous arrays of
+        shape (capacity, action_num), one per field, whose first `len(table)`
+        rows are used. The arrays grow by doubling, so the rows should be
+        accessed through `array` again after adding information sets.
+
+        The rows of the information sets looked up with `get_id` are marked
+        as dirty, so that a checkpoint only saves the rows that may have
+        changed since the previous save. See `rlcard.utils.checkpoint`. The
+        rows changed by whole-array operations should be marked with `touch`.
+    '''
+
+    def __init__(self, action_num, fields, capacity=1024, dtype=np.float64):
+        ''' Initialize the table
+
+        Args:
+            action_num (int): The number of actions
+            fields (dict): A dict from the name of each field, e.g.,
+              'regrets', to the initial value of its rows. The fields whose
+              initial value is a boolean are masks, e.g., of the legal actions
+            capacity (int): The number of rows allocated at first
+            dtype (numpy.dtype): The type of the values
+        '''
+        if capacity <= 0:
+            raise ValueError('capacity should be positive, got {}'.format(capacity))
+        self.action_num = action_num
+        self.fields = dict(fields)
+        self.dtype = np.dtype(dtype)
+        self.index = {}
+        self.keys = []
+        self.arrays = {name: np.full((capacity, action_num), value, dtype=self.field_dtype(name))
+                       for name, value in self.fields.items()}
+        self.dirty = np.zeros(capacity, dtype=bool)
+        # The checkpoint file that holds the first `saved_num` information
+        # sets and the rows that are not dirty
+        self.saved_path = None
+        self.saved_num = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    @property
+    def capacity(self):
+        ''' The number of rows allocated
+        '''
+        return len(next(iter(self.arrays.values())))
+
+    def field_dtype(self, name):
+        ''' The type of the values of a field
+
+        Args:
+            name (string): The name of the field
+
+        Returns:
+            (numpy.dtype): bool for the masks, and the type of the table
+              otherwise
+        '''
+        if isinstance(self.fields[name], (bool, np.bool_)):
+            return np.dtype(bool)
+        return self.dtype
+
+    def get_id(self, key):
+        ''' Get the id of an information set, adding it if it is new
+
+        Args:
+            key (bytes): The key of the information set
+
+        Returns:
+            (int): The id, i.e., the row in the arrays
+        '''
+        infoset = self.index.get(key)
+        if infoset is None:
+            infoset = len(self.keys)
+            if infoset == self.capacity:
+                self.reserve(max(2 * infoset, 1))
+            self.index[key] = infoset
+            self.keys.append(key)
+        self.dirty[infoset] = True
+        return infoset
+
+    def find(self, key):
+        ''' Get the id of an information set without adding it
+
+        Args:
+            key (bytes): The key of the information set
+
+        Returns:
+            (int): The id, or -1 if the information set is not in the table
+        '''
+        return self.index.get(key, -1)
+
+    def reserve(self, capacity):
+        ''' Allocate rows for at least `capacity` information sets. The new
+            rows are set to the initial values of the fields
+
+        Args:
+            capacity (int): The number of rows
+        '''
+        if capacity <= self.capacity:
+            return
+        for name, array in self.arrays.items():
+            grown = np.full((capacity, self.action_num), self.fields[name], dtype=self.field_dtype(name))
+            grown[:len(self)] = array[:len(self)]
+            self.arrays[name] = grown
+        dirty = np.zeros(capacity, dtype=bool)
+        dirty[:len(self)] = self.dirty[:len(self)]
+        self.dirty = dirty
+
+    def touch(self, rows=None):
+        ''' Mark rows as dirty
+
+        Args:
+            rows (numpy.array): The ids or a boolean mask of the rows. All
+              the rows are marked if None
+        '''
+        if rows is None:
+            self.dirty[:len(self)] = True
+        else:
+            self.dirty[:len(self)][rows] = True
+
+    def truncate(self, size):
+        ''' Remove the information sets added after the first `size` ones.
+            Their rows are set back to the initial values of the fields
+
+        Args:
+            size (int): The number of information sets to keep
+        '''
+        for key in self.keys[size:]:
+            del self.index[key]
+        for name, array in self.arrays.items():
+            array[size:len(self)] = self.fields[name]
+        self.dirty[size:len(self)] = False
+        del self.keys[size:]
+
+    def array(self, name):
+        ''' Get the used rows of a field
+
+        Args:
+            name (string): The name of the field
+
+        Returns:
+            (numpy.array): A view of shape (len(table), action_num)
+        '''
+        return self.arrays[name][:len(self)]
+
+    def view(self, name):
+        ''' Get a dict-like view of a field, keyed as the table
+
+        Args:
+            name (string): The name of the field
+
+        Returns:
+            (InfosetView): The view
+        '''
+        return InfosetView(self, name)
+
+    def save(self, directory):
+        ''' Save the keys and the used rows of the fields as .npy files
+
+        Args:
+            directory (string): The directory. The files of a previous table
+              are overwritten
+        '''
+        os.makedirs(directory, exist_ok=True)
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(key) for key in self.keys])
+        np.save(os.path.join(directory, KEYS_FILE), np.frombuffer(b''.join(self.keys), dtype=np.uint8))
+        np.save(os.path.join(directory, OFFSETS_FILE), offsets)
+        for name in self.fields:
+            np.save(os.path.join(directory, name + '.npy'), self.array(name))
+
+    @classmethod
+    def load(cls, directory, fields, mmap_mode=None, dtype=np.float64):
+        ''' Load a table saved by `save`
+
+        Args:
+            directory (string): The directory
+            fields (dict): The fields and their initial values. See
+              `__init__`. The fields that were not saved are set to their
+              initial values
+            mmap_mode (string): If not None, the arrays are memory-mapped
+              with this mode instead of being read, e.g., 'r' to share a
+              read-only table between processes. Adding information sets
+              copies the arrays to memory
+            dtype (numpy.dtype): The type of the values of the fields that
+              were not saved
+
+        Returns:
+            (InfosetTable): The table
+        '''
+        data = np.load(os.path.join(directory, KEYS_FILE)).tobytes()
+        offsets = np.load(os.path.join(directory, OFFSETS_FILE))
+        # Empty files cannot be memory-mapped
+        if len(offsets) == 1:
+            mmap_mode = None
+        arrays = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode=mmap_mode) for name in fields
+                  if os.path.exists(os.path.join(directory, name + '.npy'))}
+        if not arrays:
+            raise ValueError('No field of the table is saved in {}'.format(directory))
+        keys = [data[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        return cls.from_arrays(next(iter(arrays.values())).shape[1], fields, keys, arrays, dtype=dtype)
+
+    @classmethod
+    def from_arrays(cls, action_num, fields, keys, arrays, dtype=np.float64):
+        ''' Build a table on existing arrays, e.g., memory-mapped ones
+
+        Args:
+            action_num (int): The number of actions
+            fields (dict): The fields and their initial values
+            keys (list): The keys of the information sets, in the order of
+              the rows
+            arrays (dict): A dict from the name of each field to its array,
+              of shape (len(keys), action_num). The arrays are used as they
+              are. The fields that are missing are set to the initial values
+            dtype (numpy.dtype): The type of the values if no field is
+              given. Otherwise the type of the arrays is kept
+
+        Returns:
+            (InfosetTable): The table. All the rows are dirty
+        '''
+        shape = (len(keys), action_num)
+        dtype = next((array.dtype for array in arrays.values() if array.dtype != bool), dtype)
+        table = cls(action_num, fields, capacity=1, dtype=dtype)
+        table.keys = list(keys)
+        table.index = {key: infoset for infoset, key in enumerate(table.keys)}
+        table.arrays = {name: arrays[name] if name in arrays else np.full(shape, value, dtype=table.field_dtype(name))
+                        for name, value in table.fields.items()}
+        table.dirty = np.ones(shape[0], dtype=bool)
+        return table
+
+    @classmethod
+    def from_dicts(cls, action_num, fields, dicts, dtype=np.float64):
+        ''' Build a table from dicts of rows, e.g., the dicts of a CFR agent
+            saved by an earlier version
+
+        Args:
+            action_num (int): The number of actions
+            fields (dict): The fields and their initial values
+            dicts (dict): A dict from the name of each field to a dict from
+              the keys to the rows. The rows that are missing are set to the
+              initial values
+
+        Returns:
+            (InfosetTable): The table
+        '''
+        table = cls(action_num, fields, dtype=dtype)
+        for name, rows in dicts.items():
+            for key, row in rows.items():
+                table.arrays[name][table.get_id(key)] = row
+        return table
+
+class InfosetView(collections.abc.MutableMapping):
+    ''' A dict-like view of a field of an `InfosetTable`, which is a
+        drop-in replacement of the dicts from keys to numpy arrays. The rows
+        are writable views of the arrays, and setting a row adds the key to
+        the table
+    '''
+
+    def __init__(self, table, name):
+        self.table = table
+        self.name = name
+
+    def __getitem__(self, key):
+        infoset = self.table.find(key)
+        if infoset < 0:
+            raise KeyError(key)
+        # The row may be modified in place
+        self.table.dirty[infoset] = True
+        return self.table.arrays[self.name][infoset]
+
+    def __setitem__(self, key, row):
+        infoset = self.table.get_id(key)
+        self.table.arrays[self.name][infoset] = row
+
+    def __delitem__(self, key):
+        raise TypeError('The information sets cannot be removed from the table')
+
+    def __contains__(self, key):
+        return key in self.table.index
+
+    def __iter__(self):
+        return iter(self.table.keys)
+
+    def __len__(self):
+        return len(self.table)
@@ -0,0 +1,313 @@
+''' Train the CFR agents with several processes
+'''
+import os
+import weakref
+import multiprocessing as mp
+import numpy as np
+
+from rlcard.utils.seeding import derive_seed, spawn_seeds
+
+class ParallelCFRTrainer(object):
+    ''' ParallelCFRTrainer runs the traversals of a CFR agent, e.g.,
+        `CFRAgent` or `MCCFRAgent`, in worker processes that each hold an env
+        and a shard of the table. At each iteration:
+
+        1. The policy of the master table is sent to the workers through
+           shared memory, with the keys of the information sets that are new
+           to them.
+        2. Each worker runs `sync_every` times `traverse_players` from its
+           own deals, and accumulates the deltas of the regrets and of the
+           average policy in its shard.
+        3. The deltas are written to shared memory, the deltas of the
+           information sets that are new to the master are sent through the
+           pipe, and the master adds them up in the order of the workers.
+        4. The master updates the policy, e.g., with the discounts of
+           `CFRPlusAgent`.
+
+        The env of worker i is seeded with `derive_seed(seed, i)`, and its
+        agent, if it samples the actions, with `derive_seed(seed, i, 1)`. So
+        the training is deterministic for a fixed seed and number of workers.
+    '''
+
+    def __init__(self, env_id, agent_factory, workers=None, config=None, seed=0,
+                 sync_every=1, start_method='spawn'):
+        ''' Initialize the trainer and start the workers
+
+        Args:
+            env_id (string): The id of the environment, e.g., 'leduc-holdem'
+            agent_factory (callable): A function that takes an env and
+              returns a new agent. It is called in the workers, so it needs
+              to be picklable, e.g., a class or a function defined at module
+              level
+            workers (int): The number of processes. It defaults to the number
+              of CPUs. If it is 0, a single shard is trained in the current
+              process, which gives the same result as 1 worker
+            config (dict): The config of the environment. See `rlcard.make`.
+              `allow_step_back` is set by default
+            seed (int): The seed from which the seeds of the workers are derived
+            sync_every (int): The number of calls of `traverse_players` of
+              each worker in each iteration
+            start_method (string): The start method of the processes
+        '''
+        from rlcard.envs.registration import make
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 0:
+            raise ValueError('workers should be non-negative, got {}'.format(workers))
+        if sync_every <= 0:
+            raise ValueError('sync_every should be positive, got {}'.format(sync_every))
+        config = dict(config) if config is not None else {}
+        config.setdefault('allow_step_back', True)
+
+        self.agent = agent_factory(make(env_id, dict(config, seed=seed)))
+        self.table = self.agent.table
+        self.sync_every = sync_every
+        self.synced = 0
+        self.capacity = 0
+        self.buffers = []
+        self.remotes = []
+        self.ps = []
+        self.local_shard = None
+
+        worker_configs = [dict(config, seed=worker_seed) for worker_seed in spawn_seeds(seed, max(workers, 1))]
+        agent_seeds = [derive_seed(seed, i, 1) for i in range(max(workers, 1))]
+        if workers == 0:
+            self.local_shard = _Shard(agent_factory(make(env_id, worker_configs[0])), agent_seeds[0])
+            return
+
+        ctx = mp.get_context(start_method)
+        pipes = [ctx.Pipe() for _ in range(workers)]
+        self.remotes = [remote for remote, _ in pipes]
+        self.ps = [ctx.Process(target=_cfr_worker,
+                               args=(work_remote, remote, env_id, worker_config, agent_factory, agent_seed),
+                               daemon=True)
+                   for (remote, work_remote), worker_config, agent_seed in zip(pipes, worker_configs, agent_seeds)]
+        for p in self.ps:
+            p.start()
+        for _, work_remote in pipes:
+            work_remote.close()
+        self._close = weakref.finalize(self, _close_workers, self.remotes, self.ps, self.buffers)
+
+    def train(self):
+        ''' Do one iteration: the traversals of all the workers, the merge of
+            their deltas and the update of the policy
+        '''
+        self.agent.iteration += 1
+        size = len(self.table)
+        new_keys = self.table.keys[self.synced:size]
+        self.synced = size
+
+        if self.local_shard is not None:
+            policy = self.table.array('policy')
+            results = [self.local_shard.run(new_keys, policy, self.agent.iteration, self.sync_every)]
+        else:
+            if not self.buffers or size > self.capacity:
+                self._reallocate(max(size, 2 * self.capacity, 1024))
+            self.buffers[0].policy[:size] = self.table.array('policy')
+            for remote in self.remotes:
+                remote.send(('train', (new_keys, self.agent.iteration, self.sync_every)))
+            results = []
+            for remote, buffer in zip(self.remotes, self.buffers[1:]):
+                result = remote.recv()
+                if isinstance(result, Exception):
+                    raise result
+                keys, rows = result
+                results.append(({name: buffer.fields[name][:size] for name in buffer.fields}, keys, rows))
+
+        # Add the deltas in the order of the workers, so that the sums do not
+        # depend on the timing of the processes
+        for deltas, keys, rows in results:
+            for name, delta in deltas.items():
+                _accumulate(self.table.arrays[name][:size], delta)
+                self.table.touch(np.flatnonzero(delta.any(axis=1)))
+            for i, key in enumerate(keys):
+                infoset = self.table.get_id(key)
+                for name, row in rows.items():
+                    _accumulate(self.table.arrays[name][infoset], row[i])
+
+        self.agent.update_policy()
+
+    def close(self):
+        ''' Stop the workers and release the shared memory
+        '''
+        if self.ps:
+            self._close()
+
+    def _reallocate(self, capacity):
+        ''' Allocate larger shared memory blocks and attach the workers
+        '''
+        for buffer in self.buffers:
+            buffer.close(unlink=True)
+        fields = [name for name in self.table.fields if name != 'policy']
+        dtypes = {name: self.table.field_dtype(name) for name in self.table.fields}
+        self.buffers[:] = [SharedFields(capacity, self.table.action_num, {'policy': dtypes['policy']})]
+        self.buffers.extend(SharedFields(capacity, self.table.action_num, {name: dtypes[name] for name in fields})
+                            for _ in self.remotes)
+        for remote, buffer in zip(self.remotes, self.buffers[1:]):
+            remote.send(('attach', (self.buffers[0].spec(), buffer.spec())))
+        for remote in self.remotes:
+            result = remote.recv()
+            if isinstance(result, Exception):
+                raise result
+        self.capacity = capacity
+
+class SharedFields(object):
+    ''' Arrays of shape (capacity, action_num) in one shared memory block
+    '''
+
+    def __init__(self, capacity, action_num, dtypes, name=None):
+        ''' Create or attach the block
+
+        Args:
+            capacity (int): The number of rows
+            action_num (int): The number of actions
+            dtypes (dict): The type of each field
+            name (string): The name of the block to attach. A new block is
+              created if None
+        '''
+        from multiprocessing import shared_memory
+        self.capacity = capacity
+        self.action_num = action_num
+        self.dtypes = {name: np.dtype(dtype) for name, dtype in dtypes.items()}
+        size = sum(dtype.itemsize for dtype in self.dtypes.values()) * capacity * action_num
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.fields = {}
+        offset = 0
+        for field, dtype in self.dtypes.items():
+            self.fields[field] = np.ndarray((capacity, action_num), dtype=dtype, buffer=self.shm.buf, offset=offset)
+            offset += dtype.itemsize * capacity * action_num
+
+    @property
+    def policy(self):
+        ''' The policy field of the block of the master
+        '''
+        return self.fields['policy']
+
+    def spec(self):
+        ''' The arguments to attach the block in another process
+        '''
+        return (self.capacity, self.action_num, {name: dtype.str for name, dtype in self.dtypes.items()}, self.shm.name)
+
+    def close(self, unlink=False):
+        ''' Detach the block
+
+        Args:
+            unlink (boolean): True to also destroy the block
+        '''
+        self.fields = {}
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+class _Shard(object):
+    ''' The agent of a worker. The first information sets of its table are
+        the ones of the master table, in the same order, and the other ones
+        are new to the master
+    '''
+
+    def __init__(self, agent, agent_seed):
+        self.agent = agent
+        self.synced = 0
+        if hasattr(agent, 'np_random'):
+            agent.np_random = np.random.RandomState(agent_seed % 2**32)
+
+    def run(self, new_keys, policy, iteration, traversals):
+        ''' Run the traversals of one iteration from the current policy
+
+        Args:
+            new_keys (list): The keys added to the master table since the
+              previous iteration
+            policy (numpy.array): The policy of the master table
+            iteration (int): The iteration
+            traversals (int): The number of calls of `traverse_players`
+
+        Returns:
+            (tuple): The deltas of the fields of the information sets of the
+              master table, the keys of the new information sets and the
+              deltas of their fields
+        '''
+        table = self.agent.table
+        table.truncate(self.synced)
+        for key in new_keys:
+            table.get_id(key)
+        self.synced = len(table)
+        for name, value in table.fields.items():
+            if name == 'policy':
+                table.array(name)[:] = policy[:self.synced]
+            else:
+                table.array(name)[:] = value
+
+        self.agent.iteration = iteration
+        for _ in range(traversals):
+            self.agent.traverse_players()
+
+        deltas = {name: table.arrays[name][:self.synced] for name in table.fields if name != 'policy'}
+        rows = {name: table.arrays[name][self.synced:len(table)].copy() for name in deltas}
+        return deltas, table.keys[self.synced:], rows
+
+def _accumulate(total, delta):
+    ''' Add deltas in place, or combine masks
+    '''
+    if total.dtype == bool:
+        total |= delta
+    else:
+        total += delta
+
+def _cfr_worker(remote, parent_remote, env_id, config, agent_factory, agent_seed):
+    ''' The loop of a worker process
+    '''
+    from rlcard.envs.registration import make
+    parent_remote.close()
+    policy_buffer, delta_buffer = None, None
+    try:
+        shard = _Shard(agent_factory(make(env_id, config)), agent_seed)
+        while True:
+            cmd, data = remote.recv()
+            if cmd == 'attach':
+                for buffer in (policy_buffer, delta_buffer):
+                    if buffer is not None:
+                        buffer.close()
+                policy_spec, delta_spec = data
+                policy_buffer = SharedFields(*policy_spec[:3], name=policy_spec[3])
+                delta_buffer = SharedFields(*delta_spec[:3], name=delta_spec[3])
+                remote.send(None)
+            elif cmd == 'train':
+                new_keys, iteration, traversals = data
+                try:
+                    deltas, keys, rows = shard.run(new_keys, policy_buffer.policy, iteration, traversals)
+                    for name, delta in deltas.items():
+                        delta_buffer.fields[name][:len(delta)] = delta
+                    remote.send((keys, rows))
+                except Exception as e:
+                    remote.send(e)
+            elif cmd == 'close':
+                remote.close()
+                break
+            else:
+                raise NotImplementedError
+    except (EOFError, BrokenPipeError):
+        # The main process has exited
+        pass
+    finally:
+        for buffer in (policy_buffer, delta_buffer):
+            if buffer is not None:
+                buffer.close()
+
+def _close_workers(remotes, ps, buffers):
+    ''' Stop the workers and destroy the shared memory blocks
+    '''
+    for remote in remotes:
+        try:
+            remote.send(('close', None))
+        except (EOFError, BrokenPipeError, OSError):
+            pass
+    for p in ps:
+        p.join(timeout=10)
+        if p.is_alive():
+            p.terminate()
+    for buffer in buffers:
+        buffer.close(unlink=True)
+    del buffers[:]
@@ -0,0 +1,171 @@
+''' Opt-in instrumentation of the hot paths of the environments
+'''
+import time
+import cProfile
+import pstats
+
+class Profiler(object):
+    ''' Profiler keeps a counter and a cumulative timer for each phase, e.g.,
+        `game_step` or `extract_state`. The phases are timed by replacing the
+        methods of an object with timed wrappers, so nothing is added to the
+        hot paths when profiling is off.
+    '''
+
+    def __init__(self, cprofile_every=None, callback=None):
+        ''' Initialize the profiler
+
+        Args:
+            cprofile_every (int): If not None, one game in every
+              `cprofile_every` games is run under cProfile. See
+              `get_cprofile_stats`
+            callback (callable): If not None, it is called with the name of
+              the phase and the elapsed seconds after each timed call, e.g.,
+              to send samples to a monitoring system
+        '''
+        if cprofile_every is not None and cprofile_every <= 0:
+            raise ValueError('cprofile_every should be positive, got {}'.format(cprofile_every))
+        self.cprofile_every = cprofile_every
+        self.callback = callback
+        self.timers = {}
+        self.game_num = 0
+        self._cprofile = cProfile.Profile() if cprofile_every is not None else None
+        self._cprofile_active = False
+        self._instrumented = []
+
+    def wrap(self, phase, func, before=None):
+        ''' Return a timed version of a function
+
+        Args:
+            phase (string): The name of the phase
+            func (callable): The function to time
+            before (callable): If not None, it is called before each call
+
+        Returns:
+            (callable): The timed function
+        '''
+        timer = self.timers.setdefault(phase, [0, 0.0])
+        callback = self.callback
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            if before is not None:
+                before()
+            tic = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - tic
+                timer[0] += 1
+                timer[1] += elapsed
+                if callback is not None:
+                    callback(phase, elapsed)
+        return timed
+
+    def instrument(self, obj, method, phase, before=None):
+        ''' Time a method of an object until `uninstrument` is called
+
+        Args:
+            obj (object): The object, e.g., a game
+            method (string): The name of the method
+            phase (string): The name of the phase
+            before (callable): See `wrap`
+        '''
+        previous = obj.__dict__.get(method)
+        setattr(obj, method, self.wrap(phase, getattr(obj, method), before))
+        self._instrumented.append((obj, method, previous))
+
+    def uninstrument(self):
+        ''' Restore all the instrumented methods and stop cProfile
+        '''
+        for obj, method, previous in reversed(self._instrumented):
+            if previous is None:
+                delattr(obj, method)
+            else:
+                setattr(obj, method, previous)
+        self._instrumented = []
+        if self._cprofile_active:
+            self._cprofile.disable()
+            self._cprofile_active = False
+
+    def wrap_agents(self, agents):
+        ''' Return timed proxies of the agents. The phase of player i is
+            `agent_i`.
+
+        Args:
+            agents (list): The agents of the players
+
+        Returns:
+            (list): The proxies, which have the `use_raw` attribute and the
+              `step`, `eval_step`, `batch_step` and `batch_eval_step`
+              methods of the agents
+        '''
+        return [_TimedAgent(self, 'agent_{}'.format(i), agent) for i, agent in enumerate(agents)]
+
+    def start_game(self):
+        ''' Count a new game, and switch cProfile on if the game is sampled
+        '''
+        if self._cprofile is not None:
+            if self._cprofile_active:
+                self._cprofile.disable()
+            self._cprofile_active = self.game_num % self.cprofile_every == 0
+            if self._cprofile_active:
+                self._cprofile.enable()
+        self.game_num += 1
+
+    def get_stats(self):
+        ''' Return the counters and the timers
+
+        Returns:
+            (dict): A dict from the name of each phase to a dict containing:
+
+                'count' (int): The number of calls
+                'time' (float): The cumulative time in seconds
+        '''
+        return {phase: {'count': count, 'time': elapsed} for phase, (count, elapsed) in self.timers.items()}
+
+    def reset_stats(self):
+        ''' Set the counters and the timers to zero
+        '''
+        for timer in self.timers.values():
+            timer[0], timer[1] = 0, 0.0
+
+    def get_cprofile_stats(self):
+        ''' Return the cProfile statistics of the sampled games
+
+        Returns:
+            (pstats.Stats): The statistics, or None if nothing is sampled
+        '''
+        if self._cprofile is None or self.game_num == 0:
+            return None
+        stats = pstats.Stats(self._cprofile)
+        # Creating the statistics switches cProfile off
+        if self._cprofile_active:
+            self._cprofile.enable()
+        return stats
+
+class _TimedAgent(object):
+    ''' A proxy of an agent whose methods are timed
+    '''
+
+    def __init__(self, profiler, phase, agent):
+        self.use_raw = agent.use_raw
+        for method in ('step', 'eval_step', 'batch_step', 'batch_eval_step'):
+            if hasattr(agent, method):
+                setattr(self, method, profiler.wrap(phase, getattr(agent, method)))
+
+def merge_stats(stats_list):
+    ''' Sum the counters and the timers of several profilers
+
+    Args:
+        stats_list (list): The results of `Profiler.get_stats`
+
+    Returns:
+        (dict): The merged stats
+    '''
+    merged = {}
+    for stats in stats_list:
+        for phase, timer in stats.items():
+            total = merged.setdefault(phase, {'count': 0, 'time': 0.0})
+            total['count'] += timer['count']
+            total['time'] += timer['time']
+    return merged
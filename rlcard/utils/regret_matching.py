@@ -0,0 +1,89 @@
+''' Whole-table updates of the regrets and the policies of the CFR agents
+
+The functions operate on the arrays of an `InfosetTable`, i.e., one row per
+information set, and process the rows in chunks so that the temporary
+arrays stay small for large tables.
+'''
+import numpy as np
+
+# The number of rows processed together
+CHUNK_SIZE = 1 << 16
+
+def regret_matching(regrets, legal=None, out=None):
+    ''' Compute the policies of regret matching: each legal action is played
+        in proportion to its positive regret, and the legal actions are
+        played uniformly if no regret is positive
+
+    Args:
+        regrets (numpy.array): The regrets, of shape (num_infosets, action_num)
+        legal (numpy.array): The boolean masks of the legal actions, of the
+          same shape. The rows without legal action, or all the rows if None,
+          are uniform over all the actions when no regret is positive
+        out (numpy.array): If not None, the policies are written to this array
+
+    Returns:
+        (numpy.array): The policies
+    '''
+    if out is None:
+        out = np.empty(regrets.shape)
+    action_num = regrets.shape[1]
+    for start in range(0, len(regrets), CHUNK_SIZE):
+        chunk = slice(start, start + CHUNK_SIZE)
+        positive = np.maximum(regrets[chunk], 0)
+        if legal is None:
+            uniform = np.full(positive.shape, 1.0 / action_num)
+        else:
+            positive *= legal[chunk]
+            legal_num = legal[chunk].sum(axis=1, keepdims=True)
+            uniform = np.where(legal_num > 0, legal[chunk] / np.maximum(legal_num, 1), 1.0 / action_num)
+        positive_sum = positive.sum(axis=1, keepdims=True)
+        out[chunk] = np.where(positive_sum > 0, positive / np.where(positive_sum > 0, positive_sum, 1), uniform)
+    return out
+
+def discount_factor(iteration, exponent):
+    ''' The discount t^exponent / (t^exponent + 1) of Discounted CFR
+
+    Args:
+        iteration (int): The iteration t, starting from 1
+        exponent (float): The exponent. Infinity keeps everything and minus
+          infinity drops everything, as in CFR+
+
+    Returns:
+        (float): The discount
+    '''
+    if exponent == np.inf:
+        return 1.0
+    if exponent == -np.inf:
+        return 0.0
+    weight = float(iteration) ** exponent
+    return weight / (weight + 1)
+
+def discount_regrets(regrets, iteration, alpha, beta):
+    ''' Discount the accumulated regrets in place at the end of an iteration:
+        the positive regrets are multiplied by `discount_factor(t, alpha)`
+        and the negative ones by `discount_factor(t, beta)`
+
+    Args:
+        regrets (numpy.array): The regrets, of shape (num_infosets, action_num)
+        iteration (int): The iteration t
+        alpha (float): The exponent of the positive regrets
+        beta (float): The exponent of the negative regrets. With minus
+          infinity, the negative regrets are set to 0 as in CFR+
+    '''
+    positive_discount = discount_factor(iteration, alpha)
+    negative_discount = discount_factor(iteration, beta)
+    for start in range(0, len(regrets), CHUNK_SIZE):
+        chunk = regrets[start:start + CHUNK_SIZE]
+        chunk *= np.where(chunk > 0, positive_discount, negative_discount)
+
+def discount_average_policy(average_policy, iteration, gamma):
+    ''' Discount the accumulated average policy in place at the end of an
+        iteration by (t / (t + 1)) ^ gamma, so that the contribution of
+        iteration t is weighted by about t ^ gamma
+
+    Args:
+        average_policy (numpy.array): The sums of the policies
+        iteration (int): The iteration t
+        gamma (float): The exponent
+    '''
+    average_policy *= (iteration / (iteration + 1)) ** gamma
@@ -37,9 +37,19 @@ def np_random(seed=None):
     seed = create_seed(seed)
 
     rng = np.random.RandomState()
-    rng.seed(_int_list_from_bigint(hash_seed(seed)))
+    reseed(rng, seed)
     return rng, seed
 
+def reseed(rng, seed):
+    """Seed an existing generator in place, in the same way as `np_random`.
+    It is much faster than creating a new generator.
+
+    Args:
+        rng (numpy.random.RandomState): The generator
+        seed (int): The seed
+    """
+    rng.seed(_int_list_from_bigint(hash_seed(seed)))
+
 def hash_seed(seed=None, max_bytes=8):
     """Any given evaluation is likely to have many PRNG's active at
     once. (Most commonly, because the environment is running in
@@ -111,3 +121,33 @@ def _int_list_from_bigint(bigint):
         bigint, mod = divmod(bigint, 2 ** 32)
         ints.append(mod)
     return ints
+
+def derive_seed(seed, *path):
+    """Derive the seed of a node of a seed tree with numpy's SeedSequence.
+    The children of a seed are independent streams, unlike seeds such as
+    `seed + i`. For example, worker i of a VecEnv seeded with `seed` gets
+    `derive_seed(seed, i)`, and game k of that worker gets
+    `derive_seed(seed, i, k)` if `seed_each_game` is set. So the seed of
+    any game can be recomputed from the root seed and its path.
+
+    Args:
+        seed (int): The root seed
+        *path (int): The indices of the children from the root
+
+    Returns:
+        (int): A 64-bit seed
+    """
+    high, low = np.random.SeedSequence(seed, spawn_key=path).generate_state(2)
+    return int(high) << 32 | int(low)
+
+def spawn_seeds(seed, num):
+    """Derive the seeds of the first `num` children of a seed
+
+    Args:
+        seed (int): The parent seed
+        num (int): The number of children
+
+    Returns:
+        (list): `derive_seed(seed, i)` for each child i
+    """
+    return [derive_seed(seed, i) for i in range(num)]
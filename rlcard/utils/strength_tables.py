@@ -0,0 +1,325 @@
+''' Precomputed strength of the starting hands of Hold'em
+
+The hole cards are grouped into classes that are equivalent up to the suits,
+e.g., 'AKs' for all the suited ace-king. There are 169 classes for the
+standard deck and 81 for the 6+ deck. For each class, the tables hold the
+average category of the hand once it is completed to 7 cards, enumerated
+exactly, and the equity against one random hand, estimated with `samples`
+deals. The tables are shipped with RLCard and rebuilt with
+
+    python -m rlcard.utils.strength_tables
+
+A preflop table is a square array indexed by the ranks of the hole cards:
+the suited classes are below the diagonal, i.e., at [high rank][low rank],
+and the offsuit classes above it.
+
+The flop tables hold the average category of the hole cards and the flop
+completed to 7 cards, for every class of 5 cards up to the suits. They are
+large, so they are not shipped and only built with `--flop`.
+'''
+import os
+import sys
+import argparse
+import itertools
+import threading
+import numpy as np
+
+from rlcard.games.limitholdem.evaluator import card_to_id, evaluate_batch, RANK_LOOKUP, CATEGORY_SHIFT
+from rlcard.utils.equity import hand_strength, equity
+
+PREFLOP_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'games/limitholdem/preflop_strength.npz')
+
+# The index of the first rank of each deck in RANK_LOOKUP
+_FIRST_RANK = {False: 0, True: RANK_LOOKUP.index('6')}
+
+_preflop_tables = None
+_lock = threading.Lock()
+
+def get_preflop_tables(short_deck=False):
+    ''' Get the preflop tables of a deck, loading them on first use
+
+    Args:
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (dict): A dict containing:
+
+            'mean_category' (numpy.array): The average category of each class
+            'equity' (numpy.array): The equity of each class against one
+              random hand
+    '''
+    global _preflop_tables
+    if _preflop_tables is None:
+        with _lock:
+            if _preflop_tables is None:
+                with np.load(PREFLOP_TABLE_PATH) as data:
+                    _preflop_tables = {deck: {name: data['{}_{}'.format(prefix, name)] for name in ('mean_category', 'equity')}
+                                       for deck, prefix in ((False, 'standard'), (True, 'short'))}
+    return _preflop_tables[short_deck]
+
+def preflop_index(hole_cards, short_deck=False):
+    ''' Get the position of the class of the hole cards in the preflop tables
+
+    Args:
+        hole_cards (list): The 2 card strings, e.g., ['SA', 'HK']
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (tuple): The row and the column
+    '''
+    if len(hole_cards) != 2:
+        raise ValueError('A player has 2 hole cards, got {}'.format(len(hole_cards)))
+    first = _FIRST_RANK[short_deck]
+    ranks = [RANK_LOOKUP.index(card[1]) - first for card in hole_cards]
+    if min(ranks) < 0:
+        raise ValueError('The 6+ deck has no card below 6, got {}'.format(hole_cards))
+    high, low = max(ranks), min(ranks)
+    if hole_cards[0][0] == hole_cards[1][0]:
+        return high, low
+    return low, high
+
+def preflop_class(hole_cards, short_deck=False):
+    ''' Get the name of the class of the hole cards
+
+    Args:
+        hole_cards (list): The 2 card strings, e.g., ['SA', 'HK']
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (string): The name, e.g., 'AKo', 'AKs' or 'AA'
+    '''
+    row, column = preflop_index(hole_cards, short_deck)
+    return _class_name(row, column, short_deck)
+
+def preflop_strength(hole_cards, short_deck=False):
+    ''' Look up the strength of the hole cards
+
+    Args:
+        hole_cards (list): The 2 card strings, e.g., ['SA', 'HK']
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (dict): The 'mean_category' and the 'equity' of the class. See
+          `get_preflop_tables`
+    '''
+    index = preflop_index(hole_cards, short_deck)
+    tables = get_preflop_tables(short_deck)
+    return {name: float(table[index]) for name, table in tables.items()}
+
+def preflop_weights(short_deck=False):
+    ''' The number of combinations of hole cards in each class
+
+    Args:
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (numpy.array): 6 for the pairs, 4 for the suited classes and 12 for
+          the offsuit classes
+    '''
+    size = len(RANK_LOOKUP) - _FIRST_RANK[short_deck]
+    weights = np.full((size, size), 12)
+    weights[np.tril_indices(size, -1)] = 4
+    weights[np.diag_indices(size)] = 6
+    return weights
+
+def preflop_average(name, short_deck=False):
+    ''' The average of a table over all the hole cards, e.g., the average
+        category of all the hands of 7 cards
+
+    Args:
+        name (string): 'mean_category' or 'equity'
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (float): The average weighted by `preflop_weights`
+    '''
+    weights = preflop_weights(short_deck)
+    return float((get_preflop_tables(short_deck)[name] * weights).sum() / weights.sum())
+
+def preflop_percentile(name, value, short_deck=False):
+    ''' The share of the hole cards whose strength is below a value, e.g., to
+        play the best 20% of the hands
+
+    Args:
+        name (string): 'mean_category' or 'equity'
+        value (float): The strength
+        short_deck (boolean): True for the 6+ deck
+
+    Returns:
+        (float): The share in [0, 1]
+    '''
+    weights = preflop_weights(short_deck)
+    return float(weights[get_preflop_tables(short_deck)[name] < value].sum() / weights.sum())
+
+def build_preflop_tables(short_deck=False, samples=10**6, seed=0, workers=1):
+    ''' Compute the preflop tables of a deck
+
+    Args:
+        short_deck (boolean): True for the 6+ deck
+        samples (int): The number of deals of the equity of each class. The
+          equity is enumerated exactly if None, which is very slow
+        seed (int): The seed of the deals
+        workers (int): The number of processes. See `rlcard.utils.equity`
+
+    Returns:
+        (dict): The tables. See `get_preflop_tables`
+    '''
+    size = len(RANK_LOOKUP) - _FIRST_RANK[short_deck]
+    tables = {'mean_category': np.zeros((size, size), dtype=np.float32),
+              'equity': np.zeros((size, size), dtype=np.float32)}
+    for row, column in itertools.product(range(size), range(size)):
+        hole_cards = _class_cards(row, column, short_deck)
+        tables['mean_category'][row, column] = hand_strength(hole_cards, short_deck, workers=workers)['mean_category']
+        tables['equity'][row, column] = equity(hole_cards, short_deck=short_deck, samples=samples,
+                                               seed=seed, workers=workers)['equity']
+    return tables
+
+def flop_key(hole_cards, flop_cards):
+    ''' Get the key of the class of the hole cards and the flop, which is the
+        smallest encoding of the cards over the permutations of the suits
+
+    Args:
+        hole_cards (list): The 2 card strings
+        flop_cards (list): The 3 card strings of the flop
+
+    Returns:
+        (int): The key
+    '''
+    holes = np.array([[card_to_id(card) for card in hole_cards]])
+    flops = np.array([[card_to_id(card) for card in flop_cards]])
+    return int(_canonical_keys(holes, flops)[0])
+
+def flop_strength(hole_cards, flop_cards, table):
+    ''' Look up the average category of the hole cards and the flop
+
+    Args:
+        hole_cards (list): The 2 card strings
+        flop_cards (list): The 3 card strings of the flop
+        table (dict): The result of `build_flop_table` or `load_flop_table`
+
+    Returns:
+        (float): The average category once the cards are completed to 7
+    '''
+    key = flop_key(hole_cards, flop_cards)
+    index = np.searchsorted(table['keys'], key)
+    if index == len(table['keys']) or table['keys'][index] != key:
+        raise ValueError('The cards are not in the table: {} {}'.format(hole_cards, flop_cards))
+    return float(table['mean_category'][index])
+
+def load_flop_table(path):
+    ''' Load a flop table saved by the generator
+
+    Args:
+        path (string): The path of the .npz file
+
+    Returns:
+        (dict): The sorted 'keys' of the classes and their 'mean_category'
+    '''
+    with np.load(path) as data:
+        return {'keys': data['keys'], 'mean_category': data['mean_category']}
+
+def build_flop_table(short_deck=False, chunk_size=512):
+    ''' Compute the average category of every class of hole cards and flop
+
+    Args:
+        short_deck (boolean): True for the 6+ deck
+        chunk_size (int): The number of classes evaluated together
+
+    Returns:
+        (dict): See `load_flop_table`
+    '''
+    deck = np.arange(4 * _FIRST_RANK[short_deck], 52)
+    holes = np.array(list(itertools.combinations(deck, 2)))
+    flops = np.array(list(itertools.combinations(deck, 3)))
+
+    # Keep one representative of each class: the cards whose own encoding
+    # is the smallest of the class
+    keys, representatives = [], []
+    for hole in holes:
+        hole_flops = flops[~np.isin(flops, hole).any(axis=1)]
+        hole_rows = np.tile(hole, (len(hole_flops), 1))
+        canonical = _canonical_keys(hole_rows, hole_flops)
+        own = canonical == _encode(hole_rows, hole_flops)
+        keys.append(canonical[own])
+        representatives.append(np.hstack([hole_rows[own], hole_flops[own]]))
+    keys = np.concatenate(keys)
+    representatives = np.concatenate(representatives)
+    order = np.argsort(keys)
+    keys, representatives = keys[order], representatives[order]
+
+    # Complete every class with the pairs of the deck that share no card
+    # with it. Every class has the same number of them
+    pairs = np.array(list(itertools.combinations(deck, 2)), dtype=np.uint8)
+    mean_category = np.zeros(len(keys), dtype=np.float32)
+    for start in range(0, len(keys), chunk_size):
+        known = representatives[start:start + chunk_size].astype(np.uint8)
+        valid = ~(pairs[None, :, :, None] == known[:, None, None, :]).any(axis=(2, 3))
+        completions = np.broadcast_to(pairs, (len(known),) + pairs.shape)[valid].reshape(len(known), -1, 2)
+        hands = np.concatenate([np.broadcast_to(known[:, None, :], (len(known), completions.shape[1], 5)), completions], axis=2)
+        mean_category[start:start + chunk_size] = (evaluate_batch(hands, short_deck) >> CATEGORY_SHIFT).mean(axis=1)
+    return {'keys': keys, 'mean_category': mean_category}
+
+_SUIT_PERMUTATIONS = np.array(list(itertools.permutations(range(4))))
+
+def _encode(holes, flops):
+    ''' Encode sorted hole cards and flops as integers in base 52
+    '''
+    holes, flops = np.sort(holes, axis=1).astype(np.int64), np.sort(flops, axis=1).astype(np.int64)
+    return (((holes[:, 0] * 52 + holes[:, 1]) * 52 + flops[:, 0]) * 52 + flops[:, 1]) * 52 + flops[:, 2]
+
+def _canonical_keys(holes, flops):
+    ''' The smallest encoding of each row over the permutations of the suits
+    '''
+    keys = None
+    for permutation in _SUIT_PERMUTATIONS:
+        permuted = _encode(holes - holes % 4 + permutation[holes % 4], flops - flops % 4 + permutation[flops % 4])
+        keys = permuted if keys is None else np.minimum(keys, permuted)
+    return keys
+
+def _class_name(row, column, short_deck):
+    ''' The name of a class of the preflop tables, e.g., 'AKs'
+    '''
+    first = _FIRST_RANK[short_deck]
+    high, low = RANK_LOOKUP[first + max(row, column)], RANK_LOOKUP[first + min(row, column)]
+    if row == column:
+        return high + low
+    return high + low + ('s' if row > column else 'o')
+
+def _class_cards(row, column, short_deck):
+    ''' Hole cards of a class of the preflop tables
+    '''
+    first = _FIRST_RANK[short_deck]
+    high, low = RANK_LOOKUP[first + max(row, column)], RANK_LOOKUP[first + min(row, column)]
+    return ['S' + high, 'S' + low] if row > column else ['S' + high, 'H' + low]
+
+def main(argv=None):
+    ''' Build the tables and save them
+    '''
+    parser = argparse.ArgumentParser('Precompute the strength of the starting hands of Hold\'em')
+    parser.add_argument('--output', default=PREFLOP_TABLE_PATH,
+                        help='The .npz file of the preflop tables')
+    parser.add_argument('--samples', type=int, default=10**6,
+                        help='The number of deals of the equity of each class')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--flop', default=None,
+                        help='If set, also build the flop tables of both decks in this directory')
+    args = parser.parse_args(argv)
+
+    tables = {}
+    for short_deck, prefix in ((False, 'standard'), (True, 'short')):
+        print('Building the preflop tables of the {} deck'.format(prefix))
+        for name, table in build_preflop_tables(short_deck, args.samples, args.seed, args.workers).items():
+            tables['{}_{}'.format(prefix, name)] = table
+    np.savez_compressed(args.output, samples=args.samples, seed=args.seed, **tables)
+
+    if args.flop is not None:
+        for short_deck, prefix in ((True, 'short'), (False, 'standard')):
+            print('Building the flop table of the {} deck'.format(prefix))
+            np.savez_compressed(os.path.join(args.flop, 'flop_strength_{}.npz'.format(prefix)),
+                                **build_flop_table(short_deck))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import itertools
 import numpy as np
 
 from rlcard.core import Card, Player
@@ -322,8 +323,62 @@ def reorganize(trajectories, payoffs):
             new_trajectories[player].append(transition)
     return new_trajectories
 
+def reorganize_columns(trajectories, payoffs, action_num):
+    ''' Reorganize the trajectory into columns of NumPy arrays. The transitions
+        are the same as in `reorganize`, but each player gets a dict of arrays
+        instead of a list of transitions, so that they can be fed in bulk.
+
+    Args:
+        trajectory (list): A list of trajectories
+        payoffs (list): A list of payoffs for the players. Each entry corresponds to one player
+        action_num (int): The number of actions, i.e., the length of the legal masks
+
+    Returns:
+        (list): One dict for each player with the keys 'obs', 'action', 'reward',
+          'next_obs', 'done', 'legal_mask' and 'next_legal_mask'. The i-th row
+          of every array belongs to the i-th transition of the player.
+
+    Note: The actions must be action IDs rather than raw actions.
+    '''
+    new_trajectories = []
+    for player, trajectory in enumerate(trajectories):
+        states = trajectory[0::2]
+        transition_num = len(states) - 1
+
+        obs = np.stack([state['obs'] for state in states])
+        legal_masks = np.zeros((len(states), action_num), dtype=bool)
+        for i, state in enumerate(states):
+            legal_masks[i, list(state['legal_actions'])] = True
+        reward = np.zeros(transition_num)
+        done = np.zeros(transition_num, dtype=bool)
+        if transition_num > 0:
+            reward[-1] = payoffs[player]
+            done[-1] = True
+
+        new_trajectories.append({'obs': obs[:-1],
+                                 'action': np.array(trajectory[1::2], dtype=int).reshape(transition_num),
+                                 'reward': reward,
+                                 'next_obs': obs[1:],
+                                 'done': done,
+                                 'legal_mask': legal_masks[:-1],
+                                 'next_legal_mask': legal_masks[1:]})
+    return new_trajectories
+
+def concatenate_columns(columns_list):
+    ''' Concatenate the columns of several games of one player
+
+    Args:
+        columns_list (list): A list of dicts returned by `reorganize_columns`
+
+    Returns:
+        (dict): The columns of all the transitions in order
+    '''
+    return {key: np.concatenate([columns[key] for columns in columns_list]) for key in columns_list[0]}
+
 def set_global_seed(seed):
-    ''' Set the global see for reproducing results
+    ''' Set the global see for reproducing results. TensorFlow and PyTorch
+        are seeded if they are already imported, so call it after importing
+        them.
 
     Args:
         seed (int): The seed
@@ -331,19 +386,14 @@ def set_global_seed(seed):
     Note: If using other modules with randomness, they also need to be seeded
     '''
     if seed is not None:
-        import subprocess
         import sys
+        import random
 
-        reqs = subprocess.check_output([sys.executable, '-m', 'pip', 'freeze'])
-        installed_packages = [r.decode().split('==')[0] for r in reqs.split()]
-        if 'tensorflow' in installed_packages:
-            import tensorflow as tf
-            tf.set_random_seed(seed)
-        if 'torch' in installed_packages:
-            import torch
-            torch.manual_seed(seed)
+        if 'tensorflow' in sys.modules:
+            sys.modules['tensorflow'].set_random_seed(seed)
+        if 'torch' in sys.modules:
+            sys.modules['torch'].manual_seed(seed)
         np.random.seed(seed)
-        import random
         random.seed(seed)
 
 def remove_illegal(action_probs, legal_actions):
@@ -380,16 +430,32 @@ def assign_task(task_num, process_num):
     per_tasks[0] += (task_num % process_num)
     return per_tasks
 
-def tournament(env, num):
+def tournament(env, num, duplicate=False):
     ''' Evaluate he performance of the agents in the environment
 
     Args:
         env (Env class): The environment to be evaluated.
-        num (int): The number of games to play.
+        num (int): The number of games to play. In the duplicate format, it
+          is the number of deals
+        duplicate (boolean): True if each deal should be replayed with every
+          permutation of the seats. The luck of the cards then cancels out,
+          so much fewer games are needed to compare the agents
 
     Returns:
-        A list of avrage payoffs for each player
+        A list of avrage payoffs for each player. In the duplicate format, the
+        entries are for the agents in the order of `env.agents` rather than
+        for the seats
     '''
+    if duplicate:
+        if not hasattr(env, 'game'):
+            raise ValueError('The duplicate format is only supported in a single environment')
+        # The deals are drawn from the generator of the environment, which
+        # `run_duplicate_deal` gives back to the environment after each deal
+        payoffs = np.zeros(env.player_num)
+        for _ in range(num):
+            payoffs += run_duplicate_deal(env, int(env.np_random.randint(0, 2**31)))
+        return (payoffs / num).tolist()
+
     payoffs = [0 for _ in range(env.player_num)]
     counter = 0
     while counter < num:
@@ -405,4 +471,34 @@ def tournament(env, num):
             counter += 1
     for i, _ in enumerate(payoffs):
         payoffs[i] /= counter
-    return payoffs
\ No newline at end of file
+    return payoffs
+
+def run_duplicate_deal(env, deal_seed):
+    ''' Play the same deal from every permutation of the seats. The game is
+        seeded with `deal_seed` before each game, so the dealer shuffles the
+        same deck every time. The generator and the seeds of the environment,
+        e.g., the root seed of `seed_each_game`, are restored in the end.
+
+    Args:
+        env (Env class): The environment with the agents set
+        deal_seed (int): The seed of the deal
+
+    Returns:
+        (numpy.array): The payoff of each agent averaged over the permutations
+    '''
+    agents = env.agents
+    np_random, seed, game_index, game_seed = env.np_random, env.seed, env.game_index, env.game_seed
+    payoffs = np.zeros(len(agents))
+    permutations = list(itertools.permutations(range(len(agents))))
+    try:
+        for permutation in permutations:
+            env.set_agents([agents[i] for i in permutation])
+            env._seed(deal_seed)
+            _, seat_payoffs = env.run(is_training=False)
+            for seat, agent_id in enumerate(permutation):
+                payoffs[agent_id] += seat_payoffs[seat]
+    finally:
+        env.set_agents(agents)
+        env.np_random = env.game.np_random = np_random
+        env.seed, env.game_index, env.game_seed = seed, game_index, game_seed
+    return payoffs / len(permutations)
@@ -36,6 +36,7 @@ setuptools.setup(
                    'models/pretrained/leduc_holdem_nfsp_pytorch/*',
                    'games/uno/jsondata/action_space.json',
                    'games/limitholdem/card2index.json',
+                   'games/limitholdem/preflop_strength.npz',
                    'games/leducholdem/card2index.json',
                    'games/doudizhu/jsondata/*',
                    'games/uno/jsondata/*',
@@ -45,7 +46,7 @@ setuptools.setup(
                    'agents/gin_rummy_human_agent/gui_gin_rummy/*'
                    ]},
     install_requires=[
-        'numpy>=1.16.3',
+        'numpy>=1.17',
         'matplotlib>=3.0',
         'pillow>=5.2.0',
         'termcolor',
@@ -1,11 +1,21 @@
 import unittest
+import os
+import shutil
+import tempfile
 import numpy as np
 
 import rlcard
 from rlcard.agents.cfr_agent import CFRAgent
+from rlcard.agents.cfrplus_agent import CFRPlusAgent
 
 class TestNFSP(unittest.TestCase):
 
+    def setUp(self):
+        self.model_path = os.path.join(tempfile.mkdtemp(), 'cfr_model')
+
+    def tearDown(self):
+        shutil.rmtree(os.path.dirname(self.model_path))
+
     def test_train(self):
 
         env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
@@ -19,19 +29,74 @@ class TestNFSP(unittest.TestCase):
 
         self.assertIn(action, [0, 2])
 
-    def test_save_and_load(self):
+    def test_update_policy(self):
         env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
         agent = CFRAgent(env)
+        for _ in range(10):
+            agent.train()
+
+        # The policy of every visited state is the regret matching of its
+        # regrets over its legal actions
+        for obs in agent.regrets:
+            legal = agent.table.arrays['legal'][agent.table.find(obs)]
+            if legal.any():
+                policy = agent.regret_matching(obs) * legal
+                self.assertTrue(np.allclose(agent.policy[obs], policy / policy.sum()))
+
+    def test_cfrplus(self):
+        env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+        for kwargs in ({}, {'alpha': np.inf, 'beta': -np.inf, 'gamma': 2}):
+            agent = CFRPlusAgent(env, **kwargs)
+            for _ in range(20):
+                agent.train()
+            legal = agent.table.array('legal')
+            visited = legal.any(axis=1)
+            self.assertTrue(np.allclose(agent.table.array('policy')[visited].sum(axis=1), 1))
+            self.assertEqual(agent.table.array('policy')[visited][~legal[visited]].sum(), 0)
+        # CFR+ keeps no negative regret
+        self.assertGreaterEqual(agent.table.array('regrets').min(), 0)
+
+    def test_save_and_load(self):
+        env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+        agent = CFRAgent(env, model_path=self.model_path)
 
         for _ in range(100):
             agent.train()
 
         agent.save()
 
-        new_agent = CFRAgent(env)
+        new_agent = CFRAgent(env, model_path=self.model_path)
         new_agent.load()
         self.assertEqual(len(agent.policy), len(new_agent.policy))
         self.assertEqual(len(agent.average_policy), len(new_agent.average_policy))
         self.assertEqual(len(agent.regrets), len(new_agent.regrets))
         self.assertEqual(agent.iteration, new_agent.iteration)
+        # The values are stored as float32
+        for obs in agent.average_policy:
+            self.assertTrue(np.array_equal(agent.average_policy[obs].astype(np.float32), new_agent.average_policy[obs]))
+
+        # The table can be memory-mapped for the evaluation
+        mmap_agent = CFRAgent(env, model_path=self.model_path)
+        mmap_agent.load(mmap_mode='r')
+        self.assertTrue(np.array_equal(agent.table.array('regrets').astype(np.float32), mmap_agent.table.array('regrets')))
+        state = {'obs': np.array([1., 1., 0., 0., 0., 0.]), 'legal_actions': [0,2]}
+        action, _ = mmap_agent.eval_step(state)
+        self.assertIn(action, [0, 2])
+        self.assertEqual(len(mmap_agent.table), len(agent.table))
+
+    def test_incremental_save(self):
+        env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+        agent = CFRPlusAgent(env, model_path=self.model_path)
+        agent.train()
+        agent.save(incremental=True)
+        for _ in range(5):
+            agent.train()
+            agent.save(incremental=True)
+
+        new_agent = CFRPlusAgent(env, model_path=self.model_path)
+        new_agent.load()
+        self.assertEqual(new_agent.iteration, 6)
+        self.assertEqual(new_agent.table.keys, agent.table.keys)
+        self.assertTrue(np.array_equal(new_agent.table.array('regrets'),
+                                       agent.table.array('regrets').astype(np.float32)))
 
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.agents.mccfr_agent import MCCFRAgent
+
+class TestMCCFR(unittest.TestCase):
+
+    def test_train(self):
+        for sampling in MCCFRAgent.SAMPLINGS:
+            env = rlcard.make('leduc-holdem', config={'allow_step_back':True, 'seed':0})
+            agent = MCCFRAgent(env, sampling=sampling, samples=2, seed=0)
+            for _ in range(50):
+                agent.train()
+            self.assertEqual(agent.iteration, 50)
+            legal = agent.table.array('legal')
+            visited = legal.any(axis=1)
+            self.assertGreater(visited.sum(), 0)
+            self.assertTrue(np.allclose(agent.table.array('policy')[visited].sum(axis=1), 1))
+            self.assertEqual(agent.table.array('average_policy')[~legal].sum(), 0)
+
+            state = {'obs': np.array([1., 1., 0., 0., 0., 0.]), 'legal_actions': [0,2]}
+            action, _ = agent.eval_step(state)
+            self.assertIn(action, [0, 2])
+
+    def test_deterministic(self):
+        tables = []
+        for _ in range(2):
+            env = rlcard.make('leduc-holdem', config={'allow_step_back':True, 'seed':0})
+            agent = MCCFRAgent(env, sampling='outcome', seed=1)
+            for _ in range(100):
+                agent.train()
+            tables.append(agent.table)
+        self.assertEqual(tables[0].keys, tables[1].keys)
+        self.assertTrue(np.array_equal(tables[0].array('regrets'), tables[1].array('regrets')))
+
+    def test_outcome_without_step_back(self):
+        env = rlcard.make('limit-holdem', config={'seed':0})
+        agent = MCCFRAgent(env, sampling='outcome', seed=0)
+        for _ in range(10):
+            agent.train()
+        self.assertGreater(len(agent.table), 0)
+
+    def test_errors(self):
+        env = rlcard.make('leduc-holdem', config={'allow_step_back':True})
+        with self.assertRaises(ValueError):
+            MCCFRAgent(env, sampling='full')
+        with self.assertRaises(ValueError):
+            MCCFRAgent(env, samples=0)
+        with self.assertRaises(ValueError):
+            MCCFRAgent(env, sampling='outcome', epsilon=0)
+
+if __name__ == '__main__':
+    unittest.main()
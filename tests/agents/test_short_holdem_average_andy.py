@@ -3,6 +3,7 @@ import rlcard
 from rlcard.agents import RandomAgent
 from rlcard.agents.short_limit_holdem_average_andy import ShortLimitholdemAverageAndy
 from rlcard.utils import set_global_seed, tournament
+from rlcard.utils.strength_tables import preflop_average
 
 class TestAverageAndyShortHoldem(unittest.TestCase):
 
@@ -11,7 +12,20 @@ class TestAverageAndyShortHoldem(unittest.TestCase):
         worseCards = ["H7", "CK"]  # Off-suit lower cards
         self.assertTrue(ShortLimitholdemAverageAndy.handUtility(betterCards) > ShortLimitholdemAverageAndy.handUtility(worseCards))
 
+    def test_preflop_threshold(self):
+        state = {'raw_legal_actions': ['raise', 'call', 'check', 'fold'],
+                 'raw_obs': {'hand': ['S9', 'H6'], 'public_cards': []}}
+        # The utility of 96o is between the old threshold and the average
+        # of the preflop tables
+        agentAndy = ShortLimitholdemAverageAndy()
+        self.assertAlmostEqual(agentAndy.preflop_threshold, preflop_average('mean_category', short_deck=True))
+        self.assertEqual(agentAndy.step(state), 'check')
+        self.assertEqual(ShortLimitholdemAverageAndy(preflop_threshold=3.33).step(state), 'raise')
+
     def test_save_and_load(self):
+        # The random agent samples from numpy, so it is seeded to keep the
+        # result of the game stable
+        set_global_seed(0)
         env = rlcard.make('short-limit-holdem', config={'seed': 0})
         agentRando = RandomAgent(action_num=env.action_num)
         agentAndy = ShortLimitholdemAverageAndy()
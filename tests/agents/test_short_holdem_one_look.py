@@ -8,12 +8,22 @@ class TestOneLookShortHoldem(unittest.TestCase):
 
     def test_policy(self):
         actions = list(MODES[0].keys())
-        weights = OneLookAgent.getPolicy(actions, ["DA", "HA"])
+        weights = OneLookAgent().getPolicy(actions, ["DA", "HA"])
         self.assertTrue(weights == MODES[2])
-        weights = OneLookAgent.getPolicy(actions, ["D8", "H7"])
+        weights = OneLookAgent().getPolicy(actions, ["D8", "H7"])
         self.assertTrue(weights == MODES[1])
-        weights = OneLookAgent.getPolicy(actions, ["D6", "H6"])
+        weights = OneLookAgent().getPolicy(actions, ["D6", "H6"])
         self.assertTrue(weights == MODES[1])
+        # The agent of the standard deck uses its table, also for the hands
+        # without a card below 6
+        weights = OneLookAgent(short_deck=False).getPolicy(actions, ["SK", "H6"])
+        self.assertTrue(weights == MODES[2])
+        weights = OneLookAgent().getPolicy(actions, ["SK", "H6"])
+        self.assertTrue(weights == MODES[1])
+        weights = OneLookAgent(short_deck=False).getPolicy(actions, ["S2", "H3"])
+        self.assertTrue(weights == MODES[0])
+        weights = OneLookAgent(short_deck=False).getPolicy(actions, ["SA", "H5"])
+        self.assertTrue(weights == MODES[2])
 
     def test_save_and_load(self):
         env = rlcard.make('short-limit-holdem', config={'seed': 0})
@@ -0,0 +1,50 @@
+import os
+import json
+import unittest
+import tempfile
+
+from rlcard.benchmarks import benchmark_env, benchmark_vec_env, benchmark_utilities, run_benchmarks, compare_results
+from rlcard.benchmarks.__main__ import main
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_benchmark_env(self):
+        result = benchmark_env('leduc-holdem', min_time=0.01)
+        self.assertGreater(result['steps_per_sec'], 0)
+        self.assertGreater(result['reset_us'], 0)
+        self.assertGreater(result['extract_state_us'], 0)
+        self.assertGreater(result['step_back_us'], 0)
+
+        result = benchmark_env('gin-rummy', min_time=0.01)
+        self.assertIsNone(result['step_back_us'])
+
+    def test_benchmark_vec_env(self):
+        result = benchmark_vec_env('leduc-holdem', workers=[1], min_time=0.01)
+        self.assertGreater(result['1'], 0)
+
+    def test_benchmark_utilities(self):
+        result = benchmark_utilities(min_time=0.01)
+        self.assertEqual(set(result), {'hand_evaluation_us', 'doudizhu_playable_cards_us', 'gin_rummy_meld_clusters_us'})
+
+    def test_compare_results(self):
+        baseline = run_benchmarks(['leduc-holdem'], workers=[], min_time=0.01, utilities=False)
+        current = json.loads(json.dumps(baseline))
+        current['envs']['leduc-holdem']['steps_per_sec'] /= 2
+        current['envs']['leduc-holdem']['reset_us'] /= 2
+        comparison = {name: (speedup, is_regression) for name, _, _, speedup, is_regression in compare_results(baseline, current)}
+        self.assertAlmostEqual(comparison['envs/leduc-holdem/steps_per_sec'][0], 0.5)
+        self.assertTrue(comparison['envs/leduc-holdem/steps_per_sec'][1])
+        self.assertAlmostEqual(comparison['envs/leduc-holdem/reset_us'][0], 2)
+        self.assertFalse(comparison['envs/leduc-holdem/reset_us'][1])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            args = ['--envs', 'leduc-holdem', '--workers', '--min-time', '0.01', '--no-utilities', '--output', output]
+            self.assertEqual(main(args), 0)
+            with open(output) as f:
+                self.assertIn('leduc-holdem', json.load(f)['envs'])
+            self.assertEqual(main(args + ['--baseline', output, '--threshold', '0.99']), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+import rlcard
+from rlcard.envs import BatchedEnv
+
+class TestBatchedEnv(unittest.TestCase):
+
+    def test_make(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 4, 'batched': True})
+        self.assertIsInstance(env, BatchedEnv)
+        self.assertEqual(env.num, 4)
+
+    def test_reset_and_step(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 4, 'batched': True, 'seed': 0})
+        obs, legal_masks, player_ids = env.reset()
+        self.assertEqual(obs.shape, (4, 36))
+        self.assertEqual(legal_masks.shape, (4, env.action_num))
+        self.assertEqual(legal_masks.dtype, bool)
+        self.assertEqual(player_ids.shape, (4,))
+
+        finished = 0
+        for _ in range(100):
+            actions = [np.random.choice(np.flatnonzero(mask)) for mask in legal_masks]
+            obs, legal_masks, player_ids, payoffs, dones = env.step(actions)
+            self.assertEqual(obs.shape, (4, 36))
+            self.assertTrue(np.all(legal_masks.any(axis=1)))
+            for i in np.flatnonzero(dones):
+                self.assertEqual(np.sum(payoffs[i]), 0)
+            finished += np.sum(dones)
+        self.assertGreater(finished, 0)
+        self.assertEqual(env.timestep, 400)
+        self.assertTrue(np.array_equal(player_ids, env.get_player_ids()))
+
+    def test_wrong_action_num(self):
+        env = rlcard.make('blackjack', config={'env_num': 2, 'batched': True})
+        env.reset()
+        with self.assertRaises(ValueError):
+            env.step([0])
+
+    def test_seed(self):
+        env1 = rlcard.make('leduc-holdem', config={'env_num': 2, 'batched': True, 'seed': 1})
+        env2 = rlcard.make('leduc-holdem', config={'env_num': 2, 'batched': True, 'seed': 1})
+        obs1, _, _ = env1.reset()
+        obs2, _, _ = env2.reset()
+        self.assertTrue(np.array_equal(obs1, obs2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,6 +63,35 @@ class TestLeducholdemEnv(unittest.TestCase):
             total += payoff
         self.assertEqual(total, 0)
 
+    def test_run_columnar(self):
+        env = rlcard.make('leduc-holdem')
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        trajectories, payoffs = env.run(is_training=True, columnar=True)
+        for player_id, columns in enumerate(trajectories):
+            transition_num = len(columns['action'])
+            self.assertEqual(columns['obs'].shape, (transition_num, 36))
+            self.assertEqual(columns['legal_mask'].shape, (transition_num, env.action_num))
+            self.assertTrue(np.all(columns['legal_mask'][np.arange(transition_num), columns['action']]))
+            if transition_num > 0:
+                self.assertEqual(columns['reward'][-1], payoffs[player_id])
+
+    def test_seed_each_game(self):
+        def play(env):
+            state, _ = env.reset()
+            hands = [env.game.players[i].hand.get_index() for i in range(env.player_num)]
+            while not env.is_over():
+                state, _ = env.step(state['legal_actions'][0])
+            return hands, env.game.public_card.get_index()
+
+        env = rlcard.make('leduc-holdem', config={'seed': 3, 'seed_each_game': True})
+        games = [play(env) for _ in range(5)]
+        game_seed = env.game_seed
+        self.assertEqual(env.game_index, 5)
+
+        replay_env = rlcard.make('leduc-holdem')
+        replay_env._seed(game_seed)
+        self.assertEqual(play(replay_env), games[-1])
+
     def test_single_agent_mode(self):
         env = rlcard.make('leduc-holdem', config={'single_agent_mode':True})
         with self.assertRaises(ValueError):
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 import numpy as np
 
 import rlcard
@@ -60,6 +61,36 @@ class TestLimitholdemEnv(unittest.TestCase):
         with self.assertRaises(Exception):
             env.step_back()
 
+    def test_step_without_observation(self):
+        env = rlcard.make('limit-holdem', config={'allow_step_back':True})
+        state, player_id = env.reset()
+        next_state, next_player_id = env.step(1, observe=False)
+        self.assertIsNone(next_state)
+        # The state is encoded once, and each call gets its own copy
+        with mock.patch.object(env, '_extract_state', wraps=env._extract_state) as extract_state:
+            first_state = env.get_state(next_player_id)
+            first_state['obs'][:] = -1
+            first_state['legal_actions'].clear()
+            second_state = env.get_state(next_player_id)
+        self.assertEqual(extract_state.call_count, 1)
+        self.assertGreaterEqual(second_state['obs'].min(), 0)
+        self.assertTrue(second_state['legal_actions'])
+        back_state, back_player_id = env.step_back(observe=False)
+        self.assertIsNone(back_state)
+        self.assertEqual(back_player_id, player_id)
+        self.assertTrue(np.array_equal(env.get_state(player_id)['obs'], state['obs']))
+
+    def test_snapshot_restore(self):
+        env = rlcard.make('limit-holdem', config={'record_action':True})
+        state, player_id = env.reset()
+        snapshot = env.snapshot()
+        env.step(1)
+        env.step(0)
+        env.restore(snapshot)
+        self.assertEqual(env.get_player_id(), player_id)
+        self.assertTrue(np.array_equal(env.get_state(player_id)['obs'], state['obs']))
+        self.assertEqual(len(env.action_recorder), 0)
+
     def test_run(self):
         env = rlcard.make('limit-holdem')
         agents = [RandomAgent(env.action_num) for _ in range(env.player_num)]
@@ -1,4 +1,6 @@
+import sys
 import unittest
+import subprocess
 
 import rlcard
 from rlcard.envs.registration import register, make
@@ -20,6 +22,17 @@ class TestRegistration(unittest.TestCase):
         with self.assertRaises(ValueError):
             make('test_random_make')
 
+    def test_lazy_entry_point(self):
+        # Importing rlcard does not import the games
+        code = 'import sys, rlcard; print(any(m.startswith("rlcard.games") for m in sys.modules))'
+        self.assertEqual(subprocess.check_output([sys.executable, '-c', code]).decode().strip(), 'False')
+
+        register(env_id='test_lazy', entry_point='rlcard.envs.not_a_module:NotAnEnv')
+        with self.assertRaises(ImportError):
+            make('test_lazy')
+        with self.assertRaises(ValueError):
+            register(env_id='test_bad_entry_point', entry_point='rlcard.envs.blackjack.BlackjackEnv')
+
     def test_make_modes(self):
         register(env_id='test_env', entry_point='rlcard.envs.blackjack:BlackjackEnv')
         with self.assertRaises(ValueError):
@@ -3,8 +3,27 @@ import numpy as np
 
 import rlcard
 from rlcard.agents import RandomAgent
+from rlcard.envs import EnvPool
+from rlcard.envs.registration import DEFAULT_CONFIG
+from rlcard.envs.vec_env import batch_agents_step
 from .determism_util import is_deterministic
 
+class BatchRandomAgent(RandomAgent):
+    ''' A random agent that counts the batched calls
+    '''
+
+    def __init__(self, action_num):
+        super().__init__(action_num)
+        self.batch_sizes = []
+
+    def batch_step(self, states):
+        self.batch_sizes.append(len(states))
+        return [self.step(state) for state in states]
+
+    def batch_eval_step(self, states):
+        self.batch_sizes.append(len(states))
+        return [self.step(state) for state in states], [None for _ in states]
+
 class TestVecEnv(unittest.TestCase):
 
     def test_vec_env(self):
@@ -14,5 +33,100 @@ class TestVecEnv(unittest.TestCase):
         self.assertEqual(len(payoffs), 4)
         trajectories, payoffs = env.run(is_training=True)
 
+    def test_vec_env_columnar(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 2})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        trajectories, payoffs = env.run(is_training=True, columnar=True)
+        self.assertEqual(len(trajectories), env.player_num)
+        for columns in trajectories:
+            self.assertLessEqual(columns['done'].sum(), 2)
+            self.assertEqual(len(columns['next_obs']), len(columns['action']))
+            self.assertFalse(np.any(columns['reward'][~columns['done']]))
+        env.close()
+
+    def test_vec_env_shared_memory(self):
+        env = rlcard.make('doudizhu', config={'env_num': 2, 'shared_memory': True, 'seed': 0})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        trajectories, payoffs = env.run(is_training=False)
+        self.assertEqual(len(payoffs), 2)
+        for ts in trajectories[0]:
+            self.assertEqual(list(ts[0]['obs'].shape), env.state_shape)
+            self.assertIn(ts[1], ts[0]['legal_actions'])
+
+    def test_batch_agents_step(self):
+        agents = [BatchRandomAgent(4), RandomAgent(4)]
+        states = [{'obs': None, 'legal_actions': [i % 4]} for i in range(5)]
+        player_ids = [0, 1, 0, 1, 0]
+        for is_training in [True, False]:
+            actions = batch_agents_step(agents, states, player_ids, is_training)
+            self.assertEqual(actions, [0, 1, 2, 3, 0])
+        self.assertEqual(agents[0].batch_sizes, [3, 3])
+
+    def test_vec_env_batch_agents(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 3})
+        agents = [BatchRandomAgent(env.action_num) for _ in range(env.player_num)]
+        env.set_agents(agents)
+        _, payoffs = env.run(is_training=True)
+        self.assertEqual(len(payoffs), 3)
+        for agent in agents:
+            self.assertTrue(all(size <= 3 for size in agent.batch_sizes))
+
+    def test_rollout(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 2, 'seed': 0})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        counter = 0
+        games = 0
+        for trajectories, payoffs in env.rollout(num_transitions=50, is_training=True):
+            self.assertEqual(len(trajectories), env.player_num)
+            self.assertEqual(sum(payoffs), 0)
+            for player_ts in trajectories:
+                for ts in player_ts:
+                    self.assertEqual(len(ts), 5)
+                if player_ts:
+                    self.assertTrue(player_ts[-1][4])
+            counter += sum([len(ts) for ts in trajectories])
+            games += 1
+        self.assertGreaterEqual(counter, 50)
+        self.assertGreater(games, 2)
+
+    def test_seed(self):
+        from rlcard.utils.seeding import spawn_seeds
+        env = rlcard.make('leduc-holdem', config={'env_num': 2, 'seed': 7, 'seed_each_game': True})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        self.assertEqual(env.worker_seeds, spawn_seeds(7, 2))
+        env.run(is_training=False)
+        game_seeds = env.get_game_seeds()
+        self.assertEqual(len(set(game_seeds)), 2)
+        env.close()
+
+    def test_start_method(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 2, 'start_method': 'fork'})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        _, payoffs = env.run(is_training=False)
+        self.assertEqual(len(payoffs), 2)
+        env.close()
+        self.assertTrue(env.pool.closed)
+        for p in env.ps:
+            self.assertFalse(p.is_alive())
+
+    def test_env_pool(self):
+        config = DEFAULT_CONFIG.copy()
+        config.update({'env_num': 3, 'start_method': 'fork'})
+        pool = EnvPool('leduc-holdem', config)
+        for env_num, shared_memory in [(2, True), (3, False)]:
+            env = rlcard.make('leduc-holdem', config={'env_num': env_num, 'env_pool': pool, 'shared_memory': shared_memory})
+            env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+            _, payoffs = env.run(is_training=False)
+            self.assertEqual(len(payoffs), env_num)
+            env.close()
+            self.assertFalse(pool.closed)
+        with self.assertRaises(ValueError):
+            rlcard.make('leduc-holdem', config={'env_num': 4, 'env_pool': pool})
+        with self.assertRaises(ValueError):
+            rlcard.make('blackjack', config={'env_num': 2, 'env_pool': pool})
+        pool.close()
+        with self.assertRaises(ValueError):
+            rlcard.make('leduc-holdem', config={'env_num': 2, 'env_pool': pool})
+
 if __name__ == '__main__':
     unittest.main()
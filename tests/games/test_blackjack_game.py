@@ -62,6 +62,18 @@ class TestBlackjackGame(unittest.TestCase):
         success = game.step_back()
         self.assertEqual(success, False)
 
+    def test_snapshot_restore(self):
+        game = Game()
+        game.configure(DEFAULT_GAME_CONFIG)
+        game.init_game()
+        snapshot = game.snapshot()
+        state = game.get_state(0)
+        game.step('hit')
+        game.step('stand')
+        game.restore(snapshot)
+        self.assertEqual(game.get_state(0), state)
+        self.assertFalse(game.is_over())
+
     def test_get_state(self):
         game = Game()
         game.configure(DEFAULT_GAME_CONFIG)
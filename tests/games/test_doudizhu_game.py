@@ -1,4 +1,7 @@
+import os
 import unittest
+import tempfile
+from unittest import mock
 import numpy as np
 import functools
 
@@ -129,6 +132,45 @@ class TestDoudizhuGame(unittest.TestCase):
         #greater_player should be the same
         self.assertEqual(game.round.greater_player.player_id, 0)
 
+    def test_snapshot_restore(self):
+        game = Game()
+        state, player_id = game.init_game()
+        snapshot = game.snapshot()
+        while not game.is_over():
+            state, _ = game.step(np.random.choice(list(state['actions'])))
+        game.restore(snapshot)
+        self.assertEqual(game.round.current_player, player_id)
+        self.assertEqual(len(game.round.trace), 0)
+        self.assertIsNone(game.winner_id)
+
+    def test_compiled_tables(self):
+        from rlcard.games.doudizhu import utils
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.dict(os.environ, {'RLCARD_CACHE_DIR': cache_dir}):
+                tables = utils._load_compiled_tables()
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                self.assertEqual(utils._load_compiled_tables(), tables)
+
+                # A truncated file is compiled again
+                cache_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+                with open(cache_path, 'r+b') as f:
+                    f.truncate(10)
+                self.assertEqual(utils._load_compiled_tables(), tables)
+
+                # The temporary file is removed if the tables cannot be written
+                os.remove(cache_path)
+                with mock.patch.object(utils.pickle, 'dump', side_effect=RuntimeError):
+                    with self.assertRaises(RuntimeError):
+                        utils._load_compiled_tables()
+                self.assertEqual(os.listdir(cache_dir), [])
+        loaded = utils.load_tables()
+        self.assertEqual(tables['SPECIFIC_MAP'], loaded['SPECIFIC_MAP'])
+        self.assertEqual(tables['CARD_TYPE'], loaded['CARD_TYPE'][0])
+        self.assertEqual(loaded['ACTION_LIST'][loaded['ACTION_SPACE']['pass']], 'pass')
+        self.assertIs(utils.SPECIFIC_MAP, loaded['SPECIFIC_MAP'])
+        with self.assertRaises(AttributeError):
+            utils.NOT_A_TABLE
+
     def test_get_landlord_score(self):
         score_1 = get_landlord_score('56888TTQKKKAA222R')
         self.assertEqual(score_1, 12)
@@ -1,6 +1,6 @@
 import unittest
 
-from rlcard.games.doudizhu.utils import CARD_TYPE
+from rlcard.games.doudizhu.utils import load_tables
 from rlcard.games.doudizhu.judger import DoudizhuJudger as Judger
 
 class TestDoudizhuGame(unittest.TestCase):
@@ -144,7 +144,7 @@ class TestDoudizhuGame(unittest.TestCase):
         #     self.assertNotIn(e, playable_cards)
 
         playable_cards = list(Judger.playable_cards_from_hand('3333444455556666777788889999TTTTJJJJQQQQKKKKAAAA2222BR'))
-        all_cards_list = CARD_TYPE[1]
+        all_cards_list = load_tables()['CARD_TYPE'][1]
         for c in playable_cards:
             # if (c not in all_cards_list):
             #     print(c)
@@ -79,6 +79,25 @@ class TestGinRummyGame(unittest.TestCase):
             _, _ = game.step(action)
         self.assertEqual(game.actions[-1].action_id, score_player_1_action_id)
 
+    def test_snapshot_restore(self):
+        game = Game()
+        game.init_game()
+        game.step(np.random.choice(game.judge.get_legal_actions()))
+        snapshot = game.snapshot()
+        player_id = game.get_player_id()
+        state = game.get_state(player_id)
+        for _ in range(2):
+            while not game.is_over():
+                game.step(np.random.choice(game.judge.get_legal_actions()))
+            game.restore(snapshot)
+            self.assertEqual(game.get_player_id(), player_id)
+            self.assertEqual(game.get_state(player_id), state)
+            self.assertEqual(len(game.actions), 1)
+            self.assertEqual(len(game.round.move_sheet), 2)
+            self.assertFalse(game.is_over())
+            card = game.round.dealer.stock_pile[0]
+            self.assertIs(card, utils.get_card(utils.get_card_id(card)))
+
     def test_get_state(self):
         game = Game()
         state, _ = game.init_game()
@@ -100,6 +100,33 @@ class TestLimitholdemMethods(unittest.TestCase):
             action = np.random.choice(legal_actions)
             game.step(action)
 
+    def test_snapshot_restore(self):
+        game = Game()
+        game.init_game()
+        game.step('raise')
+        snapshot = game.snapshot()
+        player_id = game.get_player_id()
+        state = game.get_state(player_id)
+        while not game.is_over():
+            game.step(np.random.choice(game.get_legal_actions()))
+        game.restore(snapshot)
+        self.assertEqual(game.get_player_id(), player_id)
+        self.assertEqual(game.get_state(player_id), state)
+        self.assertEqual(len(game.dealer.deck), 48)
+        self.assertEqual(len(game.public_cards), 0)
+
+    def test_step_back_undo_log(self):
+        game = Game(allow_step_back=True)
+        game.init_game()
+        snapshots = []
+        while not game.is_over():
+            snapshots.append(game.snapshot())
+            game.step(np.random.choice(game.get_legal_actions()))
+        while snapshots:
+            self.assertTrue(game.step_back())
+            self.assertEqual(game.snapshot(), snapshots.pop())
+        self.assertEqual(game.step_back(), False)
+
     def test_payoffs(self):
         game = Game()
         np.random.seed(0)
@@ -68,6 +68,20 @@ class TestMahjongMethods(unittest.TestCase):
         success = game.step_back()
         self.assertEqual(success, False)
 
+    def test_snapshot_restore(self):
+        game = Game()
+        state, player_id = game.init_game()
+        snapshot = game.snapshot()
+        hand = list(game.players[player_id].hand)
+        for _ in range(20):
+            if game.is_over():
+                break
+            state, _ = game.step(np.random.choice(game.get_legal_actions(state)))
+        game.restore(snapshot)
+        self.assertEqual(game.round.current_player, player_id)
+        self.assertEqual(game.players[player_id].hand, hand)
+        self.assertEqual(len(game.dealer.table), 0)
+
     def test_player_get_player_id(self):
         player = Player(0, np.random.RandomState())
         self.assertEqual(0, player.get_player_id())
@@ -71,6 +71,33 @@ class TestNolimitholdemMethods(unittest.TestCase):
 
         self.assertEqual(Stage.RIVER, game.stage)
 
+    def test_snapshot_restore(self):
+        game = Game(allow_step_back=True)
+        game.init_game()
+        snapshot = game.snapshot()
+        player_id = game.get_player_id()
+        state = game.get_state(player_id)
+        while not game.is_over():
+            game.step(np.random.choice(game.get_legal_actions()))
+        game.restore(snapshot)
+        self.assertEqual(game.get_player_id(), player_id)
+        self.assertEqual(game.get_state(player_id), state)
+        self.assertEqual(game.stage, Stage.PREFLOP)
+        self.assertEqual(len(game.history), 0)
+        self.assertIs(game.round.dealer, game.dealer)
+
+    def test_step_back_undo_log(self):
+        game = Game(allow_step_back=True)
+        game.init_game()
+        snapshots = []
+        while not game.is_over():
+            snapshots.append(game.snapshot())
+            game.step(np.random.choice(game.get_legal_actions()))
+        while snapshots:
+            self.assertTrue(game.step_back())
+            self.assertEqual(game.snapshot(), snapshots.pop())
+        self.assertEqual(game.step_back(), False)
+
     def test_auto_step(self):
         game = Game()
 
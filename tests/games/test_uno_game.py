@@ -73,6 +73,19 @@ class TestUnoMethods(unittest.TestCase):
         success = game.step_back()
         self.assertEqual(success, False)
 
+    def test_snapshot_restore(self):
+        game = Game()
+        game.init_game()
+        snapshot = game.snapshot()
+        player_id = game.get_player_id()
+        state = game.get_state(player_id)
+        while not game.is_over():
+            game.step(np.random.choice(game.get_legal_actions()))
+        game.restore(snapshot)
+        self.assertEqual(game.get_player_id(), player_id)
+        self.assertEqual(game.get_state(player_id), state)
+        self.assertFalse(game.is_over())
+
     def test_hand2dict(self):
         hand_1 = ['y-1', 'r-8', 'b-9', 'y-reverse', 'r-skip']
         hand1_dict = hand2dict(hand_1)
@@ -81,6 +81,12 @@ class TestModel(unittest.TestCase):
         self.assertEqual(action, 'raise')
         action = agent.step({'raw_legal_actions':['raise', 'fold', 'check', 'call'], 'raw_obs':{'hand':['HQ', 'S2'], 'public_cards':[]}})
         self.assertEqual(action, 'fold')
+        action = agent.step({'raw_legal_actions':['raise', 'fold', 'check', 'call'], 'raw_obs':{'hand':['H2', 'S2'], 'public_cards':[]}})
+        self.assertEqual(action, 'raise')
+        action = agent.step({'raw_legal_actions':['raise', 'fold', 'check', 'call'], 'raw_obs':{'hand':['H9', 'SA'], 'public_cards':[]}})
+        self.assertEqual(action, 'fold')
+        action = agent.step({'raw_legal_actions':['raise', 'fold', 'check', 'call'], 'raw_obs':{'hand':['HT', 'SJ'], 'public_cards':[]}})
+        self.assertEqual(action, 'raise')
         action = agent.step({'raw_legal_actions':['raise', 'fold', 'check', 'call'], 'raw_obs':{'hand':['SA', 'HA'], 'public_cards':['CA', 'C2', 'B4']}})
         self.assertEqual(action, 'raise')
         action = agent.step({'raw_legal_actions':['raise', 'fold', 'check', 'call'], 'raw_obs':{'hand':['SA', 'HQ'], 'public_cards':['CJ', 'C2', 'B4']}})
@@ -0,0 +1,143 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from rlcard.utils.infoset_table import InfosetTable
+from rlcard.utils.checkpoint import save_table, load_table, compact_table, _read_records
+
+FIELDS = {'policy': 0.5, 'regrets': 0.0, 'legal': False}
+
+def make_table(num):
+    table = InfosetTable(2, FIELDS, capacity=4)
+    for i in range(num):
+        infoset = table.get_id(b'key%d' % i)
+        table.arrays['regrets'][infoset] = [i, -i]
+        table.arrays['legal'][infoset, i % 2] = True
+    return table
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'table.ckpt')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertTablesEqual(self, table, other):
+        self.assertEqual(table.keys, other.keys)
+        for name in FIELDS:
+            self.assertTrue(np.array_equal(table.array(name), other.array(name)))
+
+    def test_save_and_load(self):
+        table = make_table(10)
+        table.arrays['policy'][3] = [0.25, 0.75]
+        save_table(self.path, table, meta={'iteration': 7})
+        self.assertFalse(table.dirty.any())
+
+        loaded, meta = load_table(self.path, FIELDS)
+        self.assertEqual(meta, {'iteration': 7})
+        self.assertTablesEqual(loaded, table)
+        self.assertEqual(loaded.find(b'key3'), 3)
+        self.assertEqual(loaded.arrays['regrets'].dtype, np.float64)
+        self.assertEqual(loaded.arrays['legal'].dtype, bool)
+
+        # The fields are read from the file if they are not given, and the
+        # missing fields are set to their initial values
+        self.assertEqual(load_table(self.path)[0].fields, FIELDS)
+        extended = load_table(self.path, dict(FIELDS, average_policy=0.0))[0]
+        self.assertTrue(np.array_equal(extended.array('average_policy'), np.zeros((10, 2))))
+
+        save_table(self.path, InfosetTable(2, FIELDS))
+        self.assertEqual(len(load_table(self.path, FIELDS, mmap_mode='r')[0]), 0)
+
+    def test_float32(self):
+        table = make_table(3)
+        table.arrays['regrets'][0] = [1.0 / 3, 1e-10]
+        save_table(self.path, table)
+        loaded, _ = load_table(self.path, FIELDS)
+        self.assertTrue(np.array_equal(loaded.array('regrets'), table.array('regrets').astype(np.float32)))
+        self.assertFalse(np.array_equal(loaded.array('regrets'), table.array('regrets')))
+
+        save_table(self.path, table, dtype=np.float64)
+        self.assertTablesEqual(load_table(self.path, FIELDS)[0], table)
+
+    def test_incremental(self):
+        table = make_table(10)
+        save_table(self.path, table, meta={'iteration': 1})
+        full_size = os.path.getsize(self.path)
+
+        # An incremental save appends the new information sets and the
+        # changed rows only
+        table.arrays['regrets'][table.get_id(b'key2')] = [5, 5]
+        table.view('policy')[b'key4'][0] = 0.0
+        table.arrays['regrets'][table.get_id(b'new')] = [1, 1]
+        save_table(self.path, table, meta={'iteration': 2}, incremental=True)
+        records, _ = _read_records(self.path)
+        self.assertEqual([header['type'] for header, _ in records], ['full', 'delta'])
+        self.assertEqual(records[1][0]['num_keys'], 11)
+        self.assertLess(os.path.getsize(self.path) - full_size, full_size)
+
+        # Nothing changed
+        save_table(self.path, table, meta={'iteration': 3}, incremental=True)
+        loaded, meta = load_table(self.path, FIELDS)
+        self.assertEqual(meta, {'iteration': 3})
+        self.assertTablesEqual(loaded, table)
+
+        # The saves continue from a loaded table
+        loaded.arrays['regrets'][loaded.get_id(b'key0')] = [9, 9]
+        save_table(self.path, loaded, incremental=True)
+        self.assertEqual(len(_read_records(self.path)[0]), 4)
+        self.assertTablesEqual(load_table(self.path, FIELDS)[0], loaded)
+
+        # The first save to another file is full
+        other = os.path.join(self.directory, 'other.ckpt')
+        save_table(other, loaded, incremental=True)
+        self.assertEqual(len(_read_records(other)[0]), 1)
+
+    def test_truncated_record(self):
+        table = make_table(5)
+        save_table(self.path, table)
+        table.arrays['regrets'][table.get_id(b'key1')] = [3, 3]
+        save_table(self.path, table, incremental=True)
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(size - 8)
+
+        # The interrupted delta is ignored, and overwritten by the next save
+        loaded, _ = load_table(self.path, FIELDS)
+        self.assertTrue(np.array_equal(loaded.array('regrets'), make_table(5).array('regrets')))
+        table.arrays['regrets'][table.get_id(b'key1')] = [4, 4]
+        save_table(self.path, table, incremental=True)
+        self.assertTablesEqual(load_table(self.path, FIELDS)[0], table)
+
+        with open(self.path, 'wb') as f:
+            f.write(b'not a checkpoint')
+        with self.assertRaises(ValueError):
+            load_table(self.path, FIELDS)
+
+    def test_mmap_and_compact(self):
+        table = make_table(10)
+        save_table(self.path, table)
+        loaded, _ = load_table(self.path, FIELDS, mmap_mode='r')
+        self.assertIsInstance(loaded.arrays['regrets'], np.memmap)
+        self.assertEqual(loaded.arrays['regrets'].dtype, np.float32)
+        self.assertTablesEqual(loaded, table)
+
+        # A file with deltas is read into memory until it is compacted
+        table.arrays['regrets'][table.get_id(b'new')] = [1, 2]
+        save_table(self.path, table, incremental=True)
+        loaded, _ = load_table(self.path, FIELDS, mmap_mode='r')
+        self.assertNotIsInstance(loaded.arrays['regrets'], np.memmap)
+        self.assertTablesEqual(loaded, table)
+
+        compact_table(self.path, FIELDS)
+        self.assertEqual(len(_read_records(self.path)[0]), 1)
+        loaded, _ = load_table(self.path, FIELDS, mmap_mode='r')
+        self.assertIsInstance(loaded.arrays['regrets'], np.memmap)
+        self.assertTablesEqual(loaded, table)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import tempfile
+import numpy as np
+
+import rlcard
+from rlcard.agents.random_agent import RandomAgent
+from rlcard.utils.dataset import TrajectoryWriter, TrajectoryReader
+
+class TestDataset(unittest.TestCase):
+
+    def test_write_and_read(self):
+        env = rlcard.make('leduc-holdem', config={'seed': 0})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        with tempfile.TemporaryDirectory() as dataset_dir:
+            actions = []
+            with TrajectoryWriter(dataset_dir, shard_size=7) as writer:
+                for _ in range(20):
+                    trajectories, _ = env.run(is_training=True, columnar=True)
+                    writer.write(trajectories)
+                    for columns in trajectories:
+                        actions.extend(columns['action'].tolist())
+                self.assertTrue(all(shard['size'] == 7 for shard in writer.shards[:-1]))
+
+            reader = TrajectoryReader(dataset_dir, np_random=np.random.RandomState(0))
+            self.assertEqual(len(reader), len(actions))
+            batch = reader.sample(16)
+            self.assertEqual(batch['obs'].shape, (16, 36))
+            self.assertEqual(batch['legal_mask'].dtype, bool)
+            self.assertTrue(np.all(batch['legal_mask'][np.arange(16), batch['action']]))
+
+            read_actions = np.concatenate([b['action'] for b in reader.iterate(5, shuffle=False)])
+            self.assertEqual(read_actions.tolist(), actions)
+            self.assertEqual(sum(len(b['action']) for b in reader.iterate(5)), len(actions))
+
+            with self.assertRaises(ValueError):
+                TrajectoryWriter(dataset_dir)
+            with self.assertRaises(ValueError):
+                reader.get_batch([len(actions)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import itertools
+import numpy as np
+
+from rlcard.utils import equity
+from rlcard.utils.utils import init_standard_deck, init_short_deck
+from rlcard.games.limitholdem.utils import compare_hands
+from rlcard.games.shortlimitholdem.utils import ShortHand
+
+class TestEquity(unittest.TestCase):
+
+    def test_hand_strength(self):
+        result = equity.hand_strength(['SA', 'HA', 'DA', 'CA', 'S2', 'H3', 'D4'])
+        self.assertEqual(result['num_boards'], 1)
+        self.assertEqual(result['mean_category'], 8)
+        self.assertEqual(result['categories'][8], 1)
+
+        # Compare with ShortHand on all the completions of a flop
+        cards = ['DA', 'HA', 'S7', 'C8', 'D9']
+        deck = [card.get_index() for card in init_short_deck() if card.get_index() not in cards]
+        categories = []
+        for completion in itertools.combinations(deck, 2):
+            hand = ShortHand(cards + list(completion))
+            hand.evaluateHand()
+            categories.append(hand.category)
+        result = equity.hand_strength(cards, short_deck=True)
+        self.assertEqual(result['num_boards'], len(categories))
+        self.assertAlmostEqual(result['mean_category'], np.mean(categories))
+        self.assertTrue(np.allclose(result['categories'], np.bincount(categories, minlength=10) / len(categories)))
+
+    def test_equity_exact(self):
+        hole_cards = ['SA', 'HK']
+        public_cards = ['D2', 'C7', 'HT', 'SK', 'D9']
+        deck = [card.get_index() for card in init_standard_deck() if card.get_index() not in hole_cards + public_cards]
+        win = tie = 0
+        for opponent in itertools.combinations(deck, 2):
+            winners = compare_hands([hole_cards + public_cards, list(opponent) + public_cards])
+            win += winners == [1, 0]
+            tie += winners == [1, 1]
+        num = len(deck) * (len(deck) - 1) // 2
+        result = equity.equity(hole_cards, public_cards)
+        self.assertEqual(result['num_boards'], num)
+        self.assertAlmostEqual(result['win'], win / num)
+        self.assertAlmostEqual(result['tie'], tie / num)
+        self.assertAlmostEqual(result['equity'], (win + tie / 2) / num)
+        self.assertAlmostEqual(result['win'] + result['tie'] + result['lose'], 1)
+
+        # Every board and opponent hand is counted once on the turn
+        result = equity.equity(hole_cards, public_cards[:4])
+        self.assertEqual(result['num_boards'], 46 * 45 * 44 // 2)
+
+    def test_equity_samples(self):
+        result = equity.equity(['SA', 'HA'], samples=100000, seed=0)
+        self.assertEqual(result['num_boards'], 100000)
+        self.assertAlmostEqual(result['equity'], 0.852, delta=0.01)
+        self.assertEqual(result['equity'], equity.equity(['SA', 'HA'], samples=100000, seed=0)['equity'])
+        result = equity.equity(['SA', 'HA'], samples=100000, seed=0, opponents=3)
+        self.assertAlmostEqual(result['equity'], 0.64, delta=0.01)
+
+    def test_pool(self):
+        try:
+            result = equity.equity(['SA', 'HA'], ['D2', 'C7', 'HK'], workers=2)
+            expected = equity.equity(['SA', 'HA'], ['D2', 'C7', 'HK'])
+            self.assertEqual(result['equity'], expected['equity'])
+            self.assertTrue(np.array_equal(result['categories'], expected['categories']))
+            result = equity.equity(['SA', 'HA'], samples=200000, seed=0, workers=2)
+            self.assertEqual(result['equity'], equity.equity(['SA', 'HA'], samples=200000, seed=0)['equity'])
+        finally:
+            equity.close_pool()
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            equity.equity(['SA', 'SA'])
+        with self.assertRaises(ValueError):
+            equity.equity(['SA', 'HA'])
+        with self.assertRaises(ValueError):
+            equity.equity(['SA', 'HA'], ['D2', 'C7', 'HK'], opponents=2)
+        with self.assertRaises(ValueError):
+            equity.hand_strength(['SA', 'H2'], short_deck=True)
+
+if __name__ == '__main__':
+    unittest.main()
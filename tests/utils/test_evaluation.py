@@ -0,0 +1,60 @@
+import unittest
+import os
+from functools import partial
+
+from rlcard.agents.random_agent import RandomAgent
+from rlcard.utils.evaluation import parallel_tournament, normal_quantile, RunningStats
+
+def killed_agent():
+    # The worker dies without reporting an error, as if it was killed
+    os._exit(3)
+
+class TestEvaluation(unittest.TestCase):
+
+    def test_parallel_tournament(self):
+        factories = [partial(RandomAgent, action_num=4) for _ in range(2)]
+        result = parallel_tournament('leduc-holdem', factories, 250, workers=0, seed=1, chunk_size=100)
+        self.assertEqual(result['num_games'], 250)
+        self.assertAlmostEqual(sum(result['payoffs']), 0)
+        self.assertEqual(len(result['std_errors']), 2)
+
+        parallel_result = parallel_tournament('leduc-holdem', factories, 250, workers=2, seed=1, chunk_size=100)
+        self.assertEqual(parallel_result['num_games'], 250)
+        for a, b in zip(result['payoffs'], parallel_result['payoffs']):
+            self.assertAlmostEqual(a, b)
+
+    def test_parallel_tournament_duplicate(self):
+        factories = [partial(RandomAgent, action_num=4) for _ in range(2)]
+        result = parallel_tournament('leduc-holdem', factories, 20, workers=0, chunk_size=10, duplicate=True)
+        self.assertEqual(result['num_games'], 20)
+        self.assertAlmostEqual(sum(result['payoffs']), 0)
+
+    def test_early_stopping(self):
+        factories = [partial(RandomAgent, action_num=4) for _ in range(2)]
+        result = parallel_tournament('leduc-holdem', factories, 10000, workers=2, ci_width=100, chunk_size=50)
+        self.assertEqual(result['num_games'], 50)
+
+    def test_dead_worker(self):
+        factories = [killed_agent, partial(RandomAgent, action_num=4)]
+        with self.assertRaises(RuntimeError):
+            parallel_tournament('leduc-holdem', factories, 100, workers=1, chunk_size=50)
+
+    def test_normal_quantile(self):
+        self.assertAlmostEqual(normal_quantile(0.975), 1.959963984540054)
+        self.assertAlmostEqual(normal_quantile(0.5), 0)
+        self.assertAlmostEqual(normal_quantile(0.1), -1.2815515655446004)
+        with self.assertRaises(ValueError):
+            normal_quantile(1)
+
+    def test_running_stats(self):
+        stats, first, second = RunningStats(1), RunningStats(1), RunningStats(1)
+        for i, payoff in enumerate([1, 3, 2, 8, -1]):
+            stats.add([payoff])
+            (first if i < 2 else second).add([payoff])
+        first.merge(second)
+        self.assertEqual(first.n, 5)
+        self.assertAlmostEqual(first.mean[0], stats.mean[0])
+        self.assertAlmostEqual(first.m2[0], stats.m2[0])
+
+if __name__ == '__main__':
+    unittest.main()
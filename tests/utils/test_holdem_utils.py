@@ -1,6 +1,10 @@
 import unittest
+import numpy as np
 from rlcard.games.limitholdem.utils import compare_hands
 from rlcard.games.limitholdem.utils import Hand as Hand
+from rlcard.games.limitholdem.evaluator import evaluate_hand, evaluate_ids, card_to_id, get_category, STRAIGHT_FLUSH, TWO_PAIR
+from rlcard.games.shortlimitholdem.utils import compare_hands as compare_short_hands
+from rlcard.utils.utils import init_standard_deck
 ''' Combinations selected for testing compare_hands function
 Royal straight flush ['CJ', 'CT', 'CQ', 'CK', 'C9', 'C8', 'CA']
 Straight flush ['CJ', 'CT', 'CQ', 'CK', 'C9', 'C8', 'C7']
@@ -244,5 +248,47 @@ class TestHoldemUtils(unittest.TestCase):
         self.assertEqual(winner, [1, 1])
         winner = compare_hands([['C5', 'S9', 'S6', 'C2', 'CT', 'C7', 'H5'], ['S7', 'SJ', 'S6', 'C2', 'CT', 'C7', 'H5'], None, None, ['H7', 'DJ', 'S6', 'C2', 'CT', 'C7', 'H5'], None])
         self.assertEqual(winner, [0, 1, 0, 0, 1, 0])
+
+    def test_compare_hands_wheel(self):
+        # A2345 is the lowest straight
+        winner = compare_hands([['HQ', 'HT', 'C3', 'SA', 'S2', 'C5', 'H4'], ['S6', 'H7', 'C3', 'SA', 'S2', 'C5', 'H4']])
+        self.assertEqual(winner, [0, 1])
+        winner = compare_hands([['DA', 'D2', 'D3', 'D4', 'D5', 'C9', 'H9'], ['D6', 'DQ', 'C3', 'D4', 'D5', 'D2', 'D3']])
+        self.assertEqual(winner, [0, 1])
+
+    def test_compare_hands_four_of_a_kind(self):
+        # The rank of the four of a kind is compared before the kicker
+        winner = compare_hands([['CJ', 'SJ', 'HJ', 'DJ', 'CT', 'ST', 'H2'], ['CJ', 'SJ', 'HT', 'DT', 'CT', 'ST', 'HA']])
+        self.assertEqual(winner, [1, 0])
+
+    def test_evaluate_hand(self):
+        self.assertEqual(get_category(evaluate_hand(['CJ', 'CT', 'CQ', 'CK', 'CA'])), STRAIGHT_FLUSH)
+        self.assertEqual(get_category(evaluate_hand(['CJ', 'SJ', 'H9', 'D9', 'C2', 'C8'])), TWO_PAIR)
+        self.assertEqual(evaluate_hand(['CJ', 'SJ', 'H9', 'D9', 'C2', 'C8', 'C7']), evaluate_hand(['DJ', 'HJ', 'S9', 'C9', 'H2', 'D8', 'S7']))
+        self.assertGreater(evaluate_hand(['CA', 'CQ', 'CT', 'C8', 'C7', 'C4', 'C2']), evaluate_hand(['CA', 'CQ', 'CT', 'C8', 'C6', 'C4', 'C2']))
+        self.assertEqual(evaluate_ids([card_to_id(card) for card in ['SA', 'HA', 'D9', 'C9', 'S9']]), evaluate_hand(['SA', 'HA', 'D9', 'C9', 'S9']))
+        with self.assertRaises(ValueError):
+            evaluate_hand(['CJ', 'C1', 'CQ', 'CK', 'C9'])
+        with self.assertRaises(ValueError):
+            evaluate_hand(['CJ', 'CT', 'CQ', 'CK'])
+
+    def test_evaluate_hand_agrees_with_hand(self):
+        np_random = np.random.RandomState(0)
+        deck = [card.get_index() for card in init_standard_deck()]
+        for _ in range(1000):
+            cards = list(np_random.choice(deck, 7, replace=False))
+            hand = Hand(list(cards))
+            hand.evaluateHand()
+            self.assertEqual(get_category(evaluate_hand(cards)), hand.category)
+
+    def test_compare_hands_short_deck(self):
+        # A flush beats a full house and A6789 is a straight
+        hands = [['H6', 'H7', 'H9', 'HJ', 'HK', 'SA', 'DA'], ['SK', 'DK', 'CK', 'S6', 'D6', 'SA', 'DA']]
+        self.assertEqual(compare_hands([list(hand) for hand in hands]), [0, 1])
+        self.assertEqual(compare_short_hands([list(hand) for hand in hands]), [1, 0])
+        hands = [['H6', 'C7', 'D8', 'S9', 'HK', 'SA', 'DQ'], ['SK', 'DK', 'CT', 'S6', 'D7', 'SA', 'DQ']]
+        self.assertEqual(compare_hands([list(hand) for hand in hands]), [0, 1])
+        self.assertEqual(compare_short_hands([list(hand) for hand in hands]), [1, 0])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import shutil
+import tempfile
+import numpy as np
+
+from rlcard.utils.infoset_table import InfosetTable
+
+FIELDS = {'policy': 0.5, 'regrets': 0.0}
+
+class TestInfosetTable(unittest.TestCase):
+
+    def test_get_id(self):
+        table = InfosetTable(2, FIELDS, capacity=1)
+        self.assertEqual(table.get_id(b'a'), 0)
+        self.assertEqual(table.get_id(b'b'), 1)
+        self.assertEqual(table.get_id(b'a'), 0)
+        self.assertEqual(table.find(b'b'), 1)
+        self.assertEqual(table.find(b'c'), -1)
+        self.assertEqual(len(table), 2)
+        self.assertIn(b'a', table)
+
+        # The rows keep their values when the arrays grow
+        table.arrays['regrets'][1] = [1, 2]
+        for i in range(100):
+            table.get_id(str(i).encode())
+        self.assertGreaterEqual(table.capacity, 102)
+        self.assertEqual(table.array('regrets').shape, (102, 2))
+        self.assertTrue(np.array_equal(table.array('regrets')[1], [1, 2]))
+        self.assertTrue(np.array_equal(table.array('policy')[101], [0.5, 0.5]))
+
+        with self.assertRaises(ValueError):
+            InfosetTable(2, FIELDS, capacity=0)
+
+    def test_view(self):
+        table = InfosetTable(2, FIELDS)
+        regrets = table.view('regrets')
+        self.assertNotIn(b'a', regrets)
+        with self.assertRaises(KeyError):
+            regrets[b'a']
+        regrets[b'a'] = np.array([1.0, -1.0])
+        regrets[b'a'][0] += 1
+        self.assertTrue(np.array_equal(table.array('regrets')[0], [2, -1]))
+        self.assertTrue(np.array_equal(table.view('policy')[b'a'], [0.5, 0.5]))
+        self.assertEqual(list(regrets), [b'a'])
+        self.assertEqual(len(regrets), 1)
+        with self.assertRaises(TypeError):
+            del regrets[b'a']
+
+    def test_save_and_load(self):
+        table = InfosetTable(3, FIELDS)
+        for i in range(10):
+            table.arrays['regrets'][table.get_id(b'key' * i)] = i
+        directory = tempfile.mkdtemp()
+        try:
+            table.save(directory)
+            for mmap_mode in (None, 'r'):
+                loaded = InfosetTable.load(directory, FIELDS, mmap_mode=mmap_mode)
+                self.assertEqual(loaded.keys, table.keys)
+                self.assertEqual(loaded.find(b'key' * 3), 3)
+                self.assertTrue(np.array_equal(loaded.array('regrets'), table.array('regrets')))
+            self.assertIsInstance(loaded.arrays['regrets'], np.memmap)
+
+            # A memory-mapped table is copied to memory when it grows
+            loaded.get_id(b'new')
+            self.assertNotIsInstance(loaded.arrays['regrets'], np.memmap)
+            self.assertTrue(np.array_equal(loaded.array('regrets')[:10], table.array('regrets')))
+
+            InfosetTable(3, FIELDS).save(directory)
+            self.assertEqual(len(InfosetTable.load(directory, FIELDS, mmap_mode='r')), 0)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_from_dicts(self):
+        dicts = {'policy': {b'a': np.array([0.2, 0.8]), b'b': np.array([1.0, 0.0])},
+                 'regrets': {b'b': np.array([3.0, 4.0])}}
+        table = InfosetTable.from_dicts(2, FIELDS, dicts)
+        self.assertEqual(len(table), 2)
+        self.assertTrue(np.array_equal(table.view('regrets')[b'a'], [0, 0]))
+        self.assertTrue(np.array_equal(table.view('regrets')[b'b'], [3, 4]))
+        self.assertTrue(np.array_equal(table.view('policy')[b'a'], [0.2, 0.8]))
+
+if __name__ == '__main__':
+    unittest.main()
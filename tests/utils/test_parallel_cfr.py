@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+
+from rlcard.agents import CFRPlusAgent, MCCFRAgent
+from rlcard.utils.parallel_cfr import ParallelCFRTrainer
+
+def external_sampling_agent(env):
+    return MCCFRAgent(env, sampling='external')
+
+def train(agent_factory, workers, iterations=10):
+    trainer = ParallelCFRTrainer('leduc-holdem', agent_factory, workers=workers, seed=1, sync_every=2)
+    try:
+        for _ in range(iterations):
+            trainer.train()
+    finally:
+        trainer.close()
+    return trainer
+
+class TestParallelCFR(unittest.TestCase):
+
+    def test_train(self):
+        local = train(external_sampling_agent, 0)
+        single = train(external_sampling_agent, 1)
+        self.assertEqual(local.agent.iteration, 10)
+        self.assertGreater(len(local.table), 0)
+
+        # One worker gives the same result as the current process
+        self.assertEqual(local.table.keys, single.table.keys)
+        for name in ('policy', 'average_policy', 'regrets', 'legal'):
+            self.assertTrue(np.array_equal(local.table.array(name), single.table.array(name)))
+
+        # The result only depends on the seed and the number of workers
+        first = train(external_sampling_agent, 2)
+        second = train(external_sampling_agent, 2)
+        self.assertEqual(first.table.keys, second.table.keys)
+        self.assertTrue(np.array_equal(first.table.array('regrets'), second.table.array('regrets')))
+        visited = first.table.array('legal').any(axis=1)
+        self.assertTrue(np.allclose(first.table.array('policy')[visited].sum(axis=1), 1))
+
+    def test_cfrplus(self):
+        trainer = train(CFRPlusAgent, 0, 5)
+        self.assertEqual(trainer.agent.iteration, 5)
+        visited = trainer.table.array('legal').any(axis=1)
+        self.assertTrue(np.allclose(trainer.table.array('policy')[visited].sum(axis=1), 1))
+        state = {'obs': np.array([1., 1., 0., 0., 0., 0.]), 'legal_actions': [0, 2]}
+        action, _ = trainer.agent.eval_step(state)
+        self.assertIn(action, [0, 2])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ParallelCFRTrainer('leduc-holdem', external_sampling_agent, workers=-1)
+        with self.assertRaises(ValueError):
+            ParallelCFRTrainer('leduc-holdem', external_sampling_agent, workers=0, sync_every=0)
+
+if __name__ == '__main__':
+    unittest.main()
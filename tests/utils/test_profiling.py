@@ -0,0 +1,59 @@
+import unittest
+
+import rlcard
+from rlcard.agents.random_agent import RandomAgent
+from rlcard.utils.profiling import Profiler, merge_stats
+
+class TestProfiling(unittest.TestCase):
+
+    def test_profiler(self):
+        samples = []
+        profiler = Profiler(callback=lambda phase, elapsed: samples.append(phase))
+        add = profiler.wrap('add', lambda a, b: a + b)
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(profiler.get_stats()['add']['count'], 1)
+        self.assertEqual(samples, ['add'])
+        profiler.reset_stats()
+        self.assertEqual(profiler.get_stats()['add'], {'count': 0, 'time': 0.0})
+        self.assertEqual(merge_stats([{'add': {'count': 1, 'time': 1.0}}] * 2), {'add': {'count': 2, 'time': 2.0}})
+        with self.assertRaises(ValueError):
+            Profiler(cprofile_every=0)
+
+    def test_env_stats(self):
+        env = rlcard.make('leduc-holdem', config={'profile': {'cprofile_every': 2}})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        for _ in range(5):
+            env.run(is_training=False)
+        stats = env.get_stats()
+        self.assertEqual(stats['run']['count'], 5)
+        self.assertEqual(stats['reset']['count'], 5)
+        self.assertEqual(stats['reorganize']['count'], 5)
+        self.assertEqual(stats['game_step']['count'], stats['agent_0']['count'] + stats['agent_1']['count'])
+        self.assertGreater(stats['extract_state']['time'], 0)
+        self.assertIsNotNone(env.profiler.get_cprofile_stats())
+
+        env.disable_profiling()
+        self.assertNotIn('step', env.game.__dict__)
+        self.assertNotIn('_extract_state', env.__dict__)
+        with self.assertRaises(ValueError):
+            env.get_stats()
+        env.run(is_training=False)
+
+    def test_vec_env_stats(self):
+        env = rlcard.make('leduc-holdem', config={'env_num': 2, 'profile': True})
+        env.set_agents([RandomAgent(env.action_num) for _ in range(env.player_num)])
+        env.run(is_training=False)
+        stats = env.get_stats()
+        self.assertEqual(stats['reset']['count'], 2)
+        self.assertEqual(stats['game_step']['count'], env.timestep)
+        self.assertEqual(len(env.get_worker_stats()), 2)
+        env.reset_stats()
+        self.assertEqual(env.get_stats()['reset']['count'], 0)
+        env.close()
+
+        env = rlcard.make('leduc-holdem', config={'env_num': 2, 'batched': True, 'profile': True})
+        env.reset()
+        self.assertEqual(env.get_stats()['reset']['count'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+
+from rlcard.utils import regret_matching as rm
+
+class TestRegretMatching(unittest.TestCase):
+
+    def test_regret_matching(self):
+        regrets = np.array([[1.0, 3.0, -2.0, 0.0],
+                            [-1.0, -1.0, 0.0, 0.0],
+                            [-1.0, -1.0, 0.0, 0.0],
+                            [2.0, 0.0, 0.0, 5.0]])
+        legal = np.array([[True, True, True, False],
+                          [True, False, True, False],
+                          [False, False, False, False],
+                          [True, True, True, False]])
+        policies = rm.regret_matching(regrets, legal)
+        self.assertTrue(np.allclose(policies, [[0.25, 0.75, 0, 0],
+                                               [0.5, 0, 0.5, 0],
+                                               [0.25, 0.25, 0.25, 0.25],
+                                               [1, 0, 0, 0]]))
+        policies = rm.regret_matching(regrets)
+        self.assertTrue(np.allclose(policies[1], 0.25))
+        self.assertTrue(np.allclose(policies[3], [2 / 7, 0, 0, 5 / 7]))
+
+        # The chunks give the same result as one pass
+        regrets = np.random.RandomState(0).randn(rm.CHUNK_SIZE + 10, 3)
+        out = np.zeros(regrets.shape)
+        rm.regret_matching(regrets, out=out)
+        self.assertTrue(np.allclose(out.sum(axis=1), 1))
+        self.assertTrue(np.array_equal(out[-10:], rm.regret_matching(regrets[-10:])))
+
+    def test_discount(self):
+        self.assertEqual(rm.discount_factor(3, np.inf), 1)
+        self.assertEqual(rm.discount_factor(3, -np.inf), 0)
+        self.assertEqual(rm.discount_factor(3, 1), 0.75)
+        self.assertEqual(rm.discount_factor(3, 0), 0.5)
+
+        regrets = np.array([[4.0, -4.0], [0.0, 2.0]])
+        rm.discount_regrets(regrets, 3, 1, 0)
+        self.assertTrue(np.array_equal(regrets, [[3, -2], [0, 1.5]]))
+        rm.discount_regrets(regrets, 3, np.inf, -np.inf)
+        self.assertTrue(np.array_equal(regrets, [[3, 0], [0, 1.5]]))
+
+        average_policy = np.ones((2, 2))
+        rm.discount_average_policy(average_policy, 1, 2)
+        self.assertTrue(np.array_equal(average_policy, np.full((2, 2), 0.25)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+import numpy as np
+
+from rlcard.utils import seeding
+
+class TestSeeding(unittest.TestCase):
+
+    def test_derive_seed(self):
+        self.assertEqual(seeding.derive_seed(1, 2, 3), seeding.derive_seed(1, 2, 3))
+        self.assertNotEqual(seeding.derive_seed(1, 2), seeding.derive_seed(1, 3))
+        self.assertNotEqual(seeding.derive_seed(1, 2), seeding.derive_seed(2, 2))
+        seeds = seeding.spawn_seeds(5, 100)
+        self.assertEqual(len(set(seeds)), 100)
+        self.assertEqual(seeds[7], seeding.derive_seed(5, 7))
+        self.assertTrue(all(0 <= seed < 2**64 for seed in seeds))
+
+    def test_reseed(self):
+        rng, _ = seeding.np_random(42)
+        rng.randint(100, size=10)
+        seeding.reseed(rng, 42)
+        self.assertTrue(np.array_equal(rng.randint(100, size=10), seeding.np_random(42)[0].randint(100, size=10)))
+
+if __name__ == '__main__':
+    unittest.main()
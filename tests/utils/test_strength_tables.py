@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+
+from rlcard.utils import strength_tables
+from rlcard.utils.equity import hand_strength, equity
+
+class TestStrengthTables(unittest.TestCase):
+
+    def test_preflop_class(self):
+        self.assertEqual(strength_tables.preflop_class(['SA', 'SK']), 'AKs')
+        self.assertEqual(strength_tables.preflop_class(['HK', 'SA']), 'AKo')
+        self.assertEqual(strength_tables.preflop_class(['DT', 'CT']), 'TT')
+        self.assertEqual(strength_tables.preflop_class(['D6', 'C7'], short_deck=True), '76o')
+        self.assertEqual(strength_tables.preflop_index(['SA', 'SK']), (12, 11))
+        self.assertEqual(strength_tables.preflop_index(['SA', 'HK']), (11, 12))
+        self.assertEqual(strength_tables.preflop_index(['SA', 'SK'], short_deck=True), (8, 7))
+        with self.assertRaises(ValueError):
+            strength_tables.preflop_index(['SA', 'S2'], short_deck=True)
+
+    def test_preflop_weights(self):
+        self.assertEqual(strength_tables.preflop_weights().sum(), 52 * 51 // 2)
+        self.assertEqual(strength_tables.preflop_weights(short_deck=True).sum(), 36 * 35 // 2)
+
+    def test_preflop_strength(self):
+        for short_deck in (False, True):
+            tables = strength_tables.get_preflop_tables(short_deck)
+            size = 13 if not short_deck else 9
+            self.assertEqual(tables['mean_category'].shape, (size, size))
+            self.assertEqual(tables['equity'].shape, (size, size))
+            self.assertAlmostEqual(strength_tables.preflop_average('equity', short_deck), 0.5, places=3)
+
+        result = strength_tables.preflop_strength(['SA', 'HA'])
+        self.assertAlmostEqual(result['equity'], 0.852, delta=0.005)
+        self.assertAlmostEqual(result['mean_category'], hand_strength(['SA', 'HA'])['mean_category'], places=5)
+        result = strength_tables.preflop_strength(['D9', 'D8'], short_deck=True)
+        self.assertAlmostEqual(result['mean_category'], hand_strength(['S9', 'S8'], short_deck=True)['mean_category'], places=5)
+        self.assertAlmostEqual(result['equity'], equity(['H9', 'H8'], short_deck=True, samples=100000, seed=0)['equity'], delta=0.01)
+        self.assertEqual(strength_tables.preflop_percentile('equity', 0), 0)
+        self.assertEqual(strength_tables.preflop_percentile('equity', 1), 1)
+        aces = strength_tables.preflop_strength(['SA', 'HA'], short_deck=True)['equity']
+        self.assertGreater(strength_tables.preflop_percentile('equity', aces, short_deck=True), 0.9)
+
+    def test_build_preflop_tables(self):
+        tables = strength_tables.build_preflop_tables(short_deck=True, samples=2000, seed=0)
+        shipped = strength_tables.get_preflop_tables(short_deck=True)
+        self.assertTrue(np.allclose(tables['mean_category'], shipped['mean_category']))
+        self.assertLess(np.abs(tables['equity'] - shipped['equity']).max(), 0.05)
+
+    def test_flop(self):
+        key = strength_tables.flop_key(['SA', 'HK'], ['D2', 'D7', 'CT'])
+        self.assertEqual(key, strength_tables.flop_key(['HA', 'SK'], ['C7', 'C2', 'DT']))
+        self.assertNotEqual(key, strength_tables.flop_key(['SA', 'SK'], ['D2', 'D7', 'CT']))
+
+        mean_category = hand_strength(['SA', 'HK', 'D2', 'D7', 'CT'])['mean_category']
+        table = {'keys': np.array([key - 1, key]), 'mean_category': np.array([0, mean_category])}
+        self.assertAlmostEqual(strength_tables.flop_strength(['CA', 'DK'], ['H2', 'H7', 'ST'], table), mean_category, places=5)
+        with self.assertRaises(ValueError):
+            strength_tables.flop_strength(['SA', 'SK'], ['D2', 'D7', 'CT'], table)
+
+if __name__ == '__main__':
+    unittest.main()
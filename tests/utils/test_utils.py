@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from rlcard.utils.utils import get_random_cards, init_54_deck, init_standard_deck, is_in_cards, is_pair, is_single, rank2int, take_out_cards, print_card, elegent_form, init_players, get_upstream_player_id, get_downstream_player_id, reorganize, set_global_seed, get_cards_from_ranks,tournament
+from rlcard.utils.utils import get_random_cards, init_54_deck, init_standard_deck, is_in_cards, is_pair, is_single, rank2int, take_out_cards, print_card, elegent_form, init_players, get_upstream_player_id, get_downstream_player_id, reorganize, reorganize_columns, concatenate_columns, set_global_seed, get_cards_from_ranks,tournament
 import rlcard
 from rlcard.agents.random_agent import RandomAgent
 
@@ -105,6 +105,20 @@ class TestUtils(unittest.TestCase):
         trajectories = reorganize([[[1,2],1,[4,5]]], [1])
         self.assertEqual(np.array(trajectories).shape, (1, 1, 5))
 
+    def test_reorganize_columns(self):
+        states = [{'obs': np.array([i, i]), 'legal_actions': [i]} for i in range(3)]
+        trajectories = reorganize_columns([[states[0], 1, states[1], 0, states[2]], [states[2]]], [1, -1], 3)
+        columns = trajectories[0]
+        self.assertEqual(columns['obs'].shape, (2, 2))
+        self.assertEqual(columns['next_obs'][1].tolist(), [2, 2])
+        self.assertEqual(columns['action'].tolist(), [1, 0])
+        self.assertEqual(columns['reward'].tolist(), [0, 1])
+        self.assertEqual(columns['done'].tolist(), [False, True])
+        self.assertEqual(columns['legal_mask'].tolist(), [[True, False, False], [False, True, False]])
+        self.assertEqual(columns['next_legal_mask'][1].tolist(), [False, False, True])
+        self.assertEqual(trajectories[1]['obs'].shape, (0, 2))
+        self.assertEqual(concatenate_columns([columns, columns])['action'].tolist(), [1, 0, 1, 0])
+
     def test_set_global_seed(self):
         set_global_seed(0)
         self.assertEqual(np.random.get_state()[1][0], 0)
@@ -115,6 +129,31 @@ class TestUtils(unittest.TestCase):
         payoffs = tournament(env,1000)
         self.assertEqual(len(payoffs), 2)
 
+    def test_tournament_duplicate(self):
+        from rlcard.models.leducholdem_rule_models import LeducHoldemRuleAgentV1
+        env = rlcard.make('leduc-holdem', config={'seed': 0})
+        # The same deterministic agent in both seats: every deal is a draw
+        env.set_agents([LeducHoldemRuleAgentV1(), LeducHoldemRuleAgentV1()])
+        payoffs = tournament(env, 50, duplicate=True)
+        self.assertEqual(payoffs, [0.0, 0.0])
+
+        agents = [RandomAgent(env.action_num), LeducHoldemRuleAgentV1()]
+        env.set_agents(agents)
+        payoffs = tournament(env, 50, duplicate=True)
+        self.assertAlmostEqual(sum(payoffs), 0)
+        self.assertIs(env.agents[0], agents[0])
+
+        # The seeds of the games that follow are not changed
+        env = rlcard.make('leduc-holdem', config={'seed': 7, 'seed_each_game': True})
+        other_env = rlcard.make('leduc-holdem', config={'seed': 7, 'seed_each_game': True})
+        env.set_agents([LeducHoldemRuleAgentV1(), LeducHoldemRuleAgentV1()])
+        tournament(env, 3, duplicate=True)
+        self.assertEqual((env.seed, env.game_index), (7, 0))
+        state, _ = env.reset()
+        other_state, _ = other_env.reset()
+        self.assertEqual(env.game_seed, other_env.game_seed)
+        self.assertTrue(np.array_equal(state['obs'], other_state['obs']))
+
 
 
 if __name__ == '__main__':